@@ -11,13 +11,17 @@ from alembic import context
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 # Import your models and database base
+from app.config import settings
 from app.database import Base
-from app.models import User, Product, DemandForecast, PricingOptimization
+from app.models import User, Product, DemandForecast, PricingOptimization, PriceHistory, CategoryElasticity, PricingDirtyProduct, Job, PricingFactorVersion
 
 # this is the Alembic Config object, which provides
 # access to the values within the .ini file in use.
 config = context.config
 
+# Use the same (environment-driven) database URL as the application
+config.set_main_option("sqlalchemy.url", settings.DATABASE_URL.replace("%", "%%"))
+
 # Interpret the config file for Python logging.
 # This line sets up loggers basically.
 if config.config_file_name is not None:
@@ -0,0 +1,33 @@
+"""add demand forecast lookup index
+
+Revision ID: 3f9a1c2d7b10
+Revises: 
+Create Date: 2026-10-16 09:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3f9a1c2d7b10'
+down_revision: Union[str, Sequence[str], None] = None
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(
+        'ix_demand_forecasts_product_period_date',
+        'demand_forecasts',
+        ['product_id', 'forecast_period', 'forecast_date'],
+        unique=False
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_demand_forecasts_product_period_date', table_name='demand_forecasts')
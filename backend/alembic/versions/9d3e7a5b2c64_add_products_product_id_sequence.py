@@ -0,0 +1,33 @@
+"""add products product_id sequence
+
+Revision ID: 9d3e7a5b2c64
+Revises: 5e1b9f0c6d48
+Create Date: 2026-10-16 12:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '9d3e7a5b2c64'
+down_revision: Union[str, Sequence[str], None] = '5e1b9f0c6d48'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.execute(sa.schema.CreateSequence(sa.Sequence('products_product_id_seq')))
+    # Continue after the highest existing product_id
+    op.execute(
+        "SELECT setval('products_product_id_seq', "
+        "COALESCE((SELECT max(product_id) FROM products), 0) + 1, false)"
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute(sa.schema.DropSequence(sa.Sequence('products_product_id_seq')))
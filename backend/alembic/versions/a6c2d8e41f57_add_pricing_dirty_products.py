@@ -0,0 +1,44 @@
+"""add pricing dirty tracking for incremental re-optimization
+
+Revision ID: a6c2d8e41f57
+Revises: e4a8c1f93b72
+Create Date: 2026-10-16 14:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+from app.models.pricing_dirty import PRICING_DIRTY_FUNCTION_SQL, PRICING_DIRTY_TRIGGERS_SQL
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a6c2d8e41f57'
+down_revision: Union[str, Sequence[str], None] = 'e4a8c1f93b72'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        'pricing_dirty_products',
+        sa.Column('product_id', postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column('marked_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+        sa.ForeignKeyConstraint(['product_id'], ['products.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('product_id')
+    )
+    op.create_index('ix_pricing_dirty_products_marked_at', 'pricing_dirty_products', ['marked_at'], unique=False)
+    op.execute(PRICING_DIRTY_FUNCTION_SQL)
+    op.execute(PRICING_DIRTY_TRIGGERS_SQL)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute("DROP TRIGGER IF EXISTS products_pricing_dirty_update ON products")
+    op.execute("DROP TRIGGER IF EXISTS products_pricing_dirty_insert ON products")
+    op.execute("DROP FUNCTION IF EXISTS mark_pricing_dirty()")
+    op.drop_index('ix_pricing_dirty_products_marked_at', table_name='pricing_dirty_products')
+    op.drop_table('pricing_dirty_products')
@@ -0,0 +1,46 @@
+"""add versioned pricing factor tables
+
+Revision ID: c9d4f1a7b306
+Revises: b3f7e9a2c815
+Create Date: 2026-10-16 16:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c9d4f1a7b306'
+down_revision: Union[str, Sequence[str], None] = 'b3f7e9a2c815'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # No seed row: the engines use the built-in tables (version 0) until a version is activated
+    op.create_table(
+        'pricing_factor_versions',
+        sa.Column('version', sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column('factors', sa.JSON(), nullable=False),
+        sa.Column('note', sa.String(length=255), nullable=True),
+        sa.Column('is_active', sa.Boolean(), nullable=False),
+        sa.Column('created_by', postgresql.UUID(as_uuid=True), nullable=True),
+        sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+        sa.Column('activated_at', sa.DateTime(timezone=True), nullable=True),
+        sa.ForeignKeyConstraint(['created_by'], ['users.id'], ondelete='SET NULL'),
+        sa.PrimaryKeyConstraint('version')
+    )
+    op.create_index(
+        'uq_pricing_factor_versions_active', 'pricing_factor_versions', ['is_active'],
+        unique=True, postgresql_where=sa.text('is_active')
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('uq_pricing_factor_versions_active', table_name='pricing_factor_versions')
+    op.drop_table('pricing_factor_versions')
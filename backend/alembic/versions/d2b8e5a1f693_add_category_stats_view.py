@@ -0,0 +1,29 @@
+"""add category_stats materialized view
+
+Revision ID: d2b8e5a1f693
+Revises: c9d4f1a7b306
+Create Date: 2026-10-16 17:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+from app.models.category_stats import CATEGORY_STATS_VIEW_SQL, CATEGORY_STATS_INDEX_SQL, DROP_CATEGORY_STATS_SQL
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd2b8e5a1f693'
+down_revision: Union[str, Sequence[str], None] = 'c9d4f1a7b306'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.execute(CATEGORY_STATS_VIEW_SQL)
+    op.execute(CATEGORY_STATS_INDEX_SQL)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute(DROP_CATEGORY_STATS_SQL)
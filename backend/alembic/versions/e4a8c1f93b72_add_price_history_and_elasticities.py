@@ -0,0 +1,65 @@
+"""add price history, triggers and fitted elasticities
+
+Revision ID: e4a8c1f93b72
+Revises: 9d3e7a5b2c64
+Create Date: 2026-10-16 13:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+from app.models.price_history import PRICE_HISTORY_FUNCTION_SQL, PRICE_HISTORY_TRIGGERS_SQL
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e4a8c1f93b72'
+down_revision: Union[str, Sequence[str], None] = '9d3e7a5b2c64'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('products', sa.Column('price_elasticity', sa.Numeric(precision=6, scale=3), nullable=True))
+    op.create_table(
+        'price_history',
+        sa.Column('id', sa.BigInteger(), autoincrement=True, nullable=False),
+        sa.Column('product_id', postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column('selling_price', sa.Numeric(precision=10, scale=2), nullable=False),
+        sa.Column('units_sold', sa.Integer(), nullable=True),
+        sa.Column('recorded_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+        sa.ForeignKeyConstraint(['product_id'], ['products.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('ix_price_history_product_recorded', 'price_history', ['product_id', 'recorded_at'], unique=False)
+    op.create_table(
+        'category_elasticities',
+        sa.Column('category', sa.String(length=100), nullable=False),
+        sa.Column('elasticity', sa.Numeric(precision=6, scale=3), nullable=False),
+        sa.Column('prior_elasticity', sa.Numeric(precision=6, scale=3), nullable=False),
+        sa.Column('products_fitted', sa.Integer(), nullable=False),
+        sa.Column('observations', sa.Integer(), nullable=False),
+        sa.Column('fitted_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=True),
+        sa.PrimaryKeyConstraint('category')
+    )
+    # Seed the history with the current prices, then record every change
+    op.execute(
+        "INSERT INTO price_history (product_id, selling_price, units_sold) "
+        "SELECT id, selling_price, units_sold FROM products"
+    )
+    op.execute(PRICE_HISTORY_FUNCTION_SQL)
+    op.execute(PRICE_HISTORY_TRIGGERS_SQL)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute("DROP TRIGGER IF EXISTS products_price_history_update ON products")
+    op.execute("DROP TRIGGER IF EXISTS products_price_history_insert ON products")
+    op.execute("DROP FUNCTION IF EXISTS record_price_history()")
+    op.drop_table('category_elasticities')
+    op.drop_index('ix_price_history_product_recorded', table_name='price_history')
+    op.drop_table('price_history')
+    op.drop_column('products', 'price_elasticity')
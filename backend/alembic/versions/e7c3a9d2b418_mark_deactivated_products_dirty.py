@@ -0,0 +1,34 @@
+"""mark deactivated products dirty so the summary view is refreshed
+
+Revision ID: e7c3a9d2b418
+Revises: d2b8e5a1f693
+Create Date: 2026-10-16 18:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+from app.models.pricing_dirty import PRICING_DIRTY_FUNCTION_SQL
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e7c3a9d2b418'
+down_revision: Union[str, Sequence[str], None] = 'd2b8e5a1f693'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Previous trigger function: only reactivations were marked
+PREVIOUS_FUNCTION_SQL = PRICING_DIRTY_FUNCTION_SQL.replace(
+    "OR n.is_active IS DISTINCT FROM o.is_active",
+    "OR (n.is_active AND NOT o.is_active)"
+)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.execute(PRICING_DIRTY_FUNCTION_SQL)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute(PREVIOUS_FUNCTION_SQL)
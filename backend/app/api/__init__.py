@@ -1,4 +1,7 @@
 from .auth import router as auth_router
 from .products import router as products_router
+from .pricing import router as pricing_router
+from .forecasts import router as forecasts_router
+from .jobs import router as jobs_router
 
-__all__ = ["auth_router", "products_router"]
+__all__ = ["auth_router", "products_router", "pricing_router", "forecasts_router", "jobs_router"]
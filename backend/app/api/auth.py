@@ -1,21 +1,21 @@
 from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
-from app.database import get_db
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.database import get_async_db
 from app.schemas.user import UserCreate, UserLogin, UserResponse, Token
-from app.services.auth_service import AuthService
+from app.services.async_auth_service import AsyncAuthService
 from app.dependencies import get_current_active_user
-from app.models.user import User
+from app.schemas.user import CurrentUser
 
 router = APIRouter(prefix="/auth", tags=["Authentication"])
 
 @router.post("/register", response_model=UserResponse, status_code=status.HTTP_201_CREATED)
-def register_user(
+async def register_user(
     user_data: UserCreate,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Register a new user"""
     try:
-        user = AuthService.create_user(db, user_data)
+        user = await AsyncAuthService.create_user(db, user_data)
         return user
     except HTTPException:
         raise
@@ -26,13 +26,13 @@ def register_user(
         )
 
 @router.post("/login", response_model=Token)
-def login_user(
+async def login_user(
     login_data: UserLogin,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Login user and return JWT token"""
     try:
-        token = AuthService.login_user(db, login_data)
+        token = await AsyncAuthService.login_user(db, login_data)
         return token
     except HTTPException:
         raise
@@ -43,21 +43,21 @@ def login_user(
         )
 
 @router.get("/me", response_model=UserResponse)
-def get_current_user_info(
-    current_user: User = Depends(get_current_active_user)
+async def get_current_user_info(
+    current_user: CurrentUser = Depends(get_current_active_user)
 ):
     """Get current user information"""
     return current_user
 
 @router.post("/logout")
-def logout_user(
-    current_user: User = Depends(get_current_active_user)
+async def logout_user(
+    current_user: CurrentUser = Depends(get_current_active_user)
 ):
     """Logout user (client should remove token)"""
     return {"message": "Successfully logged out"}
 
 # Health check endpoint
 @router.get("/health")
-def auth_health_check():
+async def auth_health_check():
     """Authentication service health check"""
     return {"status": "healthy", "service": "authentication"}
@@ -0,0 +1,42 @@
+from fastapi import APIRouter, Depends, HTTPException, status, Query
+from sqlalchemy.orm import Session
+from typing import List
+import uuid
+from app.database import get_db
+from app.schemas.forecast import ForecastRunRequest, ForecastRunResponse, ProductForecastResponse
+from app.services.forecast_service import ForecastService
+from app.dependencies import get_current_active_user
+from app.schemas.user import CurrentUser
+
+router = APIRouter(prefix="/forecasts", tags=["Demand Forecasts"])
+
+@router.post("/run", response_model=ForecastRunResponse)
+def run_forecasts(
+    request: ForecastRunRequest = ForecastRunRequest(),
+    db: Session = Depends(get_db),
+    current_user: CurrentUser = Depends(get_current_active_user)
+):
+    """Recompute and store yearly demand forecasts for the catalog"""
+    return ForecastService.run_batch_forecast(db, request)
+
+@router.get("/", response_model=List[ProductForecastResponse])
+def get_forecasts(
+    product_ids: List[uuid.UUID] = Query(..., description="Product UUIDs"),
+    db: Session = Depends(get_db)
+):
+    """Get stored forecast series for multiple products"""
+    return ForecastService.get_product_forecasts(db, product_ids)
+
+@router.get("/{product_id}", response_model=ProductForecastResponse)
+def get_product_forecast(
+    product_id: uuid.UUID,
+    db: Session = Depends(get_db)
+):
+    """Get the stored forecast series for a product"""
+    forecast = ForecastService.get_product_forecast(db, product_id)
+    if not forecast:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="No forecasts found for product"
+        )
+    return forecast
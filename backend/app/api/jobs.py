@@ -0,0 +1,114 @@
+import os
+import shutil
+import uuid
+from fastapi import APIRouter, Depends, HTTPException, status, Query, UploadFile, File, Form
+from fastapi.responses import FileResponse
+from sqlalchemy.orm import Session
+from typing import List, Optional
+from app.config import settings
+from app.database import get_db
+from app.models.job import JOB_SUCCEEDED
+from app.schemas.job import JobCreateRequest, JobResponse
+from app.services.job_service import JobService, job_file_path
+from app.services.export_service import EXPORT_FORMATS
+from app.dependencies import get_current_active_user
+from app.schemas.user import CurrentUser
+
+router = APIRouter(prefix="/jobs", tags=["Jobs"])
+
+def _get_job_or_404(db: Session, job_id: str):
+    job = JobService.get_job(db, job_id)
+    if not job:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Job not found"
+        )
+    return job
+
+@router.post("/", response_model=JobResponse, status_code=status.HTTP_202_ACCEPTED)
+def create_job(
+    request: JobCreateRequest,
+    db: Session = Depends(get_db),
+    current_user: CurrentUser = Depends(get_current_active_user)
+):
+    """Queue a pricing, forecast, elasticity, re-optimization, import or export run"""
+    return JobService.enqueue(db, request.job_type, request.params, current_user)
+
+@router.post("/import", response_model=JobResponse, status_code=status.HTTP_202_ACCEPTED)
+def create_import_job(
+    file: UploadFile = File(..., description="Products CSV"),
+    chunk_size: int = Form(50000),
+    incremental: bool = Form(False),
+    db: Session = Depends(get_db),
+    current_user: CurrentUser = Depends(get_current_active_user)
+):
+    """Upload a products CSV and queue its import"""
+    os.makedirs(settings.JOB_FILES_DIR, exist_ok=True)
+    file_name = f"{uuid.uuid4()}.csv"
+    with open(job_file_path(file_name), "wb") as out:
+        shutil.copyfileobj(file.file, out, length=1 << 20)
+
+    params = {"file_name": file_name, "chunk_size": chunk_size, "incremental": incremental}
+    try:
+        return JobService.enqueue(db, "import", params, current_user)
+    except Exception:
+        # Rejected params (or a failed insert): nothing will ever import the upload
+        os.remove(job_file_path(file_name))
+        raise
+
+@router.get("/", response_model=List[JobResponse])
+def list_jobs(
+    job_status: Optional[str] = Query(None, alias="status", description="Filter by status"),
+    job_type: Optional[str] = Query(None, description="Filter by job type"),
+    limit: int = Query(20, ge=1, le=100, description="Most recent jobs to return"),
+    db: Session = Depends(get_db),
+    current_user: CurrentUser = Depends(get_current_active_user)
+):
+    """List recent jobs, newest first"""
+    return JobService.list_jobs(db, job_status, job_type, limit)
+
+@router.get("/{job_id}", response_model=JobResponse)
+def get_job(
+    job_id: str,
+    db: Session = Depends(get_db),
+    current_user: CurrentUser = Depends(get_current_active_user)
+):
+    """Job status, progress and (once finished) its result"""
+    return _get_job_or_404(db, job_id)
+
+@router.post("/{job_id}/cancel", response_model=JobResponse)
+def cancel_job(
+    job_id: str,
+    db: Session = Depends(get_db),
+    current_user: CurrentUser = Depends(get_current_active_user)
+):
+    """Cancel a queued job, or ask a running job to stop at its next checkpoint"""
+    return JobService.cancel(db, _get_job_or_404(db, job_id))
+
+@router.get("/{job_id}/download")
+def download_job_file(
+    job_id: str,
+    db: Session = Depends(get_db),
+    current_user: CurrentUser = Depends(get_current_active_user)
+):
+    """Download the file produced by a finished export job"""
+    job = _get_job_or_404(db, job_id)
+    file_name = (job.result or {}).get("file_name")
+    if job.job_type != "export" or job.status != JOB_SUCCEEDED or not file_name:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="Job has no downloadable file"
+        )
+
+    path = job_file_path(file_name)
+    if not os.path.isfile(path):
+        raise HTTPException(
+            status_code=status.HTTP_410_GONE,
+            detail="Export file is no longer available"
+        )
+    export_format = job.result.get("format", "csv")
+    return FileResponse(
+        path,
+        media_type=EXPORT_FORMATS.get(export_format),
+        filename=f"products.{export_format}"
+    )
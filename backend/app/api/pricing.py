@@ -0,0 +1,142 @@
+from fastapi import APIRouter, Depends, HTTPException, status, Query
+from typing import List, Optional
+from sqlalchemy.orm import Session
+from app.database import get_db
+from app.schemas.pricing import (
+    PricingOptimizeRequest, PricingOptimizeResponse,
+    ProfitOptimizeRequest, ProfitOptimizeResponse,
+    ReoptimizeRequest, ReoptimizeResponse,
+    ElasticityFitRequest, ElasticityFitResponse, CategoryElasticityItem,
+    FactorVersionCreate, FactorVersionResponse, FactorVersionSummary,
+    PricingSummaryResponse, ScenarioRequest, ScenarioResponse
+)
+from app.services.pricing_service import PricingService
+from app.services.elasticity_service import ElasticityService
+from app.services.reoptimize_service import ReoptimizeService
+from app.services.factor_service import FactorService
+from app.services.summary_service import SummaryService
+from app.services.scenario_service import ScenarioService
+from app.dependencies import get_current_active_user
+from app.schemas.user import CurrentUser
+
+router = APIRouter(prefix="/pricing", tags=["Pricing"])
+
+@router.post("/optimize", response_model=PricingOptimizeResponse)
+def optimize_prices(
+    request: PricingOptimizeRequest = PricingOptimizeRequest(),
+    db: Session = Depends(get_db),
+    current_user: CurrentUser = Depends(get_current_active_user)
+):
+    """Recompute optimized prices for the active catalog in one vectorized pass"""
+    return PricingService.optimize_catalog(db, request)
+
+@router.post("/optimize/profit", response_model=ProfitOptimizeResponse)
+def optimize_profit(
+    request: ProfitOptimizeRequest = ProfitOptimizeRequest(),
+    db: Session = Depends(get_db),
+    current_user: CurrentUser = Depends(get_current_active_user)
+):
+    """Maximize catalog profit subject to margin, step, inventory, ladder and revenue constraints"""
+    return PricingService.optimize_profit(db, request)
+
+@router.post("/optimize/incremental", response_model=ReoptimizeResponse)
+def optimize_incremental(
+    request: ReoptimizeRequest = ReoptimizeRequest(),
+    db: Session = Depends(get_db),
+    current_user: CurrentUser = Depends(get_current_active_user)
+):
+    """Re-forecast and re-price only products whose pricing inputs changed"""
+    return ReoptimizeService.process(db, request)
+
+@router.post("/scenarios", response_model=ScenarioResponse)
+def run_price_scenarios(
+    request: ScenarioRequest,
+    db: Session = Depends(get_db),
+    current_user: CurrentUser = Depends(get_current_active_user)
+):
+    """Project demand, revenue and margin under what-if price changes (nothing is written)"""
+    return ScenarioService.run(db, request)
+
+@router.get("/summary", response_model=PricingSummaryResponse)
+def get_pricing_summary(
+    category: Optional[str] = Query(None, description="Limit the summary to a single category"),
+    db: Session = Depends(get_db),
+    current_user: CurrentUser = Depends(get_current_active_user)
+):
+    """Catalog and per-category revenue, margin and optimization figures (from category_stats)"""
+    return SummaryService.get_summary(db, category)
+
+@router.post("/summary/refresh", response_model=PricingSummaryResponse)
+def refresh_pricing_summary(
+    db: Session = Depends(get_db),
+    current_user: CurrentUser = Depends(get_current_active_user)
+):
+    """Recompute category_stats now (pricing runs, imports and re-optimization refresh it themselves)"""
+    SummaryService.refresh(db)
+    return SummaryService.get_summary(db)
+
+@router.post("/elasticities/fit", response_model=ElasticityFitResponse)
+def fit_elasticities(
+    request: ElasticityFitRequest = ElasticityFitRequest(),
+    db: Session = Depends(get_db),
+    current_user: CurrentUser = Depends(get_current_active_user)
+):
+    """Fit price elasticities from price history (used by subsequent optimization runs)"""
+    return ElasticityService.fit(db, request)
+
+@router.get("/elasticities", response_model=List[CategoryElasticityItem])
+def get_category_elasticities(
+    db: Session = Depends(get_db),
+    current_user: CurrentUser = Depends(get_current_active_user)
+):
+    """Category elasticities from the last fit"""
+    return ElasticityService.get_category_elasticities(db)
+
+@router.get("/factors", response_model=FactorVersionResponse)
+def get_active_factors(
+    db: Session = Depends(get_db),
+    current_user: CurrentUser = Depends(get_current_active_user)
+):
+    """Category factor tables the engines currently use"""
+    return FactorService.get_active(db)
+
+@router.get("/factors/versions", response_model=List[FactorVersionSummary])
+def list_factor_versions(
+    db: Session = Depends(get_db),
+    current_user: CurrentUser = Depends(get_current_active_user)
+):
+    """All stored factor table versions, newest first"""
+    return FactorService.list_versions(db)
+
+@router.get("/factors/{version}", response_model=FactorVersionResponse)
+def get_factor_version(
+    version: int,
+    db: Session = Depends(get_db),
+    current_user: CurrentUser = Depends(get_current_active_user)
+):
+    """One stored version of the factor tables"""
+    factors = FactorService.get_version(db, version)
+    if not factors:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Factor version not found"
+        )
+    return factors
+
+@router.post("/factors", response_model=FactorVersionResponse, status_code=status.HTTP_201_CREATED)
+def create_factor_version(
+    request: FactorVersionCreate,
+    db: Session = Depends(get_db),
+    current_user: CurrentUser = Depends(get_current_active_user)
+):
+    """Store a new version of the factor tables (activated by default)"""
+    return FactorService.create_version(db, request, current_user)
+
+@router.post("/factors/{version}/activate", response_model=FactorVersionResponse)
+def activate_factor_version(
+    version: int,
+    db: Session = Depends(get_db),
+    current_user: CurrentUser = Depends(get_current_active_user)
+):
+    """Switch the engines to a stored version (also rolls back to an older one)"""
+    return FactorService.activate(db, version)
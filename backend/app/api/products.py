@@ -1,28 +1,36 @@
-from fastapi import APIRouter, Depends, HTTPException, status, Query
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, HTTPException, status, Query, Request
+from fastapi.responses import ORJSONResponse, StreamingResponse
+from sqlalchemy.ext.asyncio import AsyncSession
 from typing import List, Optional
 from decimal import Decimal
-from app.database import get_db
+from app.database import get_async_db
 from app.schemas.product import (
     ProductCreate, ProductUpdate, ProductResponse, 
-    ProductListResponse, ProductSearchParams
+    ProductListResponse, ProductSearchParams,
+    BulkPriceUpdateRequest, BulkPriceUpdateResponse,
+    BulkProductCreateRequest, BulkProductCreateResponse
 )
-from app.services.product_service import ProductService
+from app.services.async_product_service import AsyncProductService
+from app.services.export_service import ExportService, EXPORT_FORMATS
 from app.dependencies import get_current_active_user, get_current_user_optional
-from app.models.user import User
+from app.schemas.user import CurrentUser
+from app.utils.http_cache import conditional_json_response, not_modified, version_etag
 
-router = APIRouter(prefix="/products", tags=["Products"])
+router = APIRouter(prefix="/products", tags=["Products"], default_response_class=ORJSONResponse)
 
 @router.get("/", response_model=ProductListResponse)
-def get_products(
+async def get_products(
+    request: Request,
     search: Optional[str] = Query(None, description="Search in product name and description"),
     category: Optional[str] = Query(None, description="Filter by category"),
     min_price: Optional[Decimal] = Query(None, description="Minimum price filter"),
     max_price: Optional[Decimal] = Query(None, description="Maximum price filter"),
     page: int = Query(1, ge=1, description="Page number"),
     size: int = Query(10, ge=1, le=100, description="Page size"),
-    db: Session = Depends(get_db),
-    current_user: Optional[User] = Depends(get_current_user_optional)
+    cursor: Optional[str] = Query(None, description="Keyset cursor from a previous next_cursor (overrides page)"),
+    include_total: bool = Query(True, description="Compute the total match count"),
+    db: AsyncSession = Depends(get_async_db),
+    current_user: Optional[CurrentUser] = Depends(get_current_user_optional)
 ):
     """Get products with search and pagination"""
     search_params = ProductSearchParams(
@@ -31,60 +39,97 @@ def get_products(
         min_price=min_price,
         max_price=max_price,
         page=page,
-        size=size
+        size=size,
+        cursor=cursor,
+        include_total=include_total
     )
     
-    return ProductService.get_products(db, search_params, current_user)
+    # Listings are the same for every caller: serve the cached JSON as-is
+    body = await AsyncProductService.get_products_json(db, search_params)
+    return conditional_json_response(request, body)
 
 @router.get("/categories", response_model=List[str])
-def get_categories(
-    db: Session = Depends(get_db)
+async def get_categories(
+    request: Request,
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Get all product categories"""
-    return ProductService.get_categories(db)
+    body = await AsyncProductService.get_categories_json(db)
+    return conditional_json_response(request, body)
+
+@router.get("/export")
+async def export_products(
+    format: str = Query("csv", description="Export format: csv, ndjson or parquet"),
+    category: Optional[str] = Query(None, description="Filter by category"),
+    include_inactive: bool = Query(False, description="Include soft-deleted products"),
+    current_user: CurrentUser = Depends(get_current_active_user)
+):
+    """Stream the full catalog with optimized prices and the latest demand forecast"""
+    if format not in EXPORT_FORMATS:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Unsupported export format, expected one of: {', '.join(EXPORT_FORMATS)}"
+        )
+    if format == "parquet" and not ExportService.parquet_available():
+        raise HTTPException(
+            status_code=status.HTTP_501_NOT_IMPLEMENTED,
+            detail="Parquet export requires pyarrow on the server"
+        )
+    
+    return StreamingResponse(
+        ExportService.stream(format, category, include_inactive),
+        media_type=EXPORT_FORMATS[format],
+        headers={"Content-Disposition": f'attachment; filename="products.{format}"'}
+    )
 
 @router.get("/{product_id}", response_model=ProductResponse)
-def get_product(
+async def get_product(
     product_id: str,
-    db: Session = Depends(get_db),
-    current_user: Optional[User] = Depends(get_current_user_optional)
+    request: Request,
+    db: AsyncSession = Depends(get_async_db),
+    current_user: Optional[CurrentUser] = Depends(get_current_user_optional)
 ):
     """Get product by ID"""
-    product = ProductService.get_product_by_id(db, product_id)
+    product = await AsyncProductService.get_product_by_id(db, product_id)
     if not product:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Product not found"
         )
-    return product
+    
+    # The row version identifies the representation; skip serialization on a match
+    etag = version_etag(product.id, product.updated_at.isoformat())
+    return not_modified(request, etag) or conditional_json_response(
+        request, ProductResponse.model_validate(product).model_dump_json(), etag
+    )
 
 @router.post("/", response_model=ProductResponse, status_code=status.HTTP_201_CREATED)
-def create_product(
+async def create_product(
     product_data: ProductCreate,
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_active_user)
+    db: AsyncSession = Depends(get_async_db),
+    current_user: CurrentUser = Depends(get_current_active_user)
 ):
     """Create a new product"""
-    return ProductService.create_product(db, product_data, current_user)
+    return await AsyncProductService.create_product(db, product_data, current_user)
 
 @router.put("/{product_id}", response_model=ProductResponse)
-def update_product(
+async def update_product(
     product_id: str,
     product_data: ProductUpdate,
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_active_user)
+    db: AsyncSession = Depends(get_async_db),
+    current_user: CurrentUser = Depends(get_current_active_user)
 ):
     """Update an existing product"""
-    return ProductService.update_product(db, product_id, product_data, current_user)
+    return await AsyncProductService.update_product(db, product_id, product_data, current_user)
 
 @router.delete("/{product_id}")
-def delete_product(
+async def delete_product(
     product_id: str,
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_active_user)
+    db: AsyncSession = Depends(get_async_db),
+    current_user: CurrentUser = Depends(get_current_active_user)
 ):
     """Delete a product"""
-    success = ProductService.delete_product(db, product_id, current_user)
+    success = await AsyncProductService.delete_product(db, product_id, current_user)
     if success:
         return {"message": "Product deleted successfully"}
     else:
@@ -93,39 +138,70 @@ def delete_product(
             detail="Failed to delete product"
         )
 
-@router.get("/search/advanced")
-def advanced_product_search(
+@router.get("/search/advanced", response_model=ProductListResponse)
+async def advanced_product_search(
+    request: Request,
     q: Optional[str] = Query(None, description="Search query"),
     categories: Optional[List[str]] = Query(None, description="Categories to filter"),
-    price_range: Optional[str] = Query(None, description="Price range (e.g., '10-50')"),
-    rating_min: Optional[float] = Query(None, ge=0, le=5, description="Minimum rating"),
+    price_range: Optional[str] = Query(None, description="Price range (e.g., '10-50', '10-', '-50')"),
+    rating_min: Optional[Decimal] = Query(None, ge=0, le=5, description="Minimum rating"),
     in_stock: Optional[bool] = Query(None, description="Filter by stock availability"),
-    db: Session = Depends(get_db)
+    page: int = Query(1, ge=1, description="Page number"),
+    size: int = Query(10, ge=1, le=100, description="Page size"),
+    cursor: Optional[str] = Query(None, description="Keyset cursor from a previous next_cursor (overrides page)"),
+    include_total: bool = Query(True, description="Compute the total match count"),
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Advanced product search with multiple filters"""
-    # This is a placeholder for advanced search functionality
-    # You can implement more complex search logic here
-    return {"message": "Advanced search endpoint", "query": q}
+    min_price, max_price = None, None
+    if price_range:
+        try:
+            low, high = price_range.split("-", 1)
+            min_price = Decimal(low) if low.strip() else None
+            max_price = Decimal(high) if high.strip() else None
+        except (ValueError, ArithmeticError):
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Invalid price range, expected 'min-max'"
+            )
+    
+    search_params = ProductSearchParams(
+        search=q,
+        categories=categories,
+        min_price=min_price,
+        max_price=max_price,
+        rating_min=rating_min,
+        in_stock=in_stock,
+        page=page,
+        size=size,
+        cursor=cursor,
+        include_total=include_total
+    )
+    
+    body = await AsyncProductService.get_products_json(db, search_params)
+    return conditional_json_response(request, body)
 
 # Bulk operations
-@router.post("/bulk/update-prices")
-def bulk_update_prices(
-    updates: dict,  # {product_id: {field: value}}
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_active_user)
+@router.post("/bulk/create", response_model=BulkProductCreateResponse, status_code=status.HTTP_201_CREATED)
+async def bulk_create_products(
+    request: BulkProductCreateRequest,
+    db: AsyncSession = Depends(get_async_db),
+    current_user: CurrentUser = Depends(get_current_active_user)
+):
+    """Create up to 10,000 products in one request"""
+    return await AsyncProductService.bulk_create_products(db, request, current_user)
+
+@router.post("/bulk/update-prices", response_model=BulkPriceUpdateResponse)
+async def bulk_update_prices(
+    request: BulkPriceUpdateRequest,
+    db: AsyncSession = Depends(get_async_db),
+    current_user: CurrentUser = Depends(get_current_active_user)
 ):
     """Bulk update product prices"""
-    product_ids = list(updates.keys())
-    updated_products = ProductService.bulk_update_prices(
-        db, product_ids, updates, current_user
-    )
-    return {
-        "message": f"Updated {len(updated_products)} products",
-        "updated_products": [str(p.id) for p in updated_products]
-    }
+    return await AsyncProductService.bulk_update_prices(db, request, current_user)
 
 # Health check
 @router.get("/health/check")
-def products_health_check():
+async def products_health_check():
     """Products service health check"""
     return {"status": "healthy", "service": "products"}
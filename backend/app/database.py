@@ -1,19 +1,66 @@
 from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker, AsyncSession
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import NullPool
 from .config import settings
 
+def _pool_options() -> dict:
+    """Pool arguments shared by the sync and async engines"""
+    if settings.DB_PGBOUNCER:
+        # PgBouncer owns the pool; holding idle connections here would only pin server slots
+        return {"poolclass": NullPool}
+    return {
+        "pool_size": settings.DB_POOL_SIZE,
+        "max_overflow": settings.DB_MAX_OVERFLOW,
+        "pool_timeout": settings.DB_POOL_TIMEOUT,
+        "pool_recycle": settings.DB_POOL_RECYCLE,
+        "pool_pre_ping": settings.DB_POOL_PRE_PING,
+    }
+
+def _sync_connect_args() -> dict:
+    # The sync engine runs batch work (jobs, CLI scripts, pricing and forecast
+    # runs, imports, view refreshes), so it gets the batch timeout, not the API one.
+    # PgBouncer rejects startup options; set statement_timeout on the database role instead
+    if settings.DB_PGBOUNCER or settings.JOB_STATEMENT_TIMEOUT_MS <= 0:
+        return {}
+    return {"options": f"-c statement_timeout={settings.JOB_STATEMENT_TIMEOUT_MS}"}
+
+def _async_connect_args() -> dict:
+    if settings.DB_PGBOUNCER:
+        # Prepared statements do not survive transaction-level connection reuse
+        return {"statement_cache_size": 0, "prepared_statement_cache_size": 0}
+    if settings.DB_STATEMENT_TIMEOUT_MS <= 0:
+        return {}
+    return {"server_settings": {"statement_timeout": str(settings.DB_STATEMENT_TIMEOUT_MS)}}
+
 # Create SQLAlchemy engine
 engine = create_engine(
     settings.DATABASE_URL,
-    echo=settings.DEBUG,  # Log SQL queries in debug mode
-    pool_pre_ping=True,   # Verify connections before use
-    pool_recycle=300      # Recycle connections every 5 minutes
+    echo=settings.DB_ECHO,
+    connect_args=_sync_connect_args(),
+    **_pool_options()
 )
 
 # Create SessionLocal class
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+# Async engine (asyncpg) for request handlers that run on the event loop
+async_engine = create_async_engine(
+    settings.ASYNC_DATABASE_URL,
+    echo=settings.DB_ECHO,
+    connect_args=_async_connect_args(),
+    **_pool_options()
+)
+
+# Objects stay usable after commit so responses can be serialized without lazy loads
+AsyncSessionLocal = async_sessionmaker(
+    bind=async_engine,
+    class_=AsyncSession,
+    autoflush=False,
+    expire_on_commit=False
+)
+
 # Create Base class for models
 Base = declarative_base()
 
@@ -24,3 +71,31 @@ def get_db():
         yield db
     finally:
         db.close()
+
+# Dependency to get an async database session
+async def get_async_db():
+    async with AsyncSessionLocal() as db:
+        yield db
+
+def pool_status(pool) -> dict:
+    """Utilization counters for a connection pool (empty for NullPool)"""
+    if isinstance(pool, NullPool):
+        return {"pooled": False}
+    size = pool.size()
+    checked_out = pool.checkedout()
+    return {
+        "pooled": True,
+        "size": size,
+        "max_overflow": settings.DB_MAX_OVERFLOW,
+        "checked_in": pool.checkedin(),
+        "checked_out": checked_out,
+        "overflow": max(pool.overflow(), 0),
+        "utilization": round(checked_out / (size + settings.DB_MAX_OVERFLOW), 3) if size else 0.0,
+    }
+
+def pool_metrics() -> dict:
+    """Pool utilization for both engines, reported on /health"""
+    return {
+        "sync": pool_status(engine.pool),
+        "async": pool_status(async_engine.sync_engine.pool),
+    }
@@ -1,18 +1,21 @@
 from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from typing import Optional
-from app.database import get_db
-from app.models.user import User
-from app.utils.security import verify_token
+import uuid
+from app.config import settings
+from app.database import get_async_db
+from app.schemas.user import CurrentUser
+from app.services.async_auth_service import AsyncAuthService
+from app.utils.security import decode_token
 
 # Security scheme
 security = HTTPBearer()
 
-def get_current_user(
+async def get_current_user(
     credentials: HTTPAuthorizationCredentials = Depends(security),
-    db: Session = Depends(get_db)
-) -> User:
+    db: AsyncSession = Depends(get_async_db)
+) -> CurrentUser:
     """Get current authenticated user"""
     credentials_exception = HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
@@ -21,12 +24,12 @@ def get_current_user(
     )
     
     # Verify token
-    email = verify_token(credentials.credentials)
-    if email is None:
+    payload = decode_token(credentials.credentials)
+    if payload is None:
         raise credentials_exception
     
-    # Get user from database
-    user = db.query(User).filter(User.email == email).first()
+    # Get user from cache or database
+    user = await AsyncAuthService.get_cached_user(db, payload["sub"], payload.get("uid"))
     if user is None:
         raise credentials_exception
     
@@ -38,7 +41,7 @@ def get_current_user(
     
     return user
 
-def get_current_active_user(current_user: User = Depends(get_current_user)) -> User:
+async def get_current_active_user(current_user: CurrentUser = Depends(get_current_user)) -> CurrentUser:
     """Get current active user"""
     if not current_user.is_active:
         raise HTTPException(
@@ -48,23 +51,30 @@ def get_current_active_user(current_user: User = Depends(get_current_user)) -> U
     return current_user
 
 # Optional authentication (for public endpoints that can benefit from user context)
-def get_current_user_optional(
+async def get_current_user_optional(
     credentials: Optional[HTTPAuthorizationCredentials] = Depends(HTTPBearer(auto_error=False)),
-    db: Session = Depends(get_db)
-) -> Optional[User]:
+    db: AsyncSession = Depends(get_async_db)
+) -> Optional[CurrentUser]:
     """Get current user if authenticated, otherwise None"""
     if not credentials:
         return None
     
     try:
-        email = verify_token(credentials.credentials)
-        if email is None:
+        payload = decode_token(credentials.credentials)
+        if payload is None:
             return None
         
-        user = db.query(User).filter(User.email == email).first()
+        if settings.AUTH_TRUST_TOKEN_CLAIMS and payload.get("uid"):
+            return _user_from_claims(payload)
+        
+        user = await AsyncAuthService.get_cached_user(db, payload["sub"], payload.get("uid"))
         if user and user.is_active:
             return user
     except:
         pass
     
     return None
+
+def _user_from_claims(payload: dict) -> CurrentUser:
+    """User snapshot carrying only the identity claims of a token"""
+    return CurrentUser(id=uuid.UUID(payload["uid"]), email=payload["sub"])
@@ -2,7 +2,11 @@ import uvicorn
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from app.config import settings
-from app.api import auth_router, products_router
+from app.database import pool_metrics
+from app.utils.password_hashing import password_hash_pool
+from app.services.parallel_engine import engine_pool
+from app.services.factor_service import factor_registry
+from app.api import auth_router, products_router, pricing_router, forecasts_router, jobs_router
 
 # Create FastAPI application
 app = FastAPI(
@@ -19,12 +23,29 @@ app.add_middleware(
     allow_origins=settings.ALLOWED_ORIGINS,
     allow_credentials=True,
     allow_methods=["*"],
-    allow_headers=["*"]
+    allow_headers=["*"],
+    expose_headers=["ETag"]
 )
 
 # Include API routers
 app.include_router(auth_router, prefix="/api/v1")
 app.include_router(products_router, prefix="/api/v1")
+app.include_router(pricing_router, prefix="/api/v1")
+app.include_router(forecasts_router, prefix="/api/v1")
+app.include_router(jobs_router, prefix="/api/v1")
+
+@app.on_event("startup")
+def load_factor_tables():
+    # Load the active factor version up front instead of on the first engine run
+    factor_registry.current()
+
+@app.on_event("shutdown")
+def shutdown_password_hash_pool():
+    password_hash_pool.shutdown()
+
+@app.on_event("shutdown")
+def shutdown_engine_pool():
+    engine_pool.shutdown()
 
 # Root endpoint
 @app.get("/")
@@ -42,6 +63,10 @@ def health_check():
     return {
         "status": "healthy",
         "service": "price-optimization-api",
-        "version": "1.0.0"
+        "version": "1.0.0",
+        "environment": settings.ENVIRONMENT,
+        "database_pools": pool_metrics(),
+        "password_hashing": password_hash_pool.stats(),
+        "engine_pool": engine_pool.stats()
     }
 
@@ -2,5 +2,11 @@ from .user import User
 from .product import Product
 from .forecast import DemandForecast
 from .pricing import PricingOptimization
+from .price_history import PriceHistory
+from .elasticity import CategoryElasticity
+from .pricing_dirty import PricingDirtyProduct
+from .job import Job
+from .pricing_factor import PricingFactorVersion
+from . import category_stats  # Registers the category_stats view with create_all
 
-__all__ = ["User", "Product", "DemandForecast", "PricingOptimization"]
+__all__ = ["User", "Product", "DemandForecast", "PricingOptimization", "PriceHistory", "CategoryElasticity", "PricingDirtyProduct", "Job", "PricingFactorVersion"]
@@ -0,0 +1,67 @@
+from sqlalchemy import DDL, event
+from .product import Product
+
+# Upper edges (profit margin %) of the margin distribution buckets; the first
+# bucket holds negative margins and the last everything from 50% up
+MARGIN_BUCKET_EDGES = (0, 10, 20, 30, 40, 50)
+
+def _margin_bucket_counts() -> str:
+    bounds = [None, *MARGIN_BUCKET_EDGES, None]
+    counts = []
+    for lower, upper in zip(bounds, bounds[1:]):
+        conditions = []
+        if lower is not None:
+            conditions.append(f"margin >= {lower}")
+        if upper is not None:
+            conditions.append(f"margin < {upper}")
+        counts.append(f"count(*) FILTER (WHERE {' AND '.join(conditions)})")
+    return ",\n        ".join(counts)
+
+# Per-category dashboard figures over the active catalog. Every column is
+# additive (sums, counts, bucket counts) so catalog totals and averages are
+# derived from the category rows without touching products again. Revenue
+# follows the optimization summary: price times demand forecast, over products
+# that have been priced.
+CATEGORY_STATS_VIEW_SQL = f"""
+CREATE MATERIALIZED VIEW IF NOT EXISTS category_stats AS
+SELECT
+    category,
+    count(*) AS products,
+    count(*) FILTER (WHERE priced) AS products_priced,
+    coalesce(sum(stock_available), 0) AS stock_available,
+    coalesce(sum(units_sold), 0) AS units_sold,
+    coalesce(sum(selling_price * units_sold), 0) AS sales_revenue,
+    coalesce(sum(selling_price * demand_forecast) FILTER (WHERE priced), 0) AS current_revenue,
+    coalesce(sum(optimized_price * demand_forecast) FILTER (WHERE priced), 0) AS optimized_revenue,
+    coalesce(sum((optimized_price / selling_price - 1) * 100) FILTER (WHERE priced), 0) AS price_change_sum,
+    count(margin) AS margin_products,
+    coalesce(sum(margin), 0) AS margin_sum,
+    min(margin) AS min_margin,
+    max(margin) AS max_margin,
+    ARRAY[
+        {_margin_bucket_counts()}
+    ] AS margin_histogram,
+    now() AS refreshed_at
+FROM (
+    SELECT
+        category, stock_available, units_sold, selling_price, optimized_price, demand_forecast,
+        optimized_price IS NOT NULL AND demand_forecast IS NOT NULL AND selling_price > 0 AS priced,
+        (selling_price - cost_price) / NULLIF(selling_price, 0) * 100 AS margin
+    FROM products
+    WHERE is_active = true
+) AS p
+GROUP BY category
+"""
+
+# REFRESH ... CONCURRENTLY needs a unique index; it keeps the view readable during a refresh
+CATEGORY_STATS_INDEX_SQL = """
+CREATE UNIQUE INDEX IF NOT EXISTS uq_category_stats_category ON category_stats (category)
+"""
+
+REFRESH_CATEGORY_STATS_SQL = "REFRESH MATERIALIZED VIEW CONCURRENTLY category_stats"
+
+DROP_CATEGORY_STATS_SQL = "DROP MATERIALIZED VIEW IF EXISTS category_stats"
+
+# create_all builds the view once products exists
+event.listen(Product.__table__, "after_create", DDL(CATEGORY_STATS_VIEW_SQL))
+event.listen(Product.__table__, "after_create", DDL(CATEGORY_STATS_INDEX_SQL))
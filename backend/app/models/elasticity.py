@@ -0,0 +1,17 @@
+from sqlalchemy import Column, String, Integer, Numeric, DateTime
+from sqlalchemy.sql import func
+from ..database import Base
+
+class CategoryElasticity(Base):
+    """Pooled log-log price elasticity per category (written by the elasticity fit job)"""
+    __tablename__ = "category_elasticities"
+    
+    category = Column(String(100), primary_key=True)
+    elasticity = Column(Numeric(6, 3), nullable=False)
+    prior_elasticity = Column(Numeric(6, 3), nullable=False)  # Static table value it was shrunk toward
+    products_fitted = Column(Integer, nullable=False, default=0)  # Products with enough price variation
+    observations = Column(Integer, nullable=False, default=0)
+    fitted_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
+    
+    def __repr__(self):
+        return f"<CategoryElasticity(category='{self.category}', elasticity={self.elasticity})>"
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, String, Integer, Numeric, DateTime, Date, ForeignKey, JSON
+from sqlalchemy import Column, String, Integer, Numeric, DateTime, Date, ForeignKey, JSON, Index
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
@@ -7,6 +7,10 @@ from ..database import Base
 
 class DemandForecast(Base):
     __tablename__ = "demand_forecasts"
+    __table_args__ = (
+        # Serves per-product series reads ordered by date
+        Index("ix_demand_forecasts_product_period_date", "product_id", "forecast_period", "forecast_date"),
+    )
     
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4, index=True)
     product_id = Column(UUID(as_uuid=True), ForeignKey("products.id"), nullable=False, index=True)
@@ -15,7 +19,7 @@ class DemandForecast(Base):
     forecasted_demand = Column(Numeric(10, 2), nullable=False)
     price_point = Column(Numeric(10, 2), nullable=False)
     forecast_date = Column(Date, nullable=False)
-    forecast_period = Column(String(50), nullable=False)  # 'weekly', 'monthly', 'quarterly'
+    forecast_period = Column(String(50), nullable=False)  # 'weekly', 'monthly', 'quarterly', 'yearly'
     
     # Additional forecast metadata
     forecast_data = Column(JSON, nullable=True)  # Store additional forecast details
@@ -0,0 +1,48 @@
+from sqlalchemy import Column, String, Integer, Numeric, Boolean, DateTime, ForeignKey, JSON, Text, Index, text
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.sql import func
+import uuid
+from ..database import Base
+
+JOB_QUEUED = "queued"
+JOB_RUNNING = "running"
+JOB_SUCCEEDED = "succeeded"
+JOB_FAILED = "failed"
+JOB_CANCELLED = "cancelled"
+
+JOB_FINISHED_STATUSES = (JOB_SUCCEEDED, JOB_FAILED, JOB_CANCELLED)
+
+class Job(Base):
+    """Background job (pricing, forecast, import and export runs) executed by run_worker.py"""
+    __tablename__ = "jobs"
+    __table_args__ = (
+        # Workers poll the oldest queued jobs; finished jobs stay out of the index
+        Index("ix_jobs_queued", "created_at", postgresql_where=text("status = 'queued'")),
+        Index("ix_jobs_status_created", "status", "created_at"),
+    )
+
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    job_type = Column(String(50), nullable=False)
+    status = Column(String(20), nullable=False, default=JOB_QUEUED)
+    params = Column(JSON, nullable=False, default=dict)
+    result = Column(JSON, nullable=True)
+    error = Column(Text, nullable=True)
+
+    # Progress reported by the running job
+    progress = Column(Numeric(5, 4), nullable=True)  # 0.0 to 1.0 when the job can tell
+    progress_message = Column(String(255), nullable=True)
+    cancel_requested = Column(Boolean, nullable=False, default=False)
+
+    # Execution
+    created_by = Column(UUID(as_uuid=True), ForeignKey("users.id", ondelete="SET NULL"), nullable=True)
+    worker_id = Column(String(100), nullable=True)
+    attempts = Column(Integer, nullable=False, default=0)
+
+    # Timestamps
+    created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+    started_at = Column(DateTime(timezone=True), nullable=True)
+    heartbeat_at = Column(DateTime(timezone=True), nullable=True)
+    finished_at = Column(DateTime(timezone=True), nullable=True)
+
+    def __repr__(self):
+        return f"<Job(id={self.id}, type='{self.job_type}', status='{self.status}')>"
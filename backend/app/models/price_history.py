@@ -0,0 +1,57 @@
+from sqlalchemy import Column, BigInteger, Integer, Numeric, DateTime, ForeignKey, Index, DDL, event
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.sql import func
+from ..database import Base
+
+# Statement-level triggers with transition tables: one INSERT ... SELECT per
+# statement, so bulk updates, upserts and imports record history in a single
+# pass instead of firing once per row.
+PRICE_HISTORY_FUNCTION_SQL = """
+CREATE OR REPLACE FUNCTION record_price_history() RETURNS trigger AS $$
+BEGIN
+    IF TG_OP = 'INSERT' THEN
+        INSERT INTO price_history (product_id, selling_price, units_sold)
+        SELECT n.id, n.selling_price, n.units_sold FROM new_rows n;
+    ELSE
+        INSERT INTO price_history (product_id, selling_price, units_sold)
+        SELECT n.id, n.selling_price, n.units_sold
+        FROM new_rows n
+        JOIN old_rows o ON o.id = n.id
+        WHERE n.selling_price IS DISTINCT FROM o.selling_price
+           OR n.units_sold IS DISTINCT FROM o.units_sold;
+    END IF;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql
+"""
+
+PRICE_HISTORY_TRIGGERS_SQL = """
+CREATE OR REPLACE TRIGGER products_price_history_insert
+    AFTER INSERT ON products
+    REFERENCING NEW TABLE AS new_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION record_price_history();
+CREATE OR REPLACE TRIGGER products_price_history_update
+    AFTER UPDATE ON products
+    REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION record_price_history()
+"""
+
+class PriceHistory(Base):
+    """Price / units sold observations, written by triggers on products"""
+    __tablename__ = "price_history"
+    __table_args__ = (
+        Index("ix_price_history_product_recorded", "product_id", "recorded_at"),
+    )
+    
+    id = Column(BigInteger, primary_key=True, autoincrement=True)
+    product_id = Column(UUID(as_uuid=True), ForeignKey("products.id", ondelete="CASCADE"), nullable=False)
+    selling_price = Column(Numeric(10, 2), nullable=False)
+    units_sold = Column(Integer, nullable=True)
+    recorded_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+    
+    def __repr__(self):
+        return f"<PriceHistory(product_id={self.product_id}, price={self.selling_price}, units={self.units_sold})>"
+
+# create_all installs the triggers once price_history exists
+event.listen(PriceHistory.__table__, "after_create", DDL(PRICE_HISTORY_FUNCTION_SQL))
+event.listen(PriceHistory.__table__, "after_create", DDL(PRICE_HISTORY_TRIGGERS_SQL))
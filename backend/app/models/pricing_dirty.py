@@ -0,0 +1,64 @@
+from sqlalchemy import Column, DateTime, ForeignKey, Index, DDL, event
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.sql import func
+from ..database import Base
+
+# Marks products whose pricing inputs changed, or that were deactivated or
+# reactivated (the re-optimizer's pass then refreshes the summary view).
+# Statement-level like the price history triggers, so ORM updates, set-based
+# bulk updates and COPY imports are all captured with one INSERT ... SELECT per
+# statement. The optimizer's own writes (optimized_price, demand_forecast)
+# never touch these columns.
+PRICING_DIRTY_FUNCTION_SQL = """
+CREATE OR REPLACE FUNCTION mark_pricing_dirty() RETURNS trigger AS $$
+BEGIN
+    IF TG_OP = 'INSERT' THEN
+        INSERT INTO pricing_dirty_products (product_id)
+        SELECT n.id FROM new_rows n
+        ON CONFLICT (product_id) DO NOTHING;
+    ELSE
+        INSERT INTO pricing_dirty_products (product_id)
+        SELECT n.id
+        FROM new_rows n
+        JOIN old_rows o ON o.id = n.id
+        WHERE n.cost_price IS DISTINCT FROM o.cost_price
+           OR n.selling_price IS DISTINCT FROM o.selling_price
+           OR n.stock_available IS DISTINCT FROM o.stock_available
+           OR n.units_sold IS DISTINCT FROM o.units_sold
+           OR n.category IS DISTINCT FROM o.category
+           OR n.price_elasticity IS DISTINCT FROM o.price_elasticity
+           OR n.is_active IS DISTINCT FROM o.is_active
+        ON CONFLICT (product_id) DO NOTHING;
+    END IF;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql
+"""
+
+PRICING_DIRTY_TRIGGERS_SQL = """
+CREATE OR REPLACE TRIGGER products_pricing_dirty_insert
+    AFTER INSERT ON products
+    REFERENCING NEW TABLE AS new_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION mark_pricing_dirty();
+CREATE OR REPLACE TRIGGER products_pricing_dirty_update
+    AFTER UPDATE ON products
+    REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION mark_pricing_dirty()
+"""
+
+class PricingDirtyProduct(Base):
+    """Products waiting for incremental re-optimization, written by triggers on products"""
+    __tablename__ = "pricing_dirty_products"
+    __table_args__ = (
+        Index("ix_pricing_dirty_products_marked_at", "marked_at"),
+    )
+
+    product_id = Column(UUID(as_uuid=True), ForeignKey("products.id", ondelete="CASCADE"), primary_key=True)
+    marked_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+
+    def __repr__(self):
+        return f"<PricingDirtyProduct(product_id={self.product_id}, marked_at={self.marked_at})>"
+
+# create_all installs the triggers once pricing_dirty_products exists
+event.listen(PricingDirtyProduct.__table__, "after_create", DDL(PRICING_DIRTY_FUNCTION_SQL))
+event.listen(PricingDirtyProduct.__table__, "after_create", DDL(PRICING_DIRTY_TRIGGERS_SQL))
@@ -0,0 +1,23 @@
+from sqlalchemy import Column, Integer, String, Boolean, DateTime, ForeignKey, JSON, Index, text
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.sql import func
+from ..database import Base
+
+class PricingFactorVersion(Base):
+    """Versioned category factor tables used by the pricing and forecast engines"""
+    __tablename__ = "pricing_factor_versions"
+    __table_args__ = (
+        # At most one version is active at a time
+        Index("uq_pricing_factor_versions_active", "is_active", unique=True, postgresql_where=text("is_active")),
+    )
+
+    version = Column(Integer, primary_key=True, autoincrement=True)
+    factors = Column(JSON, nullable=False)  # {"tables": {table: {category: value}}, "defaults": {table: value}}
+    note = Column(String(255), nullable=True)
+    is_active = Column(Boolean, nullable=False, default=False)
+    created_by = Column(UUID(as_uuid=True), ForeignKey("users.id", ondelete="SET NULL"), nullable=True)
+    created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+    activated_at = Column(DateTime(timezone=True), nullable=True)
+
+    def __repr__(self):
+        return f"<PricingFactorVersion(version={self.version}, active={self.is_active})>"
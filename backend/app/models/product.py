@@ -1,15 +1,31 @@
-from sqlalchemy import Column, String, Integer, Numeric, Boolean, DateTime, Text, ForeignKey
-from sqlalchemy.dialects.postgresql import UUID
-from sqlalchemy.orm import relationship
+from sqlalchemy import Column, String, Integer, Numeric, Boolean, DateTime, Text, ForeignKey, Index, Computed, Sequence
+from sqlalchemy.dialects.postgresql import UUID, TSVECTOR
+from sqlalchemy.orm import relationship, deferred
 from sqlalchemy.sql import func
 import uuid
 from ..database import Base
 
+# Text search configuration and weighted document (name ranks above description)
+SEARCH_CONFIG = "english"
+SEARCH_VECTOR_SQL = (
+    "setweight(to_tsvector('english', coalesce(name, '')), 'A') || "
+    "setweight(to_tsvector('english', coalesce(description, '')), 'B')"
+)
+
+# Allocates product_id for products created through the API (imports keep their feed ids)
+PRODUCT_ID_SEQUENCE = Sequence("products_product_id_seq")
+
 class Product(Base):
     __tablename__ = "products"
+    __table_args__ = (
+        # Keyset pagination order: (created_at DESC, id DESC)
+        Index("ix_products_created_at_id", "created_at", "id"),
+        # Full-text search over name and description
+        Index("ix_products_search_vector", "search_vector", postgresql_using="gin"),
+    )
     
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4, index=True)
-    product_id = Column(Integer, unique=True, index=True, nullable=False)  # From CSV
+    product_id = Column(Integer, PRODUCT_ID_SEQUENCE, unique=True, index=True, nullable=False)  # From CSV or the sequence
     name = Column(String(255), nullable=False, index=True)
     description = Column(Text, nullable=True)
     cost_price = Column(Numeric(10, 2), nullable=False)
@@ -20,8 +36,15 @@ class Product(Base):
     customer_rating = Column(Numeric(3, 2), nullable=True)  # e.g., 4.5
     demand_forecast = Column(Integer, nullable=True)
     optimized_price = Column(Numeric(10, 2), nullable=True)
+    price_elasticity = Column(Numeric(6, 3), nullable=True)  # Fitted from price_history (shrunk toward the category)
     is_active = Column(Boolean, default=True)
     
+    # Hash of the last imported feed row (incremental imports skip unchanged rows)
+    content_hash = Column(String(32), nullable=True)
+    
+    # Generated full-text search document (deferred: only used in WHERE/ORDER BY)
+    search_vector = deferred(Column(TSVECTOR, Computed(SEARCH_VECTOR_SQL, persisted=True)))
+    
     # Foreign key to user who created the product
     created_by = Column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=True)
     
@@ -0,0 +1,27 @@
+from pydantic import BaseModel, Field
+from typing import Optional
+from datetime import date
+import uuid
+
+class ForecastRunRequest(BaseModel):
+    years: int = Field(default=5, ge=1, le=10, description="Number of yearly projections")
+    category: Optional[str] = Field(None, description="Limit the run to a single category")
+
+class ForecastRunResponse(BaseModel):
+    products_forecasted: int
+    forecasts_written: int
+    years: int
+    factor_version: int = 0  # Factor tables version the run used
+    shards: int = 1  # Engine processes the catalog was split across
+    duration_ms: float
+
+class ForecastPoint(BaseModel):
+    year: int
+    forecast_date: date
+    demand: float
+    price_point: float
+
+class ProductForecastResponse(BaseModel):
+    product_id: uuid.UUID
+    forecast_period: str
+    forecasts: list[ForecastPoint]
@@ -0,0 +1,21 @@
+from pydantic import BaseModel
+from typing import Dict, List
+
+class ImportRowError(BaseModel):
+    line: int
+    error: str
+
+class ImportSummary(BaseModel):
+    incremental: bool = False
+    rows_read: int = 0
+    rows_loaded: int = 0
+    rows_rejected: int = 0
+    inserted: int = 0
+    updated: int = 0
+    unchanged: int = 0     # Incremental mode: content hash matched, row not rewritten
+    deactivated: int = 0   # Incremental mode: soft-deleted because absent from the feed
+    duration_seconds: float = 0.0
+    rows_per_second: float = 0.0
+    errors: List[ImportRowError] = []  # First few rejected rows
+    categories: Dict[str, int] = {}    # Active products per category after import
+    summary_refreshed: bool = True     # False when the category_stats refresh failed (categories may be stale)
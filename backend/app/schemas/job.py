@@ -0,0 +1,37 @@
+from pydantic import BaseModel, Field
+from typing import Any, Dict, Optional
+from datetime import datetime
+import uuid
+
+class JobCreateRequest(BaseModel):
+    job_type: str = Field(..., description="pricing_optimize, profit_optimize, forecast_run, elasticity_fit, reoptimize, import or export")
+    params: Dict[str, Any] = Field(default_factory=dict, description="Parameters of the job type's request")
+
+class ExportJobParams(BaseModel):
+    format: str = Field(default="csv", description="Export format: csv, ndjson or parquet")
+    category: Optional[str] = Field(None, description="Filter by category")
+    include_inactive: bool = Field(default=False, description="Include soft-deleted products")
+
+class ImportJobParams(BaseModel):
+    file_name: str = Field(..., description="Uploaded file in the job files directory")
+    chunk_size: int = Field(default=50000, ge=100, le=1000000, description="Rows per transaction")
+    incremental: bool = Field(default=False, description="Only write changed rows and soft-delete missing ones")
+
+class JobResponse(BaseModel):
+    id: uuid.UUID
+    job_type: str
+    status: str
+    params: Dict[str, Any]
+    result: Optional[Dict[str, Any]] = None
+    error: Optional[str] = None
+    progress: Optional[float] = None
+    progress_message: Optional[str] = None
+    cancel_requested: bool
+    attempts: int
+    created_at: datetime
+    started_at: Optional[datetime] = None
+    heartbeat_at: Optional[datetime] = None
+    finished_at: Optional[datetime] = None
+
+    class Config:
+        from_attributes = True
@@ -0,0 +1,223 @@
+from pydantic import BaseModel, Field
+from typing import Annotated, Dict, List, Optional
+from datetime import datetime
+import uuid
+
+PositiveFactor = Annotated[float, Field(gt=0)]
+Elasticity = Annotated[float, Field(lt=0)]
+GrowthCurve = Annotated[List[PositiveFactor], Field(min_length=1, max_length=50)]
+
+class PricingOptimizeRequest(BaseModel):
+    category: Optional[str] = Field(None, description="Limit the run to a single category")
+    apply: bool = Field(default=True, description="Write optimized prices back to products")
+    include_products: bool = Field(default=False, description="Return per-product results")
+
+class OptimizedPriceItem(BaseModel):
+    id: uuid.UUID
+    current_price: float
+    optimized_price: float
+    demand_forecast: int
+    price_change_percentage: float
+
+class PricingOptimizeResponse(BaseModel):
+    products_optimized: int
+    applied: bool
+    algorithm: str
+    factor_version: int = 0  # Factor tables version the run used
+    total_current_revenue: float
+    total_optimized_revenue: float
+    total_revenue_increase: float
+    average_price_change: float  # Percentage
+    shards: int = 1  # Engine processes the catalog was split across
+    duration_ms: float
+    products: Optional[list[OptimizedPriceItem]] = None
+
+class ReoptimizeRequest(BaseModel):
+    batch_size: int = Field(default=5000, ge=1, le=50000, description="Dirty products claimed per transaction")
+    max_batches: int = Field(default=20, ge=1, le=1000, description="Stop after this many batches")
+
+class ReoptimizeResponse(BaseModel):
+    products_claimed: int
+    products_optimized: int  # Claimed products that are still active
+    batches: int
+    categories: list[str]  # Categories touched by the re-optimized products
+    pending: int  # Dirty products left in the queue
+    duration_ms: float
+
+class ElasticityFitRequest(BaseModel):
+    category: Optional[str] = Field(None, description="Limit the fit to a single category")
+    lookback_days: int = Field(default=365, ge=1, le=3650, description="Price history window")
+    shrinkage: float = Field(default=0.1, gt=0, allow_inf_nan=False, description="Prior strength toward the category (in units of log-price variance)")
+
+class CategoryElasticityItem(BaseModel):
+    category: str
+    elasticity: float
+    prior_elasticity: float
+    products_fitted: int
+    observations: int
+
+class ElasticityFitResponse(BaseModel):
+    products_updated: int
+    products_fitted: int  # Products with enough price variation for their own slope
+    algorithm: str
+    duration_ms: float
+    categories: list[CategoryElasticityItem]
+
+class ProfitOptimizeRequest(BaseModel):
+    category: Optional[str] = Field(None, description="Limit the solve to a single category")
+    min_margin: float = Field(default=0.2, ge=0, lt=1, description="Minimum (price - cost) / price")
+    max_change: float = Field(default=0.1, gt=0, le=1, description="Maximum relative price change per step")
+    min_revenue_ratio: Optional[float] = Field(None, gt=0, description="Total revenue must stay >= this share of current revenue")
+    max_inventory_cover: Optional[float] = Field(None, gt=0, description="Stock must sell within this many forecast periods")
+    min_inventory_cover: Optional[float] = Field(None, gt=0, description="Stock must last at least this many forecast periods")
+    price_ladders: Dict[str, List[float]] = Field(default_factory=dict, description="Allowed price points per category")
+    apply: bool = Field(default=False, description="Write optimized prices back to products")
+    include_products: bool = Field(default=False, description="Return per-product results")
+
+class ProfitOptimizedItem(BaseModel):
+    id: uuid.UUID
+    current_price: float
+    optimized_price: float
+    expected_demand: float
+    elasticity: float
+    binding_constraint: str
+
+class ProfitOptimizeResponse(BaseModel):
+    products_optimized: int
+    applied: bool
+    algorithm: str
+    factor_version: int = 0  # Factor tables version the run used
+    total_current_profit: float
+    total_optimized_profit: float
+    total_current_revenue: float
+    total_optimized_revenue: float
+    revenue_multiplier: float  # Lagrange multiplier of the revenue floor (0 when not binding)
+    revenue_floor_met: Optional[bool] = None  # False when min_revenue_ratio is out of reach (None without a floor)
+    iterations: int
+    binding_constraints: Dict[str, int]
+    constraint_conflicts: int
+    ladder_misses: int
+    solve_ms: float
+    duration_ms: float
+    products: Optional[list[ProfitOptimizedItem]] = None
+
+class FactorTablesDocument(BaseModel):
+    competitive_adjustment: Dict[str, PositiveFactor] = Field(default_factory=dict)
+    demand_elasticity: Dict[str, Elasticity] = Field(default_factory=dict)
+    market_condition: Dict[str, PositiveFactor] = Field(default_factory=dict)
+    category_demand_multiplier: Dict[str, PositiveFactor] = Field(default_factory=dict)
+    growth_rates: Dict[str, GrowthCurve] = Field(default_factory=dict)  # Yearly curve, index 0 = current year
+
+class FactorDefaults(BaseModel):
+    """Values for categories missing from a table"""
+    competitive_adjustment: PositiveFactor = 1.0
+    demand_elasticity: Elasticity = -1.0
+    market_condition: PositiveFactor = 1.0
+    category_demand_multiplier: PositiveFactor = 1.0
+    growth_rates: GrowthCurve = [1.0, 1.02, 1.04, 1.05, 1.06]
+
+class FactorVersionCreate(BaseModel):
+    tables: FactorTablesDocument
+    defaults: FactorDefaults = Field(default_factory=FactorDefaults)
+    note: Optional[str] = Field(None, max_length=255)
+    activate: bool = Field(default=True, description="Make this version the one the engines use")
+
+class FactorVersionResponse(BaseModel):
+    version: int  # 0 = built-in tables (no version stored yet)
+    tables: FactorTablesDocument
+    defaults: FactorDefaults
+    note: Optional[str] = None
+    is_active: bool
+    created_at: Optional[datetime] = None
+    activated_at: Optional[datetime] = None
+
+class FactorVersionSummary(BaseModel):
+    version: int
+    note: Optional[str] = None
+    is_active: bool
+    created_at: datetime
+    activated_at: Optional[datetime] = None
+
+    class Config:
+        from_attributes = True
+
+class MarginBucket(BaseModel):
+    min_margin: Optional[float] = None  # Percentage, inclusive (None = unbounded)
+    max_margin: Optional[float] = None  # Percentage, exclusive (None = unbounded)
+    products: int
+
+class CategoryStatsItem(BaseModel):
+    category: Optional[str] = None  # None for the catalog totals
+    products: int
+    products_priced: int  # Products with an optimized price and demand forecast
+    stock_available: int
+    units_sold: int
+    sales_revenue: float  # selling_price * units_sold
+    total_current_revenue: float  # selling_price * demand_forecast over priced products
+    total_optimized_revenue: float
+    total_revenue_increase: float
+    revenue_increase_percentage: float
+    average_price_change: float  # Percentage, over priced products
+    average_margin: float  # Percentage
+    min_margin: Optional[float] = None
+    max_margin: Optional[float] = None
+    margin_distribution: list[MarginBucket]
+
+class PricingSummaryResponse(BaseModel):
+    refreshed_at: Optional[datetime] = None  # When category_stats was last refreshed
+    totals: CategoryStatsItem
+    categories: list[CategoryStatsItem]
+
+class PriceChangeRule(BaseModel):
+    category: Optional[str] = Field(None, description="Products in this category")
+    product_ids: Optional[List[uuid.UUID]] = Field(None, max_length=10000, description="These products (within the category, if both are given)")
+    price_change: float = Field(..., gt=-100, le=1000, description="Percentage price change, e.g. 5 or -3")
+
+class PriceScenario(BaseModel):
+    name: str = Field(..., min_length=1, max_length=100)
+    rules: List[PriceChangeRule] = Field(..., min_length=1, max_length=100, description="Applied in order; later rules override earlier ones")
+
+class ScenarioRequest(BaseModel):
+    scenarios: List[PriceScenario] = Field(..., min_length=1, max_length=50)
+    include_products: bool = Field(default=False, description="Return per-product results for affected products")
+    product_limit: int = Field(default=1000, ge=1, le=50000, description="Affected products returned per scenario")
+    refresh_snapshot: bool = Field(default=False, description="Reload the catalog snapshot before evaluating")
+
+class ScenarioImpact(BaseModel):
+    category: Optional[str] = None  # None for the catalog totals
+    products_affected: int
+    baseline_units: float
+    scenario_units: float
+    baseline_revenue: float
+    scenario_revenue: float
+    revenue_change: float
+    revenue_change_percentage: float
+    baseline_profit: float
+    scenario_profit: float
+    profit_change: float
+    baseline_margin: float  # Profit / revenue, percentage
+    scenario_margin: float
+
+class ScenarioProductItem(BaseModel):
+    id: uuid.UUID
+    category: str
+    current_price: float
+    scenario_price: float
+    baseline_demand: float
+    scenario_demand: float
+    elasticity: float
+    revenue_change: float
+
+class ScenarioResultItem(BaseModel):
+    name: str
+    totals: ScenarioImpact
+    categories: list[ScenarioImpact]  # Categories with affected products
+    products: Optional[list[ScenarioProductItem]] = None
+    products_truncated: bool = False
+
+class ScenarioResponse(BaseModel):
+    snapshot_at: datetime  # When the catalog snapshot was loaded
+    snapshot_products: int
+    factor_version: int
+    duration_ms: float
+    scenarios: list[ScenarioResultItem]
@@ -1,5 +1,5 @@
 from pydantic import BaseModel, Field
-from typing import Optional
+from typing import List, Optional
 from decimal import Decimal
 from datetime import datetime
 import uuid
@@ -48,14 +48,54 @@ class ProductResponse(ProductBase):
 
 class ProductListResponse(BaseModel):
     products: list[ProductResponse]
-    total: int
+    total: Optional[int] = None  # None when include_total is false
+    total_is_estimate: bool = False
     page: int
     size: int
+    next_cursor: Optional[str] = None  # Keyset cursor for the following page
     
 class ProductSearchParams(BaseModel):
     search: Optional[str] = None
     category: Optional[str] = None
+    categories: Optional[List[str]] = None
     min_price: Optional[Decimal] = None
     max_price: Optional[Decimal] = None
+    rating_min: Optional[Decimal] = Field(None, ge=0, le=5)
+    in_stock: Optional[bool] = None
     page: int = Field(default=1, ge=1)
     size: int = Field(default=10, ge=1, le=100)
+    cursor: Optional[str] = None  # Opaque keyset cursor; takes precedence over page
+    include_total: bool = True
+
+class BulkProductCreateRequest(BaseModel):
+    products: List[ProductCreate] = Field(..., min_length=1, max_length=10000)
+
+class CreatedProduct(BaseModel):
+    id: uuid.UUID
+    product_id: int
+
+class BulkProductCreateResponse(BaseModel):
+    message: str
+    created: int
+    products: list[CreatedProduct]  # In request order
+
+class BulkPriceUpdateItem(BaseModel):
+    id: uuid.UUID
+    selling_price: Optional[Decimal] = Field(None, gt=0)
+    cost_price: Optional[Decimal] = Field(None, gt=0)
+    optimized_price: Optional[Decimal] = Field(None, gt=0)
+
+class BulkPriceUpdateRequest(BaseModel):
+    updates: List[BulkPriceUpdateItem] = Field(..., min_length=1, max_length=50000)
+
+class BulkPriceUpdateResult(BaseModel):
+    id: uuid.UUID
+    status: str  # 'updated' or 'not_found'
+
+class BulkPriceUpdateResponse(BaseModel):
+    message: str
+    requested: int
+    updated: int
+    not_found: int
+    results: list[BulkPriceUpdateResult]
+
@@ -1,4 +1,27 @@
 from .auth_service import AuthService
 from .product_service import ProductService
+from .async_auth_service import AsyncAuthService
+from .async_product_service import AsyncProductService
+from .pricing_service import PricingService
+from .forecast_service import ForecastService
+from .elasticity_service import ElasticityService
+from .reoptimize_service import ReoptimizeService
+from .job_service import JobService
+from .factor_service import FactorService
+from .summary_service import SummaryService
+from .scenario_service import ScenarioService
 
-__all__ = ["AuthService", "ProductService"]
+__all__ = [
+    "AuthService",
+    "ProductService",
+    "AsyncAuthService",
+    "AsyncProductService",
+    "PricingService",
+    "ForecastService",
+    "ElasticityService",
+    "ReoptimizeService",
+    "JobService",
+    "FactorService",
+    "SummaryService",
+    "ScenarioService"
+]
@@ -0,0 +1,112 @@
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import select
+from fastapi import HTTPException, status
+from typing import Optional
+from app.models.user import User
+from app.schemas.user import CurrentUser, UserCreate, UserLogin, Token
+from app.utils.password_hashing import password_hash_pool
+from app.services.auth_service import AuthService, user_cache
+
+class AsyncAuthService:
+    """Async (AsyncSession) counterpart of AuthService for event-loop handlers"""
+
+    @staticmethod
+    async def create_user(db: AsyncSession, user_data: UserCreate) -> User:
+        """Create a new user"""
+        # Check if user already exists
+        existing_user = await AsyncAuthService.get_user_by_email(db, user_data.email)
+        if existing_user:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Email already registered"
+            )
+
+        # bcrypt is CPU-bound: run it in the hashing process pool
+        hashed_password = await password_hash_pool.hash(user_data.password)
+        db_user = User(
+            email=user_data.email,
+            password_hash=hashed_password,
+            first_name=user_data.first_name,
+            last_name=user_data.last_name,
+            is_active=True,
+            is_verified=False
+        )
+
+        db.add(db_user)
+        await db.commit()
+        await db.refresh(db_user)
+        return db_user
+
+    @staticmethod
+    async def authenticate_user(db: AsyncSession, login_data: UserLogin) -> Optional[User]:
+        """Authenticate user with email and password"""
+        user = await AsyncAuthService.get_user_by_email(db, login_data.email)
+
+        if not user:
+            return None
+
+        valid, new_hash = await password_hash_pool.verify(login_data.password, user.password_hash)
+        if not valid:
+            return None
+
+        # Transparently upgrade hashes created with a different cost factor
+        if new_hash:
+            user.password_hash = new_hash
+            await db.commit()
+
+        return user
+
+    @staticmethod
+    async def login_user(db: AsyncSession, login_data: UserLogin) -> Token:
+        """Login user and return JWT token"""
+        user = await AsyncAuthService.authenticate_user(db, login_data)
+
+        if not user:
+            raise HTTPException(
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                detail="Incorrect email or password",
+                headers={"WWW-Authenticate": "Bearer"},
+            )
+
+        if not user.is_active:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Inactive user account"
+            )
+
+        return AuthService.issue_token(user)
+
+    @staticmethod
+    async def get_cached_user(db: AsyncSession, email: str, user_id: Optional[str] = None) -> Optional[CurrentUser]:
+        """Get a snapshot of the user by email through the authenticated user cache"""
+        user = user_cache.get(email)
+        if user is not None and (user_id is None or str(user.id) == user_id):
+            return user
+
+        db_user = await AsyncAuthService.get_user_by_email(db, email)
+        if db_user is None:
+            return None
+        # Cached as an immutable snapshot: ORM instances are bound to this request's session
+        user = CurrentUser.model_validate(db_user)
+        user_cache.set(email, user)
+        return user
+
+    @staticmethod
+    async def set_user_active(db: AsyncSession, user: User, is_active: bool) -> User:
+        """Activate or deactivate a user (cached sessions are invalidated on flush)"""
+        user.is_active = is_active
+        await db.commit()
+        await db.refresh(user)
+        return user
+
+    @staticmethod
+    async def get_user_by_email(db: AsyncSession, email: str) -> Optional[User]:
+        """Get user by email"""
+        result = await db.execute(select(User).filter(User.email == email))
+        return result.scalars().first()
+
+    @staticmethod
+    async def get_user_by_id(db: AsyncSession, user_id: str) -> Optional[User]:
+        """Get user by ID"""
+        result = await db.execute(select(User).filter(User.id == user_id))
+        return result.scalars().first()
@@ -0,0 +1,233 @@
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import and_, select
+from fastapi import HTTPException, status
+from typing import List, Optional, Sequence, Tuple
+import orjson
+import uuid
+from app.models.product import Product
+from app.schemas.user import CurrentUser
+from app.schemas.product import (
+    ProductCreate, ProductUpdate, ProductSearchParams, ProductListResponse,
+    BulkPriceUpdateRequest, BulkPriceUpdateResponse, BulkProductCreateRequest, BulkProductCreateResponse
+)
+from app.services.product_service import (
+    ProductService, product_count_cache, product_response_cache, CATEGORIES_CACHE_KEY,
+    searchable_query_cache, ESTIMATE_ROWS_SQL, TSQUERY_NODES_SQL, BULK_PRICE_UPDATE_SQL, ALLOCATE_PRODUCT_IDS_SQL, BULK_CREATE_SQL
+)
+
+async def invalidate_product_reads() -> None:
+    """Drop cached totals and responses after a product write"""
+    product_count_cache.clear()
+    await product_response_cache.clear()
+
+def _parse_uuid(value: str) -> Optional[uuid.UUID]:
+    try:
+        return uuid.UUID(str(value))
+    except ValueError:
+        return None
+
+class AsyncProductService:
+    """Async (AsyncSession) counterpart of ProductService for event-loop handlers"""
+
+    @staticmethod
+    async def get_products(
+        db: AsyncSession,
+        search_params: ProductSearchParams,
+        current_user: Optional[CurrentUser] = None
+    ) -> ProductListResponse:
+        """Get products with search and pagination"""
+        rows, total, total_is_estimate, ranked = await AsyncProductService._fetch_listing(db, search_params)
+        return ProductService.build_list_response(rows, total, total_is_estimate, search_params, ranked)
+
+    @staticmethod
+    async def get_products_json(db: AsyncSession, search_params: ProductSearchParams) -> str:
+        """Serialized listing, served from the response cache when possible"""
+        key = ProductService.listing_cache_key(search_params)
+        cached = await product_response_cache.get(key)
+        if cached is not None:
+            return cached
+
+        rows, total, total_is_estimate, ranked = await AsyncProductService._fetch_listing(db, search_params)
+        body = ProductService.build_list_json(rows, total, total_is_estimate, search_params, ranked).decode("utf-8")
+        await product_response_cache.set(key, body)
+        return body
+
+    @staticmethod
+    async def _fetch_listing(db: AsyncSession, search_params: ProductSearchParams) -> Tuple[Sequence, Optional[int], bool, bool]:
+        """Run the listing query; returns (rows incl. look-ahead, total, total_is_estimate, ranked)"""
+        filtered, page_query, ranked = ProductService.build_listing_query(
+            search_params, await AsyncProductService._searchable(db, search_params)
+        )
+
+        # Get total count (cached per filter signature, skipped when not requested)
+        total = None
+        total_is_estimate = False
+        if search_params.include_total:
+            total, total_is_estimate = await AsyncProductService._count_products(
+                db, filtered, search_params
+            )
+
+        rows = (await db.execute(page_query)).all()
+        return rows, total, total_is_estimate, ranked
+
+    @staticmethod
+    async def _searchable(db: AsyncSession, search_params: ProductSearchParams) -> bool:
+        """Whether the search text keeps any lexeme after stopword removal"""
+        prefix_query, searchable = ProductService.search_probe(search_params)
+        if searchable is None:
+            searchable = bool((await db.execute(TSQUERY_NODES_SQL, {"query": prefix_query})).scalar())
+            searchable_query_cache.set(prefix_query, searchable)
+        return searchable
+
+    @staticmethod
+    async def _count_products(db: AsyncSession, filtered, search_params: ProductSearchParams) -> Tuple[int, bool]:
+        """Return (total, is_estimate) for the filtered listing"""
+        signature = ProductService.count_signature(search_params)
+        cached = product_count_cache.get(signature)
+        if cached is not None:
+            return cached
+
+        result = None
+        if all(value is None for value in signature):
+            result = ProductService.estimate_result((await db.execute(ESTIMATE_ROWS_SQL)).scalar())
+
+        if result is None:
+            result = ((await db.execute(ProductService.count_statement(filtered))).scalar(), False)
+
+        product_count_cache.set(signature, result)
+        return result
+
+    @staticmethod
+    async def get_product_by_id(db: AsyncSession, product_id: str) -> Optional[Product]:
+        """Get product by UUID"""
+        product_uuid = _parse_uuid(product_id)
+        if product_uuid is None:
+            return None
+        result = await db.execute(
+            select(Product).filter(and_(Product.id == product_uuid, Product.is_active == True))
+        )
+        return result.scalars().first()
+
+    @staticmethod
+    async def get_product_by_product_id(db: AsyncSession, product_id: int) -> Optional[Product]:
+        """Get product by product_id (integer)"""
+        result = await db.execute(
+            select(Product).filter(and_(Product.product_id == product_id, Product.is_active == True))
+        )
+        return result.scalars().first()
+
+    @staticmethod
+    async def create_product(
+        db: AsyncSession,
+        product_data: ProductCreate,
+        current_user: CurrentUser
+    ) -> Product:
+        """Create a new product"""
+        # product_id is allocated from products_product_id_seq on insert
+        db_product = Product(
+            **product_data.dict(),
+            created_by=current_user.id,
+            is_active=True
+        )
+
+        db.add(db_product)
+        await db.commit()
+        await db.refresh(db_product)
+        await invalidate_product_reads()
+        return db_product
+
+    @staticmethod
+    async def update_product(
+        db: AsyncSession,
+        product_id: str,
+        product_data: ProductUpdate,
+        current_user: CurrentUser
+    ) -> Optional[Product]:
+        """Update an existing product"""
+        product = await AsyncProductService.get_product_by_id(db, product_id)
+
+        if not product:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Product not found"
+            )
+
+        # Update product fields
+        update_data = product_data.dict(exclude_unset=True)
+        for field, value in update_data.items():
+            setattr(product, field, value)
+
+        await db.commit()
+        await db.refresh(product)
+        await invalidate_product_reads()
+        return product
+
+    @staticmethod
+    async def delete_product(db: AsyncSession, product_id: str, current_user: CurrentUser) -> bool:
+        """Soft delete a product"""
+        product = await AsyncProductService.get_product_by_id(db, product_id)
+
+        if not product:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Product not found"
+            )
+
+        # Soft delete
+        product.is_active = False
+        await db.commit()
+        await invalidate_product_reads()
+        return True
+
+    @staticmethod
+    async def get_categories(db: AsyncSession) -> List[str]:
+        """Get all unique product categories"""
+        result = await db.execute(
+            select(Product.category).filter(Product.is_active == True).distinct()
+        )
+        return list(result.scalars().all())
+
+    @staticmethod
+    async def get_categories_json(db: AsyncSession) -> str:
+        """Serialized category list, served from the response cache when possible"""
+        cached = await product_response_cache.get(CATEGORIES_CACHE_KEY)
+        if cached is not None:
+            return cached
+
+        body = orjson.dumps(await AsyncProductService.get_categories(db)).decode("utf-8")
+        await product_response_cache.set(CATEGORIES_CACHE_KEY, body)
+        return body
+
+    @staticmethod
+    async def bulk_create_products(
+        db: AsyncSession,
+        request: BulkProductCreateRequest,
+        current_user: CurrentUser
+    ) -> BulkProductCreateResponse:
+        """Create many products with one id allocation and one multi-row INSERT"""
+        product_ids = (await db.execute(
+            ALLOCATE_PRODUCT_IDS_SQL, {"count": len(request.products)}
+        )).scalars().all()
+        params, created = ProductService.bulk_create_params(request, product_ids, current_user)
+        await db.execute(BULK_CREATE_SQL, params)
+        await db.commit()
+        await invalidate_product_reads()
+        return ProductService.build_bulk_create_response(created)
+
+    @staticmethod
+    async def bulk_update_prices(
+        db: AsyncSession,
+        request: BulkPriceUpdateRequest,
+        current_user: CurrentUser
+    ) -> BulkPriceUpdateResponse:
+        """Bulk update product prices with set-based UPDATE statements"""
+        items, batches = ProductService.bulk_update_batches(request)
+
+        updated_ids = set()
+        for params in batches:
+            rows = await db.execute(BULK_PRICE_UPDATE_SQL, params)
+            updated_ids.update(row[0] for row in rows)
+
+        await db.commit()
+        await invalidate_product_reads()
+        return ProductService.build_bulk_update_response(items, updated_ids)
@@ -1,11 +1,27 @@
 from sqlalchemy.orm import Session
+from sqlalchemy import event
 from fastapi import HTTPException, status
 from datetime import timedelta
 from typing import Optional
 from app.models.user import User
 from app.schemas.user import UserCreate, UserLogin, Token
-from app.utils.security import verify_password, get_password_hash, create_access_token
+from app.utils.security import verify_and_update_password, get_password_hash, create_access_token
 from app.config import settings
+from app.utils.cache import TTLCache
+
+# Immutable snapshots (CurrentUser) of authenticated users keyed by token
+# subject (email), so a request with a valid token does not need a users
+# lookup. Entries are dropped whenever the user row changes in this process;
+# other workers converge within the TTL.
+user_cache = TTLCache(
+    maxsize=settings.USER_CACHE_SIZE,
+    ttl=settings.USER_CACHE_TTL
+)
+
+@event.listens_for(User, "after_update")
+@event.listens_for(User, "after_delete")
+def _invalidate_cached_user(mapper, connection, target: User) -> None:
+    user_cache.delete(target.email)
 
 class AuthService:
     """Authentication service for user management"""
@@ -45,9 +61,15 @@ class AuthService:
         if not user:
             return None
         
-        if not verify_password(login_data.password, user.password_hash):
+        valid, new_hash = verify_and_update_password(login_data.password, user.password_hash)
+        if not valid:
             return None
         
+        # Transparently upgrade hashes created with a different cost factor
+        if new_hash:
+            user.password_hash = new_hash
+            db.commit()
+        
         return user
     
     @staticmethod
@@ -68,10 +90,17 @@ class AuthService:
                 detail="Inactive user account"
             )
         
-        # Create access token
+        return AuthService.issue_token(user)
+    
+    @staticmethod
+    def issue_token(user: User) -> Token:
+        """Create the access token response for an authenticated user"""
         access_token_expires = timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
+        claims = {"sub": user.email}
+        if settings.AUTH_TOKEN_CLAIMS:
+            claims["uid"] = str(user.id)
         access_token = create_access_token(
-            data={"sub": user.email}, 
+            data=claims, 
             expires_delta=access_token_expires
         )
         
@@ -81,6 +110,14 @@ class AuthService:
             expires_in=settings.ACCESS_TOKEN_EXPIRE_MINUTES * 60  # in seconds
         )
     
+    @staticmethod
+    def set_user_active(db: Session, user: User, is_active: bool) -> User:
+        """Activate or deactivate a user (cached sessions are invalidated on flush)"""
+        user.is_active = is_active
+        db.commit()
+        db.refresh(user)
+        return user
+    
     @staticmethod
     def get_user_by_email(db: Session, email: str) -> Optional[User]:
         """Get user by email"""
@@ -0,0 +1,130 @@
+"""
+Vectorized price elasticity estimation.
+
+Elasticity is the slope of a log-log regression of the sales rate on price,
+ln(units per day) = a + b * ln(selling_price), over the intervals between
+consecutive price_history rows (units_sold there is a cumulative counter, so
+each interval's sales are the difference). Per-product least squares only
+needs each product's centered sums of squares Sxx and cross-products Sxy
+(b = Sxy / Sxx), which PostgreSQL aggregates in one GROUP BY. Everything
+after that runs on NumPy arrays for the whole catalog at once:
+
+* a category slope pooled within products (sum Sxy / sum Sxx), shrunk toward
+  the configured demand_elasticity factor table, and
+* per-product slopes shrunk toward their category, weighted by how much
+  price variation each product has actually seen (Sxx).
+"""
+from dataclasses import dataclass
+from typing import List, Optional
+import numpy as np
+from app.services.factor_tables import FactorTables, builtin_factor_tables
+
+# Prior strength in units of Sxx (sum of squared log-price deviations). A product
+# whose price moved about +/-10% over ten observations (Sxx ~ 0.1) gets equal
+# weight with its category.
+DEFAULT_SHRINKAGE = 0.1
+
+# Fitted elasticities are clamped to an economically plausible range
+MIN_ELASTICITY = -5.0
+MAX_ELASTICITY = -0.1
+
+ELASTICITY_ALGORITHM = "loglog-ols-shrinkage-v2"
+
+
+@dataclass
+class ElasticityStats:
+    """Per-product regression sufficient statistics (one row per product)"""
+    ids: np.ndarray             # Product UUIDs (object array)
+    category_codes: np.ndarray  # int32 index into ``categories``
+    categories: List[str]
+    observations: np.ndarray    # int64: usable sales intervals (price > 0, units sold > 0)
+    sxx: np.ndarray             # float64: sum (ln p - mean ln p)^2
+    sxy: np.ndarray             # float64: sum (ln p - mean ln p)(ln rate - mean ln rate)
+
+    def __len__(self) -> int:
+        return int(self.ids.shape[0])
+
+    @classmethod
+    def from_rows(cls, rows) -> "ElasticityStats":
+        """Build from ``(id, category, observations, sxx, sxy)`` rows"""
+        if not rows:
+            return cls(
+                ids=np.empty(0, dtype=object),
+                category_codes=np.empty(0, dtype=np.int32),
+                categories=[],
+                observations=np.empty(0, dtype=np.int64),
+                sxx=np.empty(0, dtype=np.float64),
+                sxy=np.empty(0, dtype=np.float64),
+            )
+
+        ids, category, observations, sxx, sxy = zip(*rows)
+        categories, codes = np.unique(np.asarray(category, dtype=object), return_inverse=True)
+        return cls(
+            ids=np.asarray(ids, dtype=object),
+            category_codes=codes.astype(np.int32),
+            categories=[str(c) for c in categories],
+            observations=np.asarray([n or 0 for n in observations], dtype=np.int64),
+            sxx=np.asarray([v or 0.0 for v in sxx], dtype=np.float64),
+            sxy=np.asarray([v or 0.0 for v in sxy], dtype=np.float64),
+        )
+
+
+@dataclass
+class ElasticityResult:
+    """Fitted elasticities aligned with the input stats"""
+    product_elasticity: np.ndarray     # per product, shrunk and clamped
+    category_elasticity: np.ndarray    # per category (aligned with ``categories``)
+    category_prior: np.ndarray         # per category factor table value
+    category_products_fitted: np.ndarray
+    category_observations: np.ndarray
+    products_fitted: int               # products with their own price variation
+
+
+def _shrunk_slope(sxy: np.ndarray, sxx: np.ndarray, prior: np.ndarray, shrinkage: float) -> np.ndarray:
+    """(sxy + k * prior) / (sxx + k), falling back to the prior where the denominator is 0"""
+    denominator = sxx + shrinkage
+    has_weight = denominator > 0
+    return np.where(
+        has_weight,
+        (sxy + shrinkage * prior) / np.where(has_weight, denominator, 1.0),
+        prior
+    )
+
+
+def fit_elasticities(
+    stats: ElasticityStats,
+    shrinkage: float = DEFAULT_SHRINKAGE,
+    factors: Optional[FactorTables] = None
+) -> ElasticityResult:
+    """Fit per-category and per-product log-log elasticities with shrinkage"""
+    n_categories = len(stats.categories)
+    codes = stats.category_codes
+
+    prior = (factors or builtin_factor_tables()).compile(stats.categories).demand_elasticity
+
+    # Only products whose price actually varied identify a slope
+    informative = (stats.observations >= 2) & (stats.sxx > 0)
+    sxx = np.where(informative, stats.sxx, 0.0)
+    sxy = np.where(informative, stats.sxy, 0.0)
+
+    # Within-product pooled slope per category, shrunk toward the static prior;
+    # with no shrinkage, categories without variation keep the prior
+    category_sxx = np.bincount(codes, weights=sxx, minlength=n_categories)
+    category_sxy = np.bincount(codes, weights=sxy, minlength=n_categories)
+    category = _shrunk_slope(category_sxy, category_sxx, prior, shrinkage)
+    category = np.clip(category, MIN_ELASTICITY, MAX_ELASTICITY)
+
+    # Product slope sxy/sxx weighted by sxx, i.e. (sxy + k * b_cat) / (sxx + k);
+    # products without variation get their category value
+    category_per_product = category[codes] if len(stats) else np.empty(0, dtype=np.float64)
+    product = _shrunk_slope(sxy, sxx, category_per_product, shrinkage)
+    product = np.clip(product, MIN_ELASTICITY, MAX_ELASTICITY)
+
+    return ElasticityResult(
+        product_elasticity=np.round(product, 3),
+        category_elasticity=np.round(category, 3),
+        category_prior=prior,
+        category_products_fitted=np.bincount(codes, weights=informative, minlength=n_categories).astype(np.int64),
+        category_observations=np.bincount(codes, weights=stats.observations, minlength=n_categories).astype(np.int64),
+        products_fitted=int(informative.sum()),
+    )
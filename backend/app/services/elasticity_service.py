@@ -0,0 +1,135 @@
+from sqlalchemy.orm import Session
+from sqlalchemy import text
+from sqlalchemy.dialects.postgresql import insert
+from typing import List
+import time
+from app.models.elasticity import CategoryElasticity
+from app.schemas.pricing import ElasticityFitRequest, ElasticityFitResponse, CategoryElasticityItem
+from app.services.elasticity_engine import ElasticityStats, fit_elasticities, ELASTICITY_ALGORITHM
+from app.services.factor_service import factor_registry
+
+# Rows per set-based elasticity UPDATE
+WRITE_BATCH_SIZE = 20000
+
+# Intervals shorter than this are not used: a units_sold update landing moments
+# after a price change would otherwise read as an extreme sales rate
+MIN_INTERVAL_SECONDS = 3600
+
+# price_history holds the cumulative units_sold counter each time price or
+# units changed. Sales between consecutive rows, per day elapsed, are the
+# demand at the price in effect over that interval (the earlier row's price).
+# Per-product log-log regression sums over those intervals are aggregated in
+# PostgreSQL so only one row per product reaches Python. Intervals without
+# sales (or with a counter reset) have no log and are left out.
+HISTORY_STATS_SQL = """
+WITH intervals AS (
+    SELECT
+        h.product_id,
+        lag(h.selling_price) OVER w AS price,
+        h.units_sold - lag(h.units_sold) OVER w AS units,
+        extract(epoch FROM h.recorded_at - lag(h.recorded_at) OVER w) AS seconds
+    FROM price_history h
+    JOIN products p ON p.id = h.product_id
+    WHERE h.recorded_at >= now() - make_interval(days => :lookback_days)
+      AND p.is_active = true {category_filter}
+    WINDOW w AS (PARTITION BY h.product_id ORDER BY h.recorded_at, h.id)
+), rates AS (
+    SELECT product_id, ln(price) AS log_price, ln(units * 86400.0 / seconds) AS log_rate
+    FROM intervals
+    WHERE price > 0 AND units > 0 AND seconds >= :min_interval_seconds
+)
+SELECT
+    p.id,
+    p.category,
+    regr_count(r.log_rate, r.log_price),
+    regr_sxx(r.log_rate, r.log_price),
+    regr_sxy(r.log_rate, r.log_price)
+FROM products p
+LEFT JOIN rates r ON r.product_id = p.id
+WHERE p.is_active = true {category_filter}
+GROUP BY p.id, p.category
+"""
+
+# Bumps updated_at like every other product write (it versions the row for ETags and
+# syncs). Values are rounded to the column's scale first so an unchanged fit is skipped.
+WRITE_ELASTICITY_SQL = text("""
+UPDATE products AS p SET price_elasticity = v.elasticity, updated_at = now()
+FROM unnest(CAST(:ids AS uuid[]), CAST(:elasticities AS numeric(6, 3)[])) AS v(id, elasticity)
+WHERE p.id = v.id AND p.price_elasticity IS DISTINCT FROM v.elasticity
+""")
+
+class ElasticityService:
+    """Batch price elasticity fitting from price_history"""
+
+    @staticmethod
+    def fit(db: Session, request: ElasticityFitRequest) -> ElasticityFitResponse:
+        """Fit per-product and per-category elasticities and store them"""
+        started = time.perf_counter()
+
+        params = {"lookback_days": request.lookback_days, "min_interval_seconds": MIN_INTERVAL_SECONDS}
+        category_filter = ""
+        if request.category:
+            category_filter = "AND p.category = :category"
+            params["category"] = request.category
+
+        rows = db.execute(text(HISTORY_STATS_SQL.format(category_filter=category_filter)), params).all()
+        stats = ElasticityStats.from_rows(rows)
+        result = fit_elasticities(stats, request.shrinkage, factor_registry.current())
+
+        updated = 0
+        ids = [str(pid) for pid in stats.ids]
+        elasticities = result.product_elasticity.tolist()
+        for start in range(0, len(ids), WRITE_BATCH_SIZE):
+            end = start + WRITE_BATCH_SIZE
+            updated += db.execute(
+                WRITE_ELASTICITY_SQL,
+                {"ids": ids[start:end], "elasticities": elasticities[start:end]}
+            ).rowcount
+
+        categories = [
+            CategoryElasticityItem(
+                category=name,
+                elasticity=float(result.category_elasticity[i]),
+                prior_elasticity=float(result.category_prior[i]),
+                products_fitted=int(result.category_products_fitted[i]),
+                observations=int(result.category_observations[i]),
+            )
+            for i, name in enumerate(stats.categories)
+        ]
+        if categories:
+            statement = insert(CategoryElasticity).values([item.model_dump() for item in categories])
+            db.execute(statement.on_conflict_do_update(
+                index_elements=[CategoryElasticity.category],
+                set_={
+                    "elasticity": statement.excluded.elasticity,
+                    "prior_elasticity": statement.excluded.prior_elasticity,
+                    "products_fitted": statement.excluded.products_fitted,
+                    "observations": statement.excluded.observations,
+                    "fitted_at": statement.excluded.fitted_at,
+                }
+            ))
+
+        db.commit()
+
+        return ElasticityFitResponse(
+            products_updated=updated,
+            products_fitted=result.products_fitted,
+            algorithm=ELASTICITY_ALGORITHM,
+            duration_ms=round((time.perf_counter() - started) * 1000, 2),
+            categories=categories
+        )
+
+    @staticmethod
+    def get_category_elasticities(db: Session) -> List[CategoryElasticityItem]:
+        """Stored category elasticities from the last fit"""
+        rows = db.query(CategoryElasticity).order_by(CategoryElasticity.category).all()
+        return [
+            CategoryElasticityItem(
+                category=row.category,
+                elasticity=float(row.elasticity),
+                prior_elasticity=float(row.prior_elasticity),
+                products_fitted=row.products_fitted,
+                observations=row.observations,
+            )
+            for row in rows
+        ]
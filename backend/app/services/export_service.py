@@ -0,0 +1,212 @@
+import asyncio
+import csv
+import io
+from typing import AsyncIterator, Callable, List, Optional, Sequence
+import orjson
+from sqlalchemy import select, true, Select
+from sqlalchemy.orm import Session
+from app.database import AsyncSessionLocal
+from app.models.product import Product
+from app.models.forecast import DemandForecast
+
+# Rows fetched per round trip from the server-side cursor (and per Parquet row group)
+EXPORT_BATCH_SIZE = 5000
+
+EXPORT_FORMATS = {
+    "csv": "text/csv; charset=utf-8",
+    "ndjson": "application/x-ndjson",
+    "parquet": "application/vnd.apache.parquet",
+}
+
+# Most recent forecast run per product: its first (nearest) projected point
+latest_forecast = (
+    select(
+        DemandForecast.forecasted_demand.label("forecast_demand"),
+        DemandForecast.price_point.label("forecast_price_point"),
+        DemandForecast.forecast_date.label("forecast_date"),
+        DemandForecast.forecast_period.label("forecast_period"),
+    )
+    .where(DemandForecast.product_id == Product.id)
+    .order_by(DemandForecast.created_at.desc(), DemandForecast.forecast_date)
+    .limit(1)
+    .lateral("latest_forecast")
+)
+
+EXPORT_COLUMNS = (
+    Product.id,
+    Product.product_id,
+    Product.name,
+    Product.category,
+    Product.cost_price,
+    Product.selling_price,
+    Product.optimized_price,
+    Product.stock_available,
+    Product.units_sold,
+    Product.customer_rating,
+    Product.demand_forecast,
+    latest_forecast.c.forecast_demand,
+    latest_forecast.c.forecast_price_point,
+    latest_forecast.c.forecast_date,
+    latest_forecast.c.forecast_period,
+    Product.updated_at,
+)
+EXPORT_FIELDS = [column.key for column in EXPORT_COLUMNS]
+
+
+def _parquet_schema():
+    import pyarrow as pa
+    money = pa.decimal128(10, 2)
+    return pa.schema([
+        ("id", pa.string()),
+        ("product_id", pa.int32()),
+        ("name", pa.string()),
+        ("category", pa.string()),
+        ("cost_price", money),
+        ("selling_price", money),
+        ("optimized_price", money),
+        ("stock_available", pa.int32()),
+        ("units_sold", pa.int32()),
+        ("customer_rating", pa.decimal128(3, 2)),
+        ("demand_forecast", pa.int32()),
+        ("forecast_demand", money),
+        ("forecast_price_point", money),
+        ("forecast_date", pa.date32()),
+        ("forecast_period", pa.string()),
+        ("updated_at", pa.timestamp("us", tz="UTC")),
+    ])
+
+
+class _ChunkSink(io.RawIOBase):
+    """Write-only file object whose contents are drained after every row group"""
+
+    def __init__(self):
+        self._chunks: List[bytes] = []
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data) -> int:
+        self._chunks.append(bytes(data))
+        return len(data)
+
+    def drain(self) -> bytes:
+        data = b"".join(self._chunks)
+        self._chunks = []
+        return data
+
+
+class ExportService:
+    """Streaming catalog export over a server-side cursor"""
+
+    @staticmethod
+    def parquet_available() -> bool:
+        try:
+            import pyarrow  # noqa: F401
+            import pyarrow.parquet  # noqa: F401
+        except ImportError:
+            return False
+        return True
+
+    @staticmethod
+    def build_export_query(category: Optional[str] = None, include_inactive: bool = False) -> Select:
+        query = select(*EXPORT_COLUMNS).select_from(Product).outerjoin(latest_forecast, true())
+        if not include_inactive:
+            query = query.filter(Product.is_active == True)
+        if category:
+            query = query.filter(Product.category == category)
+        return query.order_by(Product.product_id)
+
+    @staticmethod
+    async def _batches(query: Select) -> AsyncIterator[Sequence]:
+        # Own session: the stream outlives the request handler
+        async with AsyncSessionLocal() as db:
+            result = await db.stream(query.execution_options(yield_per=EXPORT_BATCH_SIZE))
+            async for rows in result.partitions():
+                yield rows
+
+    @staticmethod
+    def stream(export_format: str, category: Optional[str] = None, include_inactive: bool = False) -> AsyncIterator[bytes]:
+        """Yield the export in ``export_format`` one batch at a time"""
+        query = ExportService.build_export_query(category, include_inactive)
+        return ExportService._format(export_format, ExportService._batches(query))
+
+    @staticmethod
+    def write_file(
+        db: Session,
+        path: str,
+        export_format: str,
+        category: Optional[str] = None,
+        include_inactive: bool = False,
+        progress: Optional[Callable[[int], None]] = None
+    ) -> int:
+        """Write the export to ``path`` over a sync session (background jobs); returns rows written"""
+        query = ExportService.build_export_query(category, include_inactive)
+        rows_written = 0
+
+        async def batches() -> AsyncIterator[Sequence]:
+            nonlocal rows_written
+            for rows in db.execute(query.execution_options(yield_per=EXPORT_BATCH_SIZE)).partitions():
+                yield rows
+                rows_written += len(rows)
+                if progress:
+                    progress(rows_written)
+
+        async def write() -> None:
+            with open(path, "wb") as out:
+                async for chunk in ExportService._format(export_format, batches()):
+                    out.write(chunk)
+
+        asyncio.run(write())
+        return rows_written
+
+    @staticmethod
+    def _format(export_format: str, batches: AsyncIterator[Sequence]) -> AsyncIterator[bytes]:
+        if export_format == "csv":
+            return ExportService._csv(batches)
+        if export_format == "ndjson":
+            return ExportService._ndjson(batches)
+        return ExportService._parquet(batches)
+
+    @staticmethod
+    async def _csv(batches: AsyncIterator[Sequence]) -> AsyncIterator[bytes]:
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        writer.writerow(EXPORT_FIELDS)
+        async for rows in batches:
+            writer.writerows(rows)
+            yield buffer.getvalue().encode("utf-8")
+            buffer.seek(0)
+            buffer.truncate()
+        if buffer.tell():
+            yield buffer.getvalue().encode("utf-8")
+
+    @staticmethod
+    async def _ndjson(batches: AsyncIterator[Sequence]) -> AsyncIterator[bytes]:
+        async for rows in batches:
+            yield b"".join(
+                orjson.dumps(dict(zip(EXPORT_FIELDS, row)), default=str, option=orjson.OPT_UTC_Z) + b"\n"
+                for row in rows
+            )
+
+    @staticmethod
+    async def _parquet(batches: AsyncIterator[Sequence]) -> AsyncIterator[bytes]:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        schema = _parquet_schema()
+        sink = _ChunkSink()
+        writer = pq.ParquetWriter(sink, schema, compression="snappy")
+        try:
+            async for rows in batches:
+                columns = list(zip(*rows))
+                arrays = [
+                    pa.array([str(value) for value in columns[i]] if field.name == "id" else columns[i], type=field.type)
+                    for i, field in enumerate(schema)
+                ]
+                writer.write_table(pa.Table.from_arrays(arrays, schema=schema))
+                chunk = sink.drain()
+                if chunk:
+                    yield chunk
+        finally:
+            writer.close()
+        yield sink.drain()
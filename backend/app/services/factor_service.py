@@ -0,0 +1,146 @@
+import logging
+import threading
+import time
+from typing import List, Optional
+from fastapi import HTTPException, status
+from sqlalchemy import update, func
+from sqlalchemy.orm import Session
+from app.config import settings
+from app.database import SessionLocal
+from app.models.pricing_factor import PricingFactorVersion
+from app.schemas.user import CurrentUser
+from app.schemas.pricing import FactorVersionCreate, FactorVersionResponse
+from app.services.factor_tables import FactorTables, builtin_factor_tables
+
+logger = logging.getLogger(__name__)
+
+class FactorRegistry:
+    """
+    Process-wide active factor tables. The active version number is re-checked
+    at most every ``reload_seconds``; a changed version is loaded (and compiled
+    lazily on first use), so activating a version reaches every API and worker
+    process without a restart.
+    """
+
+    def __init__(self, reload_seconds: float):
+        self.reload_seconds = reload_seconds
+        self._tables: FactorTables = builtin_factor_tables()
+        self._checked_at: Optional[float] = None
+        self._lock = threading.Lock()
+
+    def current(self) -> FactorTables:
+        """Active factor tables (built-in tables until a version is activated)"""
+        now = time.monotonic()
+        if self._checked_at is not None and now - self._checked_at < self.reload_seconds:
+            return self._tables
+
+        with self._lock:
+            if self._checked_at is None or now - self._checked_at >= self.reload_seconds:
+                try:
+                    self._reload()
+                except Exception:
+                    # Keep serving the loaded tables; retried on the next interval
+                    logger.exception("Reloading pricing factor tables failed")
+                self._checked_at = now
+        return self._tables
+
+    def invalidate(self) -> None:
+        """Re-check the active version on the next ``current`` call"""
+        self._checked_at = None
+
+    def _reload(self) -> None:
+        # Own short session: a failed check must not abort the caller's transaction
+        session = SessionLocal()
+        try:
+            version = session.query(PricingFactorVersion.version).filter(
+                PricingFactorVersion.is_active == True
+            ).scalar()
+            if version is None:
+                self._tables = builtin_factor_tables()
+            elif version != self._tables.version:
+                row = session.get(PricingFactorVersion, version)
+                self._tables = FactorTables.from_document(row.version, row.factors)
+                logger.info("Loaded pricing factor tables version %s", version)
+        finally:
+            session.close()
+
+factor_registry = FactorRegistry(reload_seconds=settings.FACTOR_RELOAD_SECONDS)
+
+class FactorService:
+    """Versioned category factor tables"""
+
+    @staticmethod
+    def _response(tables: FactorTables, row: Optional[PricingFactorVersion] = None) -> FactorVersionResponse:
+        document = tables.to_document()
+        return FactorVersionResponse(
+            version=tables.version,
+            tables=document["tables"],
+            defaults=document["defaults"],
+            note=row.note if row else "Built-in tables",
+            is_active=row.is_active if row else True,
+            created_at=row.created_at if row else None,
+            activated_at=row.activated_at if row else None
+        )
+
+    @staticmethod
+    def get_active(db: Session) -> FactorVersionResponse:
+        row = db.query(PricingFactorVersion).filter(PricingFactorVersion.is_active == True).first()
+        if row is None:
+            return FactorService._response(builtin_factor_tables())
+        return FactorService._response(FactorTables.from_document(row.version, row.factors), row)
+
+    @staticmethod
+    def get_version(db: Session, version: int) -> Optional[FactorVersionResponse]:
+        row = db.get(PricingFactorVersion, version)
+        if row is None:
+            return None
+        return FactorService._response(FactorTables.from_document(row.version, row.factors), row)
+
+    @staticmethod
+    def list_versions(db: Session) -> List[PricingFactorVersion]:
+        return db.query(PricingFactorVersion).order_by(PricingFactorVersion.version.desc()).all()
+
+    @staticmethod
+    def create_version(db: Session, request: FactorVersionCreate, user: Optional[CurrentUser] = None) -> FactorVersionResponse:
+        """Store a new version of the tables (optionally activating it)"""
+        row = PricingFactorVersion(
+            factors={"tables": request.tables.model_dump(), "defaults": request.defaults.model_dump()},
+            note=request.note,
+            is_active=False,
+            created_by=user.id if user else None
+        )
+        db.add(row)
+        db.flush()
+        if request.activate:
+            FactorService._activate(db, row.version)
+        db.commit()
+        db.refresh(row)
+        factor_registry.invalidate()
+        return FactorService._response(FactorTables.from_document(row.version, row.factors), row)
+
+    @staticmethod
+    def activate(db: Session, version: int) -> FactorVersionResponse:
+        """Make ``version`` the active tables (also used to roll back)"""
+        if db.get(PricingFactorVersion, version) is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Factor version not found"
+            )
+        FactorService._activate(db, version)
+        db.commit()
+        factor_registry.invalidate()
+        return FactorService.get_version(db, version)
+
+    @staticmethod
+    def _activate(db: Session, version: int) -> None:
+        # Two statements: the partial unique index allows one active row at any moment
+        db.execute(
+            update(PricingFactorVersion)
+            .where(PricingFactorVersion.is_active == True, PricingFactorVersion.version != version)
+            .values(is_active=False)
+        )
+        db.execute(
+            update(PricingFactorVersion)
+            .where(PricingFactorVersion.version == version, PricingFactorVersion.is_active == False)
+            .values(is_active=True, activated_at=func.now())
+        )
@@ -0,0 +1,122 @@
+"""
+Compiled category factor tables.
+
+The per-category factors (competitive adjustment, demand elasticity, market
+condition, demand multiplier and yearly growth curves) are versioned
+configuration. The engines never look them up by category name per product:
+a table set is compiled once per distinct category list into float arrays
+indexed by category code, and the engines gather from those arrays.
+"""
+import threading
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+import numpy as np
+
+# One value per category
+SCALAR_TABLES = (
+    "competitive_adjustment",
+    "demand_elasticity",
+    "market_condition",
+    "category_demand_multiplier",
+)
+GROWTH_TABLE = "growth_rates"  # One yearly curve per category
+
+# Compiled category lists kept per table set
+MAX_COMPILED = 64
+
+
+@dataclass
+class CompiledFactors:
+    """Factor arrays aligned with a catalog's category codes"""
+    categories: Tuple[str, ...]
+    competitive_adjustment: np.ndarray
+    demand_elasticity: np.ndarray
+    market_condition: np.ndarray
+    category_demand_multiplier: np.ndarray
+    growth_curves: List[List[float]]
+    _growth: Dict[int, np.ndarray] = field(default_factory=dict)
+
+    def growth_matrix(self, years: int) -> np.ndarray:
+        """``(categories, years)`` growth curves; horizons past a curve repeat its last rate"""
+        matrix = self._growth.get(years)
+        if matrix is None:
+            matrix = np.empty((len(self.categories), years), dtype=np.float64)
+            for row, rates in enumerate(self.growth_curves):
+                matrix[row] = rates[:years] + [rates[-1]] * max(0, years - len(rates))
+            self._growth[years] = matrix
+        return matrix
+
+
+class FactorTables:
+    """One version of the factor tables: ``{table: {category: value}}`` plus per-table defaults"""
+
+    def __init__(self, version: int, tables: Dict[str, Dict[str, Any]], defaults: Dict[str, Any]):
+        self.version = version
+        self.tables = tables
+        self.defaults = defaults
+        self._compiled: Dict[Tuple[str, ...], CompiledFactors] = {}
+        self._lock = threading.Lock()
+
+    def compile(self, categories: Sequence[str]) -> CompiledFactors:
+        """Factor arrays for ``categories`` (memoized per category list)"""
+        key = tuple(categories)
+        compiled = self._compiled.get(key)
+        if compiled is not None:
+            return compiled
+
+        arrays = {
+            name: np.array(
+                [self.tables[name].get(category, self.defaults[name]) for category in key],
+                dtype=np.float64
+            )
+            for name in SCALAR_TABLES
+        }
+        growth = [list(self.tables[GROWTH_TABLE].get(category, self.defaults[GROWTH_TABLE])) for category in key]
+        compiled = CompiledFactors(categories=key, growth_curves=growth, **arrays)
+        with self._lock:
+            if len(self._compiled) >= MAX_COMPILED:
+                self._compiled.clear()
+            self._compiled[key] = compiled
+        return compiled
+
+    def to_document(self) -> Dict[str, Any]:
+        return {"tables": self.tables, "defaults": self.defaults}
+
+    @classmethod
+    def from_document(cls, version: int, document: Dict[str, Any]) -> "FactorTables":
+        return cls(version, document["tables"], document["defaults"])
+
+    def __getstate__(self):
+        # Sent to engine worker processes without the compiled cache
+        return {"version": self.version, "tables": self.tables, "defaults": self.defaults}
+
+    def __setstate__(self, state):
+        self.__init__(state["version"], state["tables"], state["defaults"])
+
+
+_builtin: Optional[FactorTables] = None
+
+def builtin_factor_tables() -> FactorTables:
+    """Version 0: the tables shipped with the engines (also the seed for the database)"""
+    global _builtin
+    if _builtin is None:
+        from app.services import pricing_engine as pe
+        from app.services import forecast_engine as fe
+        _builtin = FactorTables(
+            version=0,
+            tables={
+                "competitive_adjustment": dict(pe.COMPETITIVE_ADJUSTMENT),
+                "demand_elasticity": dict(pe.DEMAND_ELASTICITY),
+                "market_condition": dict(pe.MARKET_CONDITION),
+                "category_demand_multiplier": dict(pe.CATEGORY_DEMAND_MULTIPLIER),
+                GROWTH_TABLE: {name: list(rates) for name, rates in fe.GROWTH_RATES.items()},
+            },
+            defaults={
+                "competitive_adjustment": pe.DEFAULT_COMPETITIVE_ADJUSTMENT,
+                "demand_elasticity": pe.DEFAULT_DEMAND_ELASTICITY,
+                "market_condition": pe.DEFAULT_MARKET_CONDITION,
+                "category_demand_multiplier": pe.DEFAULT_DEMAND_MULTIPLIER,
+                GROWTH_TABLE: list(fe.DEFAULT_GROWTH_RATES),
+            },
+        )
+    return _builtin
@@ -0,0 +1,134 @@
+from sqlalchemy.orm import Session
+from sqlalchemy import insert, select
+from typing import List, Optional
+from datetime import date
+import time
+import uuid
+from app.models.product import Product
+from app.models.forecast import DemandForecast
+from app.schemas.forecast import (
+    ForecastRunRequest, ForecastRunResponse, ForecastPoint, ProductForecastResponse
+)
+from app.services.pricing_engine import CatalogArrays
+from app.services.forecast_engine import ForecastResult
+from app.services.pricing_service import PricingService
+from app.services.parallel_engine import engine_pool
+from app.services.factor_service import factor_registry
+
+# Forecast period written by the batch job
+YEARLY_PERIOD = "yearly"
+
+# Rows per multi-row INSERT batch
+INSERT_BATCH_SIZE = 10000
+
+class ForecastService:
+    """Batch demand forecasting and stored forecast reads"""
+
+    @staticmethod
+    def run_batch_forecast(db: Session, request: ForecastRunRequest) -> ForecastRunResponse:
+        """Project yearly demand for the catalog and replace the stored series"""
+        started = time.perf_counter()
+
+        catalog = PricingService.load_catalog(db, request.category)
+        factors = factor_registry.current()
+        result, shards = engine_pool.project_demand(catalog, request.years, factors)
+
+        # Replace previous yearly forecasts for the products in scope
+        stale = db.query(DemandForecast).filter(DemandForecast.forecast_period == YEARLY_PERIOD)
+        if request.category:
+            in_scope = select(Product.id).where(Product.category == request.category)
+            stale = stale.filter(DemandForecast.product_id.in_(in_scope))
+        stale.delete(synchronize_session=False)
+
+        written = ForecastService._insert_forecasts(db, catalog, result)
+        db.commit()
+
+        return ForecastRunResponse(
+            products_forecasted=len(catalog),
+            forecasts_written=written,
+            years=result.years,
+            factor_version=factors.version,
+            shards=shards,
+            duration_ms=round((time.perf_counter() - started) * 1000, 2)
+        )
+
+    @staticmethod
+    def replace_product_forecasts(db: Session, catalog: CatalogArrays, result: ForecastResult) -> int:
+        """Replace the stored yearly series of the products in ``catalog`` (caller commits)"""
+        ids = catalog.ids.tolist()
+        for start in range(0, len(ids), INSERT_BATCH_SIZE):
+            db.query(DemandForecast).filter(
+                DemandForecast.forecast_period == YEARLY_PERIOD,
+                DemandForecast.product_id.in_(ids[start:start + INSERT_BATCH_SIZE])
+            ).delete(synchronize_session=False)
+        return ForecastService._insert_forecasts(db, catalog, result)
+
+    @staticmethod
+    def _insert_forecasts(db: Session, catalog: CatalogArrays, result: ForecastResult) -> int:
+        """Multi-row INSERT of the yearly series; returns rows written"""
+        start_year = date.today().year
+        forecast_dates = [date(start_year + i, 1, 1) for i in range(result.years)]
+        demand = result.demand.tolist()
+        price = result.price.tolist()
+
+        written = 0
+        batch = []
+        for row, product_id in enumerate(catalog.ids):
+            for year in range(result.years):
+                batch.append({
+                    "product_id": product_id,
+                    "forecasted_demand": demand[row][year],
+                    "price_point": price[row][year],
+                    "forecast_date": forecast_dates[year],
+                    "forecast_period": YEARLY_PERIOD,
+                })
+            if len(batch) >= INSERT_BATCH_SIZE:
+                db.execute(insert(DemandForecast), batch)
+                written += len(batch)
+                batch = []
+
+        if batch:
+            db.execute(insert(DemandForecast), batch)
+            written += len(batch)
+        return written
+
+    @staticmethod
+    def get_product_forecasts(
+        db: Session,
+        product_ids: List[uuid.UUID],
+        period: str = YEARLY_PERIOD
+    ) -> List[ProductForecastResponse]:
+        """Get stored forecast series for the given products"""
+        rows = db.query(
+            DemandForecast.product_id,
+            DemandForecast.forecast_date,
+            DemandForecast.forecasted_demand,
+            DemandForecast.price_point
+        ).filter(
+            DemandForecast.product_id.in_(product_ids),
+            DemandForecast.forecast_period == period
+        ).order_by(DemandForecast.product_id, DemandForecast.forecast_date).all()
+
+        series = {}
+        for product_id, forecast_date, forecasted_demand, price_point in rows:
+            series.setdefault(product_id, []).append(ForecastPoint(
+                year=forecast_date.year,
+                forecast_date=forecast_date,
+                demand=float(forecasted_demand),
+                price_point=float(price_point)
+            ))
+
+        return [
+            ProductForecastResponse(product_id=product_id, forecast_period=period, forecasts=points)
+            for product_id, points in series.items()
+        ]
+
+    @staticmethod
+    def get_product_forecast(
+        db: Session,
+        product_id: uuid.UUID,
+        period: str = YEARLY_PERIOD
+    ) -> Optional[ProductForecastResponse]:
+        """Get the stored forecast series for a single product"""
+        forecasts = ForecastService.get_product_forecasts(db, [product_id], period)
+        return forecasts[0] if forecasts else None
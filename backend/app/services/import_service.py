@@ -0,0 +1,378 @@
+import csv
+import hashlib
+import io
+import logging
+import time
+from decimal import ROUND_HALF_UP, Decimal, InvalidOperation
+from typing import Callable, Iterator, List, Optional, Tuple
+import psycopg2
+from app.database import engine
+from app.models.category_stats import REFRESH_CATEGORY_STATS_SQL
+from app.schemas.imports import ImportSummary, ImportRowError
+from app.services.product_service import invalidate_product_reads
+
+logger = logging.getLogger(__name__)
+
+# Rows validated and loaded per transaction
+DEFAULT_CHUNK_SIZE = 50000
+
+# Rejected rows reported back in the summary
+MAX_REPORTED_ERRORS = 20
+
+# Largest value of the integer columns rows are copied into
+INT4_MAX = 2**31 - 1
+
+STAGING_COLUMNS = [
+    "line_no", "product_id", "name", "description", "cost_price", "selling_price",
+    "category", "stock_available", "units_sold", "customer_rating",
+    "demand_forecast", "optimized_price", "content_hash",
+]
+
+# Session-local staging table, emptied automatically at every commit
+STAGING_DDL = """
+CREATE TEMP TABLE IF NOT EXISTS products_import_staging (
+    line_no bigint,
+    product_id integer,
+    name varchar(255),
+    description text,
+    cost_price numeric(10, 2),
+    selling_price numeric(10, 2),
+    category varchar(100),
+    stock_available integer,
+    units_sold integer,
+    customer_rating numeric(3, 2),
+    demand_forecast integer,
+    optimized_price numeric(10, 2),
+    content_hash varchar(32)
+) ON COMMIT DELETE ROWS
+"""
+
+# product_ids present in the feed (incremental mode), kept across chunk commits
+SEEN_DDL = """
+CREATE TEMP TABLE IF NOT EXISTS products_import_seen (
+    product_id integer PRIMARY KEY
+)
+"""
+
+COPY_SQL = (
+    f"COPY products_import_staging ({', '.join(STAGING_COLUMNS)}) "
+    "FROM STDIN WITH (FORMAT csv)"
+)
+
+# Upsert the staged chunk; the last occurrence of a product_id in the chunk wins.
+# {changed_only} restricts updates to rows whose content hash differs.
+UPSERT_SQL = """
+WITH staged AS (
+    SELECT DISTINCT ON (product_id) *
+    FROM products_import_staging
+    ORDER BY product_id, line_no DESC
+), upserted AS (
+    INSERT INTO products (
+        id, product_id, name, description, cost_price, selling_price, category,
+        stock_available, units_sold, customer_rating, demand_forecast,
+        optimized_price, content_hash, is_active
+    )
+    SELECT
+        gen_random_uuid(), product_id, name, description, cost_price, selling_price, category,
+        stock_available, units_sold, customer_rating, demand_forecast,
+        optimized_price, content_hash, true
+    FROM staged
+    ON CONFLICT (product_id) DO UPDATE SET
+        name = EXCLUDED.name,
+        description = EXCLUDED.description,
+        cost_price = EXCLUDED.cost_price,
+        selling_price = EXCLUDED.selling_price,
+        category = EXCLUDED.category,
+        stock_available = EXCLUDED.stock_available,
+        units_sold = EXCLUDED.units_sold,
+        customer_rating = EXCLUDED.customer_rating,
+        demand_forecast = EXCLUDED.demand_forecast,
+        optimized_price = EXCLUDED.optimized_price,
+        content_hash = EXCLUDED.content_hash,
+        is_active = true,
+        updated_at = now()
+    {changed_only}
+    RETURNING (xmax = 0) AS inserted
+)
+SELECT
+    (SELECT count(*) FROM staged),
+    count(*) FILTER (WHERE inserted),
+    count(*) FILTER (WHERE NOT inserted)
+FROM upserted
+"""
+
+CHANGED_ONLY_SQL = (
+    "WHERE products.content_hash IS DISTINCT FROM EXCLUDED.content_hash "
+    "OR NOT products.is_active"
+)
+
+MARK_SEEN_SQL = """
+INSERT INTO products_import_seen (product_id)
+SELECT DISTINCT product_id FROM products_import_staging
+UNION
+SELECT unnest(%s::integer[])
+ON CONFLICT DO NOTHING
+"""
+
+# Soft-delete feed-managed products that were absent from the feed. Products
+# created through the API (created_by set) are never touched by imports.
+SOFT_DELETE_MISSING_SQL = """
+UPDATE products SET is_active = false, updated_at = now()
+WHERE is_active = true
+  AND created_by IS NULL
+  AND NOT EXISTS (
+      SELECT 1 FROM products_import_seen seen
+      WHERE seen.product_id = products.product_id
+  )
+"""
+
+# Feed rows bring their own product_ids: keep the API's id sequence ahead of them
+SYNC_PRODUCT_ID_SEQUENCE_SQL = """
+SELECT setval(
+    'products_product_id_seq',
+    GREATEST(
+        (SELECT COALESCE(max(product_id), 0) FROM products),
+        (SELECT last_value FROM products_product_id_seq)
+    )
+)
+"""
+
+# Read back from category_stats, refreshed once the import is loaded
+CATEGORY_SUMMARY_SQL = "SELECT category, products FROM category_stats ORDER BY category"
+
+ProgressCallback = Callable[[ImportSummary], None]
+
+
+def _parse_int(value: str, field: str, required: bool = True) -> Optional[int]:
+    value = (value or "").strip()
+    if not value:
+        if required:
+            raise ValueError(f"{field} is required")
+        return None
+    number = int(value)
+    if number < 0:
+        raise ValueError(f"{field} must be >= 0")
+    if number > INT4_MAX:
+        raise ValueError(f"{field} must be <= {INT4_MAX}")
+    return number
+
+
+def _parse_decimal(
+    value: str,
+    field: str,
+    required: bool = True,
+    maximum: Optional[Decimal] = None,
+    precision: int = 10,
+    scale: int = 2
+) -> Optional[Decimal]:
+    """Parse a value for a numeric(precision, scale) column, rounded as Postgres stores it"""
+    value = (value or "").strip()
+    if not value:
+        if required:
+            raise ValueError(f"{field} is required")
+        return None
+    try:
+        number = Decimal(value)
+    except InvalidOperation:
+        raise ValueError(f"{field} is not a number")
+    # NaN cannot be compared and Infinity does not fit the column
+    if not number.is_finite():
+        raise ValueError(f"{field} is not a number")
+    if number < 0 or (required and number == 0):
+        raise ValueError(f"{field} must be positive")
+    limit = Decimal(10) ** (precision - scale)
+    # Checked before rounding so quantize never exceeds the decimal context
+    if number >= limit:
+        raise ValueError(f"{field} must be < {limit}")
+    number = number.quantize(Decimal(1).scaleb(-scale), rounding=ROUND_HALF_UP)
+    if number >= limit:
+        raise ValueError(f"{field} must be < {limit}")
+    if required and number == 0:
+        raise ValueError(f"{field} must be positive")
+    if maximum is not None and number > maximum:
+        raise ValueError(f"{field} must be <= {maximum}")
+    return number
+
+
+def _parse_text(value: str, field: str, max_length: int) -> str:
+    value = (value or "").strip()
+    if not value:
+        raise ValueError(f"{field} is required")
+    if len(value) > max_length:
+        raise ValueError(f"{field} is longer than {max_length} characters")
+    return value
+
+
+def content_hash(values: Tuple) -> str:
+    """Stable hash of a validated row's content (everything but the line number)"""
+    canonical = "\x1f".join(
+        "" if value is None else f"{value:.2f}" if isinstance(value, Decimal) else str(value)
+        for value in values
+    )
+    return hashlib.md5(canonical.encode("utf-8")).hexdigest()
+
+
+def validate_row(line_no: int, row: dict) -> Tuple:
+    """Validate a CSV row and return it in STAGING_COLUMNS order (raises ValueError)"""
+    values = (
+        _parse_int(row.get("product_id"), "product_id"),
+        _parse_text(row.get("name"), "name", 255),
+        row.get("description") or None,
+        _parse_decimal(row.get("cost_price"), "cost_price"),
+        _parse_decimal(row.get("selling_price"), "selling_price"),
+        _parse_text(row.get("category"), "category", 100),
+        _parse_int(row.get("stock_available"), "stock_available"),
+        _parse_int(row.get("units_sold"), "units_sold"),
+        _parse_decimal(
+            row.get("customer_rating"), "customer_rating",
+            required=False, maximum=Decimal(5), precision=3
+        ),
+        _parse_int(row.get("demand_forecast"), "demand_forecast", required=False),
+        _parse_decimal(row.get("optimized_price"), "optimized_price", required=False),
+    )
+    return (line_no,) + values + (content_hash(values),)
+
+
+def read_chunks(csv_file_path: str, chunk_size: int) -> Iterator[List[Tuple[int, dict]]]:
+    """Stream (line number, row) chunks from a CSV file without loading it whole"""
+    with open(csv_file_path, "r", encoding="utf-8", newline="") as file:
+        reader = csv.DictReader(file)
+        chunk = []
+        for row in reader:
+            # Skip empty rows
+            if not row.get("product_id"):
+                continue
+            chunk.append((reader.line_num, row))
+            if len(chunk) >= chunk_size:
+                yield chunk
+                chunk = []
+        if chunk:
+            yield chunk
+
+
+class ImportService:
+    """Streaming CSV importer (COPY into staging, then upsert on product_id)"""
+
+    @staticmethod
+    def import_csv(
+        csv_file_path: str,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        progress: Optional[ProgressCallback] = None,
+        incremental: bool = False,
+        connection=None
+    ) -> ImportSummary:
+        """
+        Import products from a CSV file, committing one transaction per chunk.
+
+        In incremental mode only rows whose content hash changed are written,
+        and feed-managed products missing from the feed are soft-deleted.
+        ``connection`` is a DBAPI connection to run on (left open, e.g. a job's
+        pinned connection); by default one is taken from the engine.
+        """
+        summary = ImportSummary(incremental=incremental)
+        started = time.perf_counter()
+        upsert_sql = UPSERT_SQL.format(changed_only=CHANGED_ONLY_SQL if incremental else "")
+
+        owns_connection = connection is None
+        if owns_connection:
+            connection = engine.raw_connection()
+        try:
+            cursor = connection.cursor()
+            cursor.execute(STAGING_DDL)
+            if incremental:
+                cursor.execute(SEEN_DDL)
+                cursor.execute("TRUNCATE products_import_seen")
+            connection.commit()
+
+            for chunk in read_chunks(csv_file_path, chunk_size):
+                valid_rows, rejected_ids = ImportService._validate_chunk(chunk, summary)
+                if valid_rows:
+                    staged, inserted, updated = ImportService._load_chunk(cursor, valid_rows, upsert_sql)
+                    summary.inserted += inserted
+                    summary.updated += updated
+                    summary.unchanged += staged - inserted - updated
+                    summary.rows_loaded += len(valid_rows)
+                if incremental:
+                    # Rejected rows still count as present so they are not soft-deleted
+                    cursor.execute(MARK_SEEN_SQL, (rejected_ids,))
+                connection.commit()
+
+                ImportService._update_rate(summary, started)
+                if progress:
+                    progress(summary)
+
+            if incremental:
+                cursor.execute(SOFT_DELETE_MISSING_SQL)
+                summary.deactivated = cursor.rowcount
+                connection.commit()
+
+            cursor.execute(SYNC_PRODUCT_ID_SEQUENCE_SQL)
+            connection.commit()
+
+            # The products are committed by now: a failed refresh leaves the
+            # summary stale (the re-optimizer refreshes it later) instead of
+            # failing the import
+            try:
+                cursor.execute(REFRESH_CATEGORY_STATS_SQL)
+                connection.commit()
+            except psycopg2.Error:
+                logger.exception("Refreshing category_stats after the import failed")
+                connection.rollback()
+                summary.summary_refreshed = False
+            cursor.execute(CATEGORY_SUMMARY_SQL)
+            summary.categories = {category: count for category, count in cursor.fetchall()}
+            connection.commit()
+            cursor.close()
+        except Exception:
+            connection.rollback()
+            raise
+        finally:
+            if owns_connection:
+                connection.close()
+
+        # Reaches shared (Redis) caches; in-process caches of the API expire on their TTL
+        invalidate_product_reads()
+        ImportService._update_rate(summary, started)
+        return summary
+
+    @staticmethod
+    def _validate_chunk(
+        chunk: List[Tuple[int, dict]],
+        summary: ImportSummary
+    ) -> Tuple[List[Tuple], List[int]]:
+        """
+        Validate a chunk, recording rejected rows in the summary. Returns the
+        valid rows and the product_ids of rejected rows that had one.
+        """
+        valid_rows = []
+        rejected_ids = []
+        for line_no, row in chunk:
+            summary.rows_read += 1
+            try:
+                valid_rows.append(validate_row(line_no, row))
+            except ValueError as e:
+                summary.rows_rejected += 1
+                if len(summary.errors) < MAX_REPORTED_ERRORS:
+                    summary.errors.append(ImportRowError(line=line_no, error=str(e)))
+                try:
+                    rejected_ids.append(_parse_int(row.get("product_id"), "product_id"))
+                except ValueError:
+                    pass
+        return valid_rows, rejected_ids
+
+    @staticmethod
+    def _load_chunk(cursor, rows: List[Tuple], upsert_sql: str) -> Tuple[int, int, int]:
+        """COPY validated rows into staging and upsert them; returns (staged, inserted, updated)"""
+        buffer = io.StringIO()
+        csv.writer(buffer).writerows(rows)
+        buffer.seek(0)
+
+        cursor.copy_expert(COPY_SQL, buffer)
+        cursor.execute(upsert_sql)
+        return cursor.fetchone()
+
+    @staticmethod
+    def _update_rate(summary: ImportSummary, started: float) -> None:
+        elapsed = time.perf_counter() - started
+        summary.duration_seconds = round(elapsed, 2)
+        summary.rows_per_second = round(summary.rows_read / elapsed, 1) if elapsed > 0 else 0.0
@@ -0,0 +1,248 @@
+import os
+import time
+import uuid
+from typing import List, Optional, Tuple
+from fastapi import HTTPException, status
+from pydantic import BaseModel, ValidationError
+from sqlalchemy import text, update, func
+from sqlalchemy.orm import Session
+from app.config import settings
+from app.models.job import Job, JOB_QUEUED, JOB_RUNNING, JOB_CANCELLED, JOB_FINISHED_STATUSES
+from app.schemas.user import CurrentUser
+from app.schemas.job import ExportJobParams, ImportJobParams
+from app.schemas.pricing import PricingOptimizeRequest, ProfitOptimizeRequest, ReoptimizeRequest, ElasticityFitRequest
+from app.schemas.forecast import ForecastRunRequest
+from app.services.export_service import EXPORT_FORMATS
+
+# Job types and the request model their params are validated against
+JOB_PARAM_SCHEMAS = {
+    "pricing_optimize": PricingOptimizeRequest,
+    "profit_optimize": ProfitOptimizeRequest,
+    "forecast_run": ForecastRunRequest,
+    "elasticity_fit": ElasticityFitRequest,
+    "reoptimize": ReoptimizeRequest,
+    "import": ImportJobParams,
+    "export": ExportJobParams,
+}
+
+MAX_LISTED_JOBS = 100
+
+# Oldest queued job first; SKIP LOCKED lets any number of workers poll concurrently
+CLAIM_JOB_SQL = text("""
+UPDATE jobs
+SET status = 'running', worker_id = :worker_id, attempts = attempts + 1,
+    started_at = now(), heartbeat_at = now(), progress = NULL, progress_message = NULL
+WHERE id = (
+    SELECT id FROM jobs
+    WHERE status = 'queued'
+    ORDER BY created_at
+    LIMIT 1
+    FOR UPDATE SKIP LOCKED
+)
+RETURNING id
+""")
+
+# Running jobs whose worker stopped heartbeating are retried, up to max_attempts
+REQUEUE_STALE_SQL = text("""
+UPDATE jobs
+SET status = CASE
+        WHEN cancel_requested THEN 'cancelled'
+        WHEN attempts >= :max_attempts THEN 'failed'
+        ELSE 'queued'
+    END,
+    error = CASE
+        WHEN NOT cancel_requested AND attempts >= :max_attempts THEN 'Worker stopped responding'
+        ELSE error
+    END,
+    finished_at = CASE WHEN cancel_requested OR attempts >= :max_attempts THEN now() END,
+    worker_id = NULL
+WHERE status = 'running' AND heartbeat_at < now() - make_interval(secs => :stale_seconds)
+""")
+
+HEARTBEAT_SQL = text("""
+UPDATE jobs SET heartbeat_at = now(), progress = :progress, progress_message = :message
+WHERE id = :id AND worker_id = :worker_id AND status = 'running'
+RETURNING cancel_requested
+""")
+
+# Files still needed: uploads of pending imports, and output of running exports (named by job id)
+ACTIVE_JOB_FILES_SQL = text("""
+SELECT id::text, params->>'file_name'
+FROM jobs
+WHERE status IN ('queued', 'running')
+""")
+
+def job_file_path(file_name: str) -> str:
+    """Absolute path of a file in the job files directory (rejects anything outside it)"""
+    root = os.path.realpath(settings.JOB_FILES_DIR)
+    path = os.path.realpath(os.path.join(root, file_name))
+    if os.path.dirname(path) != root:
+        raise ValueError("Invalid job file name")
+    return path
+
+class JobService:
+    """Background job queue backed by the jobs table"""
+
+    @staticmethod
+    def validate_params(job_type: str, params: dict) -> dict:
+        schema = JOB_PARAM_SCHEMAS.get(job_type)
+        if schema is None:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Unknown job type, expected one of: {', '.join(JOB_PARAM_SCHEMAS)}"
+            )
+        try:
+            validated: BaseModel = schema.model_validate(params)
+        except ValidationError as e:
+            raise HTTPException(status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail=e.errors())
+
+        if isinstance(validated, ExportJobParams) and validated.format not in EXPORT_FORMATS:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Unsupported export format, expected one of: {', '.join(EXPORT_FORMATS)}"
+            )
+        if isinstance(validated, ImportJobParams):
+            try:
+                path = job_file_path(validated.file_name)
+            except ValueError as e:
+                raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+            if not os.path.isfile(path):
+                raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Import file not found")
+        if hasattr(validated, "include_products"):
+            # Results are stored on the job row; per-product output belongs in an export
+            validated.include_products = False
+        return validated.model_dump(mode="json")
+
+    @staticmethod
+    def enqueue(db: Session, job_type: str, params: dict, user: Optional[CurrentUser] = None) -> Job:
+        """Validate the parameters and queue a job"""
+        job = Job(
+            job_type=job_type,
+            status=JOB_QUEUED,
+            params=JobService.validate_params(job_type, params),
+            created_by=user.id if user else None
+        )
+        db.add(job)
+        db.commit()
+        db.refresh(job)
+        return job
+
+    @staticmethod
+    def get_job(db: Session, job_id: str) -> Optional[Job]:
+        try:
+            return db.get(Job, uuid.UUID(str(job_id)))
+        except ValueError:
+            return None
+
+    @staticmethod
+    def list_jobs(
+        db: Session,
+        job_status: Optional[str] = None,
+        job_type: Optional[str] = None,
+        limit: int = 20
+    ) -> List[Job]:
+        query = db.query(Job)
+        if job_status:
+            query = query.filter(Job.status == job_status)
+        if job_type:
+            query = query.filter(Job.job_type == job_type)
+        return query.order_by(Job.created_at.desc()).limit(min(limit, MAX_LISTED_JOBS)).all()
+
+    @staticmethod
+    def cancel(db: Session, job: Job) -> Job:
+        """Cancel a queued job at once; a running job stops at its next checkpoint"""
+        if job.status in JOB_FINISHED_STATUSES:
+            raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=f"Job already {job.status}")
+
+        # Guarded on status so a worker claiming the job concurrently is not overridden
+        cancelled = db.execute(
+            update(Job)
+            .where(Job.id == job.id, Job.status == JOB_QUEUED)
+            .values(status=JOB_CANCELLED, cancel_requested=True, finished_at=func.now())
+        ).rowcount
+        if not cancelled:
+            db.execute(
+                update(Job)
+                .where(Job.id == job.id, Job.status == JOB_RUNNING)
+                .values(cancel_requested=True)
+            )
+        db.commit()
+        db.refresh(job)
+        return job
+
+    @staticmethod
+    def purge_files(db: Session, retention_seconds: int) -> int:
+        """
+        Delete job files older than ``retention_seconds`` that no queued or running
+        job needs: finished exports, and uploads of imports that never ran.
+        Returns the number of files removed.
+        """
+        root = os.path.realpath(settings.JOB_FILES_DIR)
+        if not os.path.isdir(root):
+            return 0
+        active = set()
+        for job_id, file_name in db.execute(ACTIVE_JOB_FILES_SQL):
+            active.add(job_id)
+            if file_name:
+                active.add(file_name)
+        db.commit()
+
+        cutoff = time.time() - retention_seconds
+        removed = 0
+        for entry in os.scandir(root):
+            if not entry.is_file() or entry.name in active or entry.name.split(".")[0] in active:
+                continue
+            try:
+                if entry.stat().st_mtime < cutoff:
+                    os.remove(entry.path)
+                    removed += 1
+            except FileNotFoundError:
+                pass
+        return removed
+
+    @staticmethod
+    def claim(db: Session, worker_id: str) -> Optional[Job]:
+        """Requeue stale jobs, then take the oldest queued one"""
+        db.execute(REQUEUE_STALE_SQL, {
+            "max_attempts": settings.JOB_MAX_ATTEMPTS,
+            "stale_seconds": settings.JOB_STALE_SECONDS,
+        })
+        job_id = db.execute(CLAIM_JOB_SQL, {"worker_id": worker_id}).scalar()
+        db.commit()
+        return db.get(Job, job_id) if job_id else None
+
+    @staticmethod
+    def heartbeat(
+        db: Session,
+        job_id: uuid.UUID,
+        worker_id: str,
+        progress: Optional[float],
+        message: Optional[str]
+    ) -> Tuple[bool, bool]:
+        """Record liveness and progress; returns (still_owned, cancel_requested)"""
+        row = db.execute(HEARTBEAT_SQL, {
+            "id": job_id, "worker_id": worker_id, "progress": progress, "message": message,
+        }).first()
+        db.commit()
+        if row is None:
+            return False, True
+        return True, bool(row[0])
+
+    @staticmethod
+    def finish(
+        db: Session,
+        job_id: uuid.UUID,
+        worker_id: str,
+        job_status: str,
+        result: Optional[dict] = None,
+        error: Optional[str] = None
+    ) -> None:
+        values = {"status": job_status, "result": result, "error": error, "finished_at": func.now()}
+        if result is not None:
+            values["progress"] = 1
+        db.execute(
+            update(Job)
+            .where(Job.id == job_id, Job.worker_id == worker_id, Job.status == JOB_RUNNING)
+            .values(**values)
+        )
+        db.commit()
@@ -0,0 +1,249 @@
+"""
+Background job worker.
+
+Each claimed job runs on one pinned database connection with the batch
+statement timeout. A heartbeat thread records liveness and progress on a
+separate connection and polls for cancellation. A cancelled job stops at its
+next checkpoint (between import chunks or export batches). For long single
+statements, the heartbeat also cancels the statement running on the job's
+connection with ``pg_cancel_backend``.
+"""
+import logging
+import os
+import socket
+import threading
+import time
+from typing import Callable, Dict, Optional
+from sqlalchemy import text
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.orm import Session
+from app.config import settings
+from app.database import engine, SessionLocal
+from app.models.job import JOB_SUCCEEDED, JOB_FAILED, JOB_CANCELLED
+from app.schemas.job import ExportJobParams, ImportJobParams
+from app.schemas.pricing import PricingOptimizeRequest, ProfitOptimizeRequest, ReoptimizeRequest, ElasticityFitRequest
+from app.schemas.forecast import ForecastRunRequest
+from app.services.job_service import JobService, job_file_path
+from app.services.pricing_service import PricingService
+from app.services.forecast_service import ForecastService
+from app.services.elasticity_service import ElasticityService
+from app.services.reoptimize_service import ReoptimizeService
+from app.services.import_service import ImportService
+from app.services.export_service import ExportService
+
+logger = logging.getLogger(__name__)
+
+class JobCancelled(Exception):
+    """Raised at a checkpoint once cancellation was requested"""
+
+class JobContext:
+    """Progress reporting and cancellation checks for the running job"""
+
+    def __init__(self, job_id):
+        self.job_id = job_id
+        self.backend_pid: Optional[int] = None
+        self.progress: Optional[float] = None
+        self.message: Optional[str] = None
+        self._cancelled = threading.Event()
+
+    def report(self, message: str, progress: Optional[float] = None) -> None:
+        self.message = message[:255]
+        self.progress = progress
+
+    def checkpoint(self) -> None:
+        if self._cancelled.is_set():
+            raise JobCancelled()
+
+    @property
+    def cancelled(self) -> bool:
+        return self._cancelled.is_set()
+
+    def cancel(self) -> None:
+        self._cancelled.set()
+
+# Handlers run the job on ``db`` and return the JSON result stored on the job row
+
+def _pricing_optimize(db: Session, params: dict, context: JobContext) -> dict:
+    return PricingService.optimize_catalog(db, PricingOptimizeRequest(**params)).model_dump(mode="json")
+
+def _profit_optimize(db: Session, params: dict, context: JobContext) -> dict:
+    return PricingService.optimize_profit(db, ProfitOptimizeRequest(**params)).model_dump(mode="json")
+
+def _forecast_run(db: Session, params: dict, context: JobContext) -> dict:
+    return ForecastService.run_batch_forecast(db, ForecastRunRequest(**params)).model_dump(mode="json")
+
+def _elasticity_fit(db: Session, params: dict, context: JobContext) -> dict:
+    return ElasticityService.fit(db, ElasticityFitRequest(**params)).model_dump(mode="json")
+
+def _reoptimize(db: Session, params: dict, context: JobContext) -> dict:
+    return ReoptimizeService.process(db, ReoptimizeRequest(**params)).model_dump(mode="json")
+
+def _import(db: Session, params: dict, context: JobContext) -> dict:
+    request = ImportJobParams(**params)
+    path = job_file_path(request.file_name)
+
+    # Line count (minus the header) as the progress denominator; cheap next to the import
+    with open(path, "rb") as f:
+        total_rows = max(sum(block.count(b"\n") for block in iter(lambda: f.read(1 << 20), b"")) - 1, 1)
+
+    def progress(summary) -> None:
+        # Chunks are committed as they go; a cancelled import keeps the chunks already loaded
+        context.report(
+            f"{summary.rows_read:,} rows read, {summary.rows_loaded:,} loaded",
+            min(summary.rows_read / total_rows, 0.99)
+        )
+        context.checkpoint()
+
+    try:
+        # On the job's pinned connection, so the job statement timeout and cancellation apply
+        summary = ImportService.import_csv(
+            path, request.chunk_size, progress=progress, incremental=request.incremental,
+            connection=db.connection().connection
+        )
+    finally:
+        # The job finishes either way (only a dead worker retries it); the upload is done with
+        if os.path.exists(path):
+            os.remove(path)
+    return summary.model_dump(mode="json")
+
+def _export(db: Session, params: dict, context: JobContext) -> dict:
+    request = ExportJobParams(**params)
+    file_name = f"{context.job_id}.{request.format}"
+    path = job_file_path(file_name)
+
+    def progress(rows: int) -> None:
+        context.report(f"{rows:,} rows written")
+        context.checkpoint()
+
+    try:
+        rows = ExportService.write_file(db, path, request.format, request.category, request.include_inactive, progress)
+    except BaseException:
+        if os.path.exists(path):
+            os.remove(path)
+        raise
+    return {"file_name": file_name, "format": request.format, "rows": rows, "bytes": os.path.getsize(path)}
+
+JOB_HANDLERS: Dict[str, Callable[[Session, dict, JobContext], dict]] = {
+    "pricing_optimize": _pricing_optimize,
+    "profit_optimize": _profit_optimize,
+    "forecast_run": _forecast_run,
+    "elasticity_fit": _elasticity_fit,
+    "reoptimize": _reoptimize,
+    "import": _import,
+    "export": _export,
+}
+
+class JobWorker:
+    """Claims queued jobs one at a time and runs them to completion"""
+
+    def __init__(self, worker_id: Optional[str] = None):
+        self.worker_id = worker_id or f"{socket.gethostname()}:{os.getpid()}"
+        self._stop = threading.Event()
+        self._last_purge = 0.0
+
+    def stop(self) -> None:
+        """Finish the current job, then exit ``run``"""
+        self._stop.set()
+
+    def run(self, poll_interval: float = settings.JOB_POLL_INTERVAL_SECONDS, once: bool = False) -> int:
+        """Poll for jobs until stopped (or, with ``once``, until the queue is empty); returns jobs run"""
+        os.makedirs(settings.JOB_FILES_DIR, exist_ok=True)
+        processed = 0
+        while not self._stop.is_set():
+            if self.run_one():
+                processed += 1
+                continue
+            if once:
+                break
+            self._purge_files()
+            self._stop.wait(poll_interval)
+        return processed
+
+    def _purge_files(self) -> None:
+        """Delete expired job files while idle, at most every JOB_FILES_PURGE_INTERVAL_SECONDS"""
+        if time.monotonic() - self._last_purge < settings.JOB_FILES_PURGE_INTERVAL_SECONDS:
+            return
+        self._last_purge = time.monotonic()
+        db = SessionLocal()
+        try:
+            removed = JobService.purge_files(db, settings.JOB_FILES_RETENTION_SECONDS)
+            if removed:
+                logger.info("Removed %s expired job files", removed)
+        except Exception:
+            logger.exception("Purging job files failed")
+        finally:
+            db.close()
+
+    def run_one(self) -> bool:
+        """Claim and run the oldest queued job; False when the queue is empty"""
+        db = SessionLocal()
+        try:
+            job = JobService.claim(db, self.worker_id)
+            if job is None:
+                return False
+            job_id, job_type, params = job.id, job.job_type, dict(job.params)
+        finally:
+            db.close()
+
+        logger.info("Running job %s (%s)", job_id, job_type)
+        context = JobContext(job_id)
+        finished = threading.Event()
+        heartbeat = threading.Thread(target=self._heartbeat, args=(context, finished), daemon=True)
+
+        status, result, error = JOB_FAILED, None, None
+        with engine.connect() as connection:
+            # Sync engine connections already carry JOB_STATEMENT_TIMEOUT_MS
+            context.backend_pid = connection.execute(text("SELECT pg_backend_pid()")).scalar()
+            connection.commit()
+
+            heartbeat.start()
+            job_db = Session(bind=connection)
+            try:
+                context.checkpoint()
+                result = JOB_HANDLERS[job_type](job_db, params, context)
+                status = JOB_SUCCEEDED
+            except JobCancelled:
+                status = JOB_CANCELLED
+            except OperationalError as e:
+                # A statement interrupted by pg_cancel_backend surfaces here
+                status = JOB_CANCELLED if context.cancelled else JOB_FAILED
+                error = None if context.cancelled else str(e.orig or e)[:4000]
+            except Exception as e:
+                logger.exception("Job %s failed", job_id)
+                error = f"{type(e).__name__}: {e}"[:4000]
+            finally:
+                job_db.close()
+                # Stop cancelling statements before the connection goes back to the pool
+                finished.set()
+                heartbeat.join()
+                connection.rollback()
+
+        db = SessionLocal()
+        try:
+            JobService.finish(db, job_id, self.worker_id, status, result, error)
+        finally:
+            db.close()
+        logger.info("Job %s %s", job_id, status)
+        return True
+
+    def _heartbeat(self, context: JobContext, finished: threading.Event) -> None:
+        db = SessionLocal()
+        try:
+            while not finished.is_set():
+                try:
+                    _, cancel = JobService.heartbeat(
+                        db, context.job_id, self.worker_id, context.progress, context.message
+                    )
+                except Exception:
+                    logger.exception("Heartbeat for job %s failed", context.job_id)
+                    db.rollback()
+                    cancel = False
+                if cancel and not finished.is_set():
+                    # Repeated every beat: the job may be between statements right now
+                    context.cancel()
+                    if context.backend_pid:
+                        db.execute(text("SELECT pg_cancel_backend(:pid)"), {"pid": context.backend_pid})
+                        db.commit()
+                finished.wait(settings.JOB_HEARTBEAT_SECONDS)
+        finally:
+            db.close()
@@ -0,0 +1,241 @@
+"""
+Process-parallel execution of the vectorized engines.
+
+The catalog's numeric columns are copied once into a shared memory block
+together with a row permutation that groups rows into shards. Workers attach
+to the block by name, run the engine on their shard and write the outputs
+back into shared output arrays in place, so neither ORM objects nor result
+arrays are pickled between processes.
+
+Shards are either whole categories packed into balanced bins
+(``category``) or equal contiguous row ranges (``range``). Both engines are
+row-independent, so the results equal a single in-process run.
+"""
+import multiprocessing
+import threading
+from multiprocessing import resource_tracker
+from concurrent.futures import Executor, ProcessPoolExecutor
+from typing import Dict, List, Optional, Sequence, Tuple
+import numpy as np
+from app.config import settings
+from app.services.factor_tables import FactorTables
+from app.services.pricing_engine import CatalogArrays, PricingResult, optimize_prices
+from app.services.forecast_engine import ForecastResult, project_demand
+from app.utils.shared_arrays import ArrayLayout, SharedArrays
+
+SHARD_BY_CATEGORY = "category"
+SHARD_BY_RANGE = "range"
+
+PRICING_TASK = "pricing"
+FORECAST_TASK = "forecast"
+
+# Engine inputs copied into shared memory (all numeric; ids stay in the parent)
+INPUT_LAYOUT = (
+    ("cost_price", "float64"),
+    ("selling_price", "float64"),
+    ("stock_available", "int64"),
+    ("units_sold", "int64"),
+    ("category_codes", "int32"),
+    ("price_elasticity", "float64"),
+)
+
+PRICING_OUTPUTS = (
+    ("demand_forecast", "int64"),
+    ("competitive_adjustment", "float64"),
+    ("demand_elasticity", "float64"),
+    ("market_condition", "float64"),
+    ("inventory_pressure", "float64"),
+    ("profitability_target", "float64"),
+    ("elasticity_adjustment", "float64"),
+    ("optimized_price", "float64"),
+)
+
+
+def category_shards(category_codes: np.ndarray, n_categories: int, shards: int) -> Tuple[np.ndarray, List[int]]:
+    """
+    Row order and shard boundaries keeping every category in one shard.
+    Categories are packed largest first into the currently smallest shard.
+    """
+    order = np.argsort(category_codes, kind="stable")
+    sizes = np.bincount(category_codes, minlength=n_categories)
+    starts = np.concatenate(([0], np.cumsum(sizes)[:-1])) if n_categories else np.empty(0, dtype=np.int64)
+
+    bins: List[List[int]] = [[] for _ in range(shards)]
+    loads = [0] * shards
+    for code in np.argsort(-sizes, kind="stable").tolist():
+        if sizes[code] == 0:
+            continue
+        target = loads.index(min(loads))
+        bins[target].append(code)
+        loads[target] += int(sizes[code])
+
+    pieces = [order[starts[code]:starts[code] + sizes[code]] for members in bins for code in members]
+    bounds = np.cumsum([0] + [load for load in loads if load]).tolist()
+    return (np.concatenate(pieces) if pieces else order), bounds
+
+
+def range_shards(rows: int, shards: int) -> Tuple[np.ndarray, List[int]]:
+    """Row order and boundaries for ``shards`` equal contiguous ranges"""
+    bounds = np.linspace(0, rows, shards + 1).astype(np.int64)
+    return np.arange(rows, dtype=np.int64), sorted(set(bounds.tolist()))
+
+
+def _output_layout(task: str, rows: int, options: dict) -> ArrayLayout:
+    if task == PRICING_TASK:
+        return [(name, dtype, (rows,)) for name, dtype in PRICING_OUTPUTS]
+    years = options["years"]
+    return [
+        ("base_demand", "int64", (rows,)),
+        ("demand", "float64", (rows, years)),
+        ("price", "float64", (rows, years)),
+        ("growth_rate", "float64", (rows, years)),
+    ]
+
+
+def _run_shard(
+    spec,
+    task: str,
+    start: int,
+    end: int,
+    categories: Sequence[str],
+    factors: Optional[FactorTables],
+    options: dict
+) -> int:
+    """Worker entry point: run one shard and write its outputs in place"""
+    block = SharedArrays.attach(spec)
+    try:
+        rows = block["order"][start:end]
+        catalog = CatalogArrays(
+            ids=rows,  # Positions stand in for ids; engines never read them
+            cost_price=block["cost_price"][rows],
+            selling_price=block["selling_price"][rows],
+            stock_available=block["stock_available"][rows],
+            units_sold=block["units_sold"][rows],
+            category_codes=block["category_codes"][rows],
+            categories=list(categories),
+            price_elasticity=block["price_elasticity"][rows],
+        )
+        if task == PRICING_TASK:
+            result = optimize_prices(catalog, factors)
+            for name, _ in PRICING_OUTPUTS:
+                block[name][rows] = getattr(result, name)
+        else:
+            result = project_demand(catalog, options["years"], factors)
+            for name in ("base_demand", "demand", "price", "growth_rate"):
+                block[name][rows] = getattr(result, name)
+        return int(rows.size)
+    finally:
+        block.close()
+
+
+class EnginePool:
+    """
+    Shards engine runs across a spawn process pool. Catalogs smaller than
+    ``min_rows`` (or a pool of one worker) run in-process, where the cost
+    of the shared memory copy would outweigh the parallel speedup.
+    """
+
+    def __init__(self, workers: int, min_rows: int, shard_by: str):
+        if shard_by not in (SHARD_BY_CATEGORY, SHARD_BY_RANGE):
+            raise ValueError(f"Unknown ENGINE_SHARD_BY: {shard_by}")
+        self.workers = workers
+        self.min_rows = min_rows
+        self.shard_by = shard_by
+        self._executor: Optional[Executor] = None
+        self._lock = threading.Lock()
+
+    def _get_executor(self) -> Executor:
+        # Created lazily; spawn keeps workers free of the server's threads and connections
+        with self._lock:
+            if self._executor is None:
+                # Workers inherit a running tracker instead of starting their own,
+                # which would unlink attached shared memory when they exit
+                resource_tracker.ensure_running()
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.workers,
+                    mp_context=multiprocessing.get_context("spawn")
+                )
+            return self._executor
+
+    def parallel(self, rows: int) -> bool:
+        return self.workers > 1 and rows >= self.min_rows
+
+    def optimize_prices(
+        self,
+        catalog: CatalogArrays,
+        factors: Optional[FactorTables] = None
+    ) -> Tuple[PricingResult, int]:
+        """``optimize_prices`` over the catalog; returns the result and the number of shards used"""
+        if not self.parallel(len(catalog)):
+            return optimize_prices(catalog, factors), 1
+        outputs, shards = self._run(catalog, PRICING_TASK, factors, {})
+        return PricingResult(**outputs), shards
+
+    def project_demand(
+        self,
+        catalog: CatalogArrays,
+        years: int,
+        factors: Optional[FactorTables] = None
+    ) -> Tuple[ForecastResult, int]:
+        """``project_demand`` over the catalog; returns the result and the number of shards used"""
+        if not self.parallel(len(catalog)):
+            return project_demand(catalog, years, factors), 1
+        outputs, shards = self._run(catalog, FORECAST_TASK, factors, {"years": years})
+        return ForecastResult(**outputs), shards
+
+    def _shards(self, catalog: CatalogArrays) -> Tuple[np.ndarray, List[int]]:
+        if self.shard_by == SHARD_BY_CATEGORY:
+            return category_shards(catalog.category_codes, len(catalog.categories), self.workers)
+        return range_shards(len(catalog), self.workers)
+
+    def _run(
+        self,
+        catalog: CatalogArrays,
+        task: str,
+        factors: Optional[FactorTables],
+        options: dict
+    ) -> Tuple[Dict[str, np.ndarray], int]:
+        rows = len(catalog)
+        order, bounds = self._shards(catalog)
+        outputs = _output_layout(task, rows, options)
+        layout = (
+            [("order", "int64", (rows,))]
+            + [(name, dtype, (rows,)) for name, dtype in INPUT_LAYOUT]
+            + outputs
+        )
+
+        block = SharedArrays.create(layout)
+        try:
+            block["order"][:] = order
+            for name, _ in INPUT_LAYOUT:
+                values = getattr(catalog, name)
+                block[name][:] = np.nan if values is None else values
+
+            executor = self._get_executor()
+            futures = [
+                executor.submit(_run_shard, block.spec, task, start, end, catalog.categories, factors, options)
+                for start, end in zip(bounds[:-1], bounds[1:])
+            ]
+            for future in futures:
+                future.result()
+
+            # Copy out before the block is released
+            return {name: block[name].copy() for name, _, _ in outputs}, len(futures)
+        finally:
+            block.close()
+
+    def stats(self) -> dict:
+        return {"workers": self.workers, "min_rows": self.min_rows, "shard_by": self.shard_by}
+
+    def shutdown(self) -> None:
+        with self._lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=False, cancel_futures=True)
+                self._executor = None
+
+
+engine_pool = EnginePool(
+    workers=settings.ENGINE_WORKERS,
+    min_rows=settings.ENGINE_PARALLEL_MIN_ROWS,
+    shard_by=settings.ENGINE_SHARD_BY
+)
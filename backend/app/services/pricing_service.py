@@ -0,0 +1,305 @@
+from sqlalchemy.orm import Session
+from sqlalchemy import update, text
+from typing import Dict, List, Optional, Sequence
+import time
+import numpy as np
+import orjson
+from app.models.product import Product
+from app.schemas.pricing import (
+    PricingOptimizeRequest, PricingOptimizeResponse, OptimizedPriceItem,
+    ProfitOptimizeRequest, ProfitOptimizeResponse, ProfitOptimizedItem
+)
+from app.services.pricing_engine import (
+    CatalogArrays, PricingResult, calculate_demand_forecast, catalog_elasticity, ALGORITHM_NAME
+)
+from app.services.parallel_engine import engine_pool
+from app.services.factor_service import factor_registry
+from app.services.profit_optimizer import (
+    ProfitConstraints, ProfitSolution, solve, BINDING_NAMES, PROFIT_ALGORITHM
+)
+from app.services.product_service import invalidate_product_reads
+from app.services.summary_service import SummaryService
+
+# Rows per executemany batch when writing results back
+WRITE_BATCH_SIZE = 5000
+
+# Earlier suggestions for the products in a new solve stop being current
+DEACTIVATE_OPTIMIZATIONS_SQL = text("""
+UPDATE pricing_optimizations SET is_active = false
+WHERE is_active = true AND product_id = ANY(CAST(:ids AS uuid[]))
+""")
+
+# One multi-row INSERT per batch from parallel arrays
+RECORD_OPTIMIZATIONS_SQL = text("""
+INSERT INTO pricing_optimizations (
+    id, product_id, current_price, optimized_price, expected_demand, expected_revenue,
+    profit_margin, optimization_factors, algorithm_used, is_active, is_applied, applied_at
+)
+SELECT gen_random_uuid(), v.product_id, v.current_price, v.optimized_price, v.expected_demand,
+       round(v.optimized_price * v.expected_demand, 2), v.profit_margin, v.factors,
+       :algorithm, true, :applied, CASE WHEN :applied THEN now() END
+FROM unnest(
+    CAST(:ids AS uuid[]), CAST(:current AS numeric[]), CAST(:optimized AS numeric[]),
+    CAST(:demand AS numeric[]), CAST(:margin AS numeric[]), CAST(:factors AS json[])
+) AS v(product_id, current_price, optimized_price, expected_demand, profit_margin, factors)
+""")
+
+# A full run supersedes pending incremental work for the products it covers.
+# Deleting first (in the run's transaction) means changes committed after the
+# catalog is loaded mark their products again instead of being lost.
+CLEAR_DIRTY_SQL = text("""
+DELETE FROM pricing_dirty_products AS d
+USING products AS p
+WHERE p.id = d.product_id AND (CAST(:category AS varchar) IS NULL OR p.category = :category)
+""")
+
+# updated_at is the row version behind the product ETag, so it moves with the price
+APPLY_PRICES_SQL = text("""
+UPDATE products AS p SET optimized_price = v.price, updated_at = now()
+FROM unnest(CAST(:ids AS uuid[]), CAST(:prices AS numeric[])) AS v(id, price)
+WHERE p.id = v.id
+""")
+
+class PricingService:
+    """Pricing optimization service (catalog-wide, server-side)"""
+
+    @staticmethod
+    def load_catalog(
+        db: Session,
+        category: Optional[str] = None,
+        priced_only: bool = False,
+        product_ids: Optional[Sequence] = None
+    ) -> CatalogArrays:
+        """Load the active catalog as columnar arrays"""
+        query = db.query(
+            Product.id,
+            Product.cost_price,
+            Product.selling_price,
+            Product.stock_available,
+            Product.units_sold,
+            Product.category,
+            Product.price_elasticity
+        ).filter(Product.is_active == True)
+
+        if category:
+            query = query.filter(Product.category == category)
+        if priced_only:
+            query = query.filter(Product.cost_price > 0, Product.selling_price > 0)
+        if product_ids is not None:
+            query = query.filter(Product.id.in_(product_ids))
+
+        return CatalogArrays.from_rows(query.all())
+
+    @staticmethod
+    def optimize_catalog(db: Session, request: PricingOptimizeRequest) -> PricingOptimizeResponse:
+        """Recompute optimized prices for the whole (or one category of the) catalog"""
+        started = time.perf_counter()
+
+        if request.apply:
+            db.execute(CLEAR_DIRTY_SQL, {"category": request.category})
+        catalog = PricingService.load_catalog(db, request.category)
+        factors = factor_registry.current()
+        result, shards = engine_pool.optimize_prices(catalog, factors)
+
+        current = catalog.selling_price
+        optimized = result.optimized_price
+        demand = result.demand_forecast
+
+        if request.apply and len(catalog):
+            PricingService.write_results(db, catalog, result)
+            SummaryService.refresh(db)
+
+        current_revenue = float(np.sum(current * demand))
+        optimized_revenue = float(np.sum(optimized * demand))
+        price_change = np.divide(
+            optimized - current, current, out=np.zeros_like(current), where=current != 0
+        ) * 100
+
+        products = None
+        if request.include_products:
+            products = [
+                OptimizedPriceItem(
+                    id=catalog.ids[i],
+                    current_price=float(current[i]),
+                    optimized_price=float(optimized[i]),
+                    demand_forecast=int(demand[i]),
+                    price_change_percentage=round(float(price_change[i]), 2)
+                )
+                for i in range(len(catalog))
+            ]
+
+        return PricingOptimizeResponse(
+            products_optimized=len(catalog),
+            applied=request.apply,
+            algorithm=ALGORITHM_NAME,
+            factor_version=factors.version,
+            total_current_revenue=round(current_revenue, 2),
+            total_optimized_revenue=round(optimized_revenue, 2),
+            total_revenue_increase=round(optimized_revenue - current_revenue, 2),
+            average_price_change=round(float(price_change.mean()), 2) if len(catalog) else 0.0,
+            shards=shards,
+            duration_ms=round((time.perf_counter() - started) * 1000, 2),
+            products=products
+        )
+
+    @staticmethod
+    def write_results(db: Session, catalog: CatalogArrays, result: PricingResult) -> None:
+        """Persist optimized prices and demand forecasts and record the run in pricing_optimizations"""
+        ids = catalog.ids
+        prices = result.optimized_price.tolist()
+        demand = result.demand_forecast.tolist()
+
+        for start in range(0, len(catalog), WRITE_BATCH_SIZE):
+            end = start + WRITE_BATCH_SIZE
+            db.execute(
+                update(Product),
+                [
+                    {"id": pid, "optimized_price": price, "demand_forecast": units}
+                    for pid, price, units in zip(ids[start:end], prices[start:end], demand[start:end])
+                ]
+            )
+
+        factors = result.factors()
+        names = list(factors)
+        columns = [np.round(values, 4).tolist() for values in factors.values()]
+        PricingService._record_optimizations(
+            db, catalog, result.optimized_price, result.demand_forecast,
+            [dict(zip(names, row)) for row in zip(*columns)],
+            ALGORITHM_NAME, applied=True
+        )
+
+        db.commit()
+        invalidate_product_reads()
+
+    @staticmethod
+    def _record_optimizations(
+        db: Session,
+        catalog: CatalogArrays,
+        optimized_price: np.ndarray,
+        expected_demand: np.ndarray,
+        factors: List[Dict],
+        algorithm: str,
+        applied: bool
+    ) -> None:
+        """Insert one active pricing_optimizations row per product, retiring earlier ones"""
+        ids = [str(pid) for pid in catalog.ids]
+        current = catalog.selling_price.tolist()
+        optimized = optimized_price.tolist()
+        demand = np.round(expected_demand, 2).tolist()
+        margin = np.round(np.divide(
+            optimized_price - catalog.cost_price, optimized_price,
+            out=np.zeros_like(optimized_price), where=optimized_price != 0
+        ) * 100, 2).tolist()
+        factors_json = [orjson.dumps(row).decode("utf-8") for row in factors]
+
+        for start in range(0, len(ids), WRITE_BATCH_SIZE):
+            end = start + WRITE_BATCH_SIZE
+            db.execute(DEACTIVATE_OPTIMIZATIONS_SQL, {"ids": ids[start:end]})
+            db.execute(RECORD_OPTIMIZATIONS_SQL, {
+                "ids": ids[start:end],
+                "current": current[start:end],
+                "optimized": optimized[start:end],
+                "demand": demand[start:end],
+                "margin": margin[start:end],
+                "factors": factors_json[start:end],
+                "algorithm": algorithm,
+                "applied": applied,
+            })
+
+    @staticmethod
+    def optimize_profit(db: Session, request: ProfitOptimizeRequest) -> ProfitOptimizeResponse:
+        """Maximize catalog profit under margin, step, inventory, ladder and revenue constraints"""
+        started = time.perf_counter()
+
+        # The demand curve is anchored at the current price, so it must be positive
+        catalog = PricingService.load_catalog(db, request.category, priced_only=True)
+        cost = catalog.cost_price
+        current = catalog.selling_price
+        factors = factor_registry.current()
+        demand = calculate_demand_forecast(catalog, factors).astype(np.float64)
+        elasticity = catalog_elasticity(catalog, factors)
+
+        solve_started = time.perf_counter()
+        solution = solve(
+            cost, current, demand, catalog.stock_available.astype(np.float64), elasticity,
+            catalog.category_codes, catalog.categories,
+            ProfitConstraints(
+                min_margin=request.min_margin,
+                max_change=request.max_change,
+                min_revenue_ratio=request.min_revenue_ratio,
+                max_inventory_cover=request.max_inventory_cover,
+                min_inventory_cover=request.min_inventory_cover,
+                price_ladders=request.price_ladders,
+            )
+        )
+        solve_ms = round((time.perf_counter() - solve_started) * 1000, 2)
+
+        if len(catalog):
+            PricingService._store_profit_solution(db, catalog, elasticity, solution, request.apply)
+
+        optimized = solution.price
+        binding = [BINDING_NAMES[code] for code in solution.binding.tolist()]
+        products = None
+        if request.include_products:
+            products = [
+                ProfitOptimizedItem(
+                    id=catalog.ids[i],
+                    current_price=float(current[i]),
+                    optimized_price=float(optimized[i]),
+                    expected_demand=round(float(solution.demand[i]), 2),
+                    elasticity=float(elasticity[i]),
+                    binding_constraint=binding[i]
+                )
+                for i in range(len(catalog))
+            ]
+
+        return ProfitOptimizeResponse(
+            products_optimized=len(catalog),
+            applied=request.apply,
+            algorithm=PROFIT_ALGORITHM,
+            factor_version=factors.version,
+            total_current_profit=round(float(np.sum((current - cost) * demand)), 2),
+            total_optimized_profit=round(float(np.sum((optimized - cost) * solution.demand)), 2),
+            total_current_revenue=round(float(np.sum(current * demand)), 2),
+            total_optimized_revenue=round(float(np.sum(optimized * solution.demand)), 2),
+            revenue_multiplier=round(solution.multiplier, 6),
+            revenue_floor_met=solution.revenue_floor_met,
+            iterations=solution.iterations,
+            binding_constraints=solution.binding_counts(),
+            constraint_conflicts=solution.conflicts,
+            ladder_misses=solution.ladder_misses,
+            solve_ms=solve_ms,
+            duration_ms=round((time.perf_counter() - started) * 1000, 2),
+            products=products
+        )
+
+    @staticmethod
+    def _store_profit_solution(
+        db: Session,
+        catalog: CatalogArrays,
+        elasticity: np.ndarray,
+        solution: ProfitSolution,
+        apply: bool
+    ) -> None:
+        """Record the solve in pricing_optimizations (and optionally apply the prices)"""
+        binding = solution.binding.tolist()
+        PricingService._record_optimizations(
+            db, catalog, solution.price, solution.demand,
+            [
+                {"elasticity": e, "binding_constraint": BINDING_NAMES[code]}
+                for e, code in zip(elasticity.tolist(), binding)
+            ],
+            PROFIT_ALGORITHM, applied=apply
+        )
+
+        if apply:
+            ids = [str(pid) for pid in catalog.ids]
+            prices = solution.price.tolist()
+            for start in range(0, len(ids), WRITE_BATCH_SIZE):
+                end = start + WRITE_BATCH_SIZE
+                db.execute(APPLY_PRICES_SQL, {"ids": ids[start:end], "prices": prices[start:end]})
+
+        db.commit()
+        if apply:
+            invalidate_product_reads()
+            SummaryService.refresh(db)
@@ -1,11 +1,132 @@
 from sqlalchemy.orm import Session
-from sqlalchemy import and_, func, or_
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy import and_, func, or_, tuple_, text, select, literal_column, cast, case, Select, Float, REAL, Text
 from fastapi import HTTPException, status
-from typing import List, Optional
+from typing import List, Optional, Sequence, Tuple
 from decimal import Decimal
-from app.models.product import Product
-from app.models.user import User
-from app.schemas.product import ProductCreate, ProductUpdate, ProductSearchParams, ProductListResponse
+import orjson
+import uuid
+from app.config import settings
+from app.models.product import Product, SEARCH_CONFIG
+from app.schemas.user import CurrentUser
+from app.schemas.product import (
+    ProductCreate, ProductUpdate, ProductSearchParams, ProductListResponse,
+    BulkPriceUpdateItem, BulkPriceUpdateRequest, BulkPriceUpdateResponse, BulkPriceUpdateResult,
+    BulkProductCreateRequest, BulkProductCreateResponse, CreatedProduct
+)
+from app.utils.cache import TTLCache
+from app.utils.response_cache import build_response_cache
+from app.utils.pagination import encode_cursor, decode_cursor
+from app.utils.helpers import build_prefix_tsquery
+
+# Listing totals keyed by filter signature; cleared on every product write
+product_count_cache = TTLCache(
+    maxsize=settings.PRODUCT_COUNT_CACHE_SIZE,
+    ttl=settings.PRODUCT_COUNT_CACHE_TTL
+)
+
+# Serialized listing/category responses keyed by normalized parameters
+product_response_cache = build_response_cache("products")
+
+CATEGORIES_CACHE_KEY = "categories"
+
+# Prefix tsquery -> whether anything is left once the search configuration
+# drops stopwords; depends only on the configuration, so it is never invalidated
+searchable_query_cache = TTLCache(maxsize=4096, ttl=3600)
+
+def invalidate_product_reads() -> None:
+    """Drop cached totals and responses after a product write (sync callers)"""
+    product_count_cache.clear()
+    product_response_cache.clear_sync()
+
+# Listing rows are read as plain columns instead of ORM entities. Numerics come
+# back as text (the API's Decimal-as-string format, without building Decimal
+# objects) and the profit figures are computed by PostgreSQL. Order matches
+# ProductResponse so the fast path emits the same JSON.
+LISTING_COLUMNS = (
+    Product.name,
+    Product.description,
+    cast(Product.cost_price, Text).label("cost_price"),
+    cast(Product.selling_price, Text).label("selling_price"),
+    Product.category,
+    Product.stock_available,
+    Product.units_sold,
+    cast(Product.customer_rating, Text).label("customer_rating"),
+    Product.demand_forecast,
+    cast(Product.optimized_price, Text).label("optimized_price"),
+    Product.id,
+    Product.product_id,
+    Product.is_active,
+    Product.created_at,
+    Product.updated_at,
+    case(
+        (and_(Product.selling_price != 0, Product.cost_price != 0),
+         cast((Product.selling_price - Product.cost_price) / Product.selling_price * 100, Float)),
+        else_=0.0
+    ).label("profit_margin"),
+    case(
+        (and_(Product.selling_price != 0, Product.cost_price != 0),
+         cast(Product.selling_price - Product.cost_price, Float)),
+        else_=0.0
+    ).label("profit_per_unit"),
+)
+LISTING_FIELDS = tuple(column.key for column in LISTING_COLUMNS)
+
+# Lexemes left in a prefix tsquery after stopword removal (0 for "the", "and of", ...)
+TSQUERY_NODES_SQL = text(f"SELECT numnode(to_tsquery('{SEARCH_CONFIG}'::regconfig, :query))")
+
+# Planner row estimate for products (unfiltered listing totals)
+ESTIMATE_ROWS_SQL = text("SELECT reltuples::bigint FROM pg_class WHERE oid = 'products'::regclass")
+
+# Rows per set-based bulk price UPDATE statement
+BULK_UPDATE_BATCH_SIZE = 10000
+
+# One UPDATE per batch: the new prices arrive as parallel arrays joined via unnest;
+# NULL keeps the current value of a column
+BULK_PRICE_UPDATE_SQL = text("""
+UPDATE products AS p SET
+    selling_price = COALESCE(v.selling_price, p.selling_price),
+    cost_price = COALESCE(v.cost_price, p.cost_price),
+    optimized_price = COALESCE(v.optimized_price, p.optimized_price),
+    updated_at = now()
+FROM unnest(
+    CAST(:ids AS uuid[]),
+    CAST(:selling_prices AS numeric[]),
+    CAST(:cost_prices AS numeric[]),
+    CAST(:optimized_prices AS numeric[])
+) AS v(id, selling_price, cost_price, optimized_price)
+WHERE p.id = v.id AND p.is_active = true
+RETURNING p.id
+""").columns(id=UUID(as_uuid=True))
+
+# One round trip allocates a block of product_ids; concurrent callers never collide
+ALLOCATE_PRODUCT_IDS_SQL = text(
+    "SELECT nextval('products_product_id_seq') FROM generate_series(1, :count)"
+)
+
+# Whole bulk create in one INSERT: the rows arrive as parallel arrays
+BULK_CREATE_SQL = text("""
+INSERT INTO products (
+    id, product_id, name, description, cost_price, selling_price, category,
+    stock_available, units_sold, customer_rating, demand_forecast, optimized_price,
+    created_by, is_active
+)
+SELECT v.*, CAST(:created_by AS uuid), true
+FROM unnest(
+    CAST(:ids AS uuid[]),
+    CAST(:product_ids AS integer[]),
+    CAST(:names AS varchar[]),
+    CAST(:descriptions AS text[]),
+    CAST(:cost_prices AS numeric[]),
+    CAST(:selling_prices AS numeric[]),
+    CAST(:categories AS varchar[]),
+    CAST(:stock_available AS integer[]),
+    CAST(:units_sold AS integer[]),
+    CAST(:customer_ratings AS numeric[]),
+    CAST(:demand_forecasts AS integer[]),
+    CAST(:optimized_prices AS numeric[])
+) AS v
+""")
 
 class ProductService:
     """Product service for business logic"""
@@ -14,47 +135,247 @@ class ProductService:
     def get_products(
         db: Session, 
         search_params: ProductSearchParams,
-        current_user: Optional[User] = None
+        current_user: Optional[CurrentUser] = None
     ) -> ProductListResponse:
         """Get products with search and pagination"""
-        query = db.query(Product).filter(Product.is_active == True)
+        filtered, page_query, ranked = ProductService.build_listing_query(
+            search_params, ProductService._searchable(db, search_params)
+        )
+        
+        # Get total count (cached per filter signature, skipped when not requested)
+        total = None
+        total_is_estimate = False
+        if search_params.include_total:
+            total, total_is_estimate = ProductService._count_products(db, filtered, search_params)
+        
+        products = db.execute(page_query).all()
+        return ProductService.build_list_response(
+            products, total, total_is_estimate, search_params, ranked
+        )
+    
+    @staticmethod
+    def build_listing_query(search_params: ProductSearchParams, searchable: bool = True) -> Tuple[Select, Select, bool]:
+        """
+        Build the statements for a listing (shared by the sync and async services).
+        ``searchable`` is False when the search text is nothing but stopwords.
+        Returns (filtered, page, ranked): the filtered statement used for counting,
+        the ordered and paginated statement, and whether results are relevance-ordered.
+        """
+        filtered = select(*LISTING_COLUMNS).filter(Product.is_active == True)
         
         # Apply search filters
-        if search_params.search:
-            search_term = f"%{search_params.search}%"
-            query = query.filter(
-                or_(
-                    Product.name.ilike(search_term),
-                    Product.description.ilike(search_term)
+        filtered, ts_query = ProductService._apply_filters(filtered, search_params, searchable)
+        ranked = ts_query is not None
+        
+        position = None
+        if search_params.cursor:
+            position = decode_cursor(search_params.cursor)
+            # Ranked searches hand out rank-led cursors and only accept those
+            if position is None or (position[2] is not None) != ranked:
+                raise HTTPException(
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                    detail="Invalid pagination cursor"
                 )
+        
+        if ranked:
+            # Full-text matches by relevance; the rank is returned so the last
+            # row of a page can lead the next cursor
+            rank = func.ts_rank_cd(Product.search_vector, ts_query, type_=REAL)
+            query = filtered.add_columns(rank.label("search_rank")).order_by(
+                rank.desc(),
+                Product.created_at.desc(),
+                Product.id.desc()
             )
+            sort_key = tuple_(rank, Product.created_at, Product.id)
+        else:
+            # Sort by creation date (newest first) to show recently added products first;
+            # id breaks ties so keyset pagination has a strict total order
+            query = filtered.order_by(Product.created_at.desc(), Product.id.desc())
+            sort_key = tuple_(Product.created_at, Product.id)
+        
+        # Apply pagination: keyset when a cursor is given, offset otherwise
+        if position is not None:
+            created_at, product_id, rank_position = position
+            if ranked:
+                query = query.filter(sort_key < (rank_position, created_at, product_id))
+            else:
+                query = query.filter(sort_key < (created_at, product_id))
+        else:
+            offset = (search_params.page - 1) * search_params.size
+            query = query.offset(offset)
+        
+        # Fetch one extra row to know whether a next page exists
+        query = query.limit(search_params.size + 1)
+        return filtered, query, ranked
+    
+    @staticmethod
+    def page_rows(rows: Sequence, search_params: ProductSearchParams, ranked: bool) -> Tuple[Sequence, Optional[str]]:
+        """Trim the look-ahead row and compute the next keyset cursor"""
+        next_cursor = None
+        if len(rows) > search_params.size:
+            rows = rows[:search_params.size]
+            last = rows[-1]
+            next_cursor = encode_cursor(last.created_at, last.id, last.search_rank if ranked else None)
+        return rows, next_cursor
+    
+    @staticmethod
+    def build_list_response(
+        rows: Sequence,
+        total: Optional[int],
+        total_is_estimate: bool,
+        search_params: ProductSearchParams,
+        ranked: bool
+    ) -> ProductListResponse:
+        """Listing response model from LISTING_COLUMNS rows"""
+        products, next_cursor = ProductService.page_rows(rows, search_params, ranked)
+        return ProductListResponse(
+            products=products,
+            total=total,
+            total_is_estimate=total_is_estimate,
+            page=search_params.page,
+            size=search_params.size,
+            next_cursor=next_cursor
+        )
+    
+    @staticmethod
+    def build_list_json(
+        rows: Sequence,
+        total: Optional[int],
+        total_is_estimate: bool,
+        search_params: ProductSearchParams,
+        ranked: bool
+    ) -> bytes:
+        """Serialize a listing straight from LISTING_COLUMNS rows with orjson (same JSON as ProductListResponse)"""
+        products, next_cursor = ProductService.page_rows(rows, search_params, ranked)
+        return orjson.dumps({
+            "products": [dict(zip(LISTING_FIELDS, row)) for row in products],
+            "total": total,
+            "total_is_estimate": total_is_estimate,
+            "page": search_params.page,
+            "size": search_params.size,
+            "next_cursor": next_cursor,
+        }, option=orjson.OPT_UTC_Z)
+    
+    @staticmethod
+    def _apply_filters(query, search_params: ProductSearchParams, searchable: bool = True):
+        """Apply listing filters; returns (query, tsquery or None)"""
+        ts_query = None
+        if search_params.search:
+            prefix_query = build_prefix_tsquery(search_params.search)
+            if prefix_query and not searchable:
+                # Only stopwords: the tsquery would match nothing, list unfiltered
+                pass
+            elif prefix_query:
+                # Indexed full-text match with prefix matching on every word
+                ts_query = func.to_tsquery(literal_column(f"'{SEARCH_CONFIG}'::regconfig"), prefix_query)
+                query = query.filter(Product.search_vector.op("@@")(ts_query))
+            else:
+                # No searchable words (punctuation only): fall back to substring match
+                search_term = f"%{search_params.search}%"
+                query = query.filter(
+                    or_(
+                        Product.name.ilike(search_term),
+                        Product.description.ilike(search_term)
+                    )
+                )
         
         if search_params.category:
             query = query.filter(Product.category == search_params.category)
         
+        if search_params.categories:
+            query = query.filter(Product.category.in_(search_params.categories))
+        
         if search_params.min_price:
             query = query.filter(Product.selling_price >= search_params.min_price)
         
         if search_params.max_price:
             query = query.filter(Product.selling_price <= search_params.max_price)
         
-        # Get total count
-        total = query.count()
-        
-        # Sort by creation date (newest first) to show recently added products first
-        query = query.order_by(Product.created_at.desc())
+        if search_params.rating_min is not None:
+            query = query.filter(Product.customer_rating >= search_params.rating_min)
         
-        # Apply pagination
-        offset = (search_params.page - 1) * search_params.size
-        products = query.offset(offset).limit(search_params.size).all()
+        if search_params.in_stock is not None:
+            if search_params.in_stock:
+                query = query.filter(Product.stock_available > 0)
+            else:
+                query = query.filter(Product.stock_available <= 0)
         
-        return ProductListResponse(
-            products=products,
-            total=total,
-            page=search_params.page,
-            size=search_params.size
+        return query, ts_query
+    
+    @staticmethod
+    def search_probe(search_params: ProductSearchParams) -> Tuple[Optional[str], Optional[bool]]:
+        """(prefix tsquery, cached searchable flag) for the listing's search text"""
+        prefix_query = build_prefix_tsquery(search_params.search) if search_params.search else None
+        if prefix_query is None:
+            return None, True
+        return prefix_query, searchable_query_cache.get(prefix_query)
+    
+    @staticmethod
+    def _searchable(db: Session, search_params: ProductSearchParams) -> bool:
+        """Whether the search text keeps any lexeme after stopword removal"""
+        prefix_query, searchable = ProductService.search_probe(search_params)
+        if searchable is None:
+            searchable = bool(db.execute(TSQUERY_NODES_SQL, {"query": prefix_query}).scalar())
+            searchable_query_cache.set(prefix_query, searchable)
+        return searchable
+    
+    @staticmethod
+    def count_signature(search_params: ProductSearchParams) -> tuple:
+        """Cache key for a listing total: every filter, none of the paging"""
+        return (
+            search_params.search,
+            search_params.category,
+            tuple(sorted(search_params.categories)) if search_params.categories else None,
+            str(search_params.min_price) if search_params.min_price else None,
+            str(search_params.max_price) if search_params.max_price else None,
+            search_params.rating_min,
+            search_params.in_stock,
+        )
+    
+    @staticmethod
+    def listing_cache_key(search_params: ProductSearchParams) -> str:
+        """Response cache key: normalized filters plus paging"""
+        search = " ".join(search_params.search.lower().split()) if search_params.search else None
+        return product_response_cache.make_key(
+            "listing",
+            search or None,
+            ProductService.count_signature(search_params)[1:],
+            search_params.page if not search_params.cursor else None,
+            search_params.size,
+            search_params.cursor,
+            search_params.include_total,
         )
     
+    @staticmethod
+    def count_statement(filtered: Select) -> Select:
+        """Plain COUNT over the filtered rows, without wrapping the entity query in a subquery"""
+        return filtered.with_only_columns(func.count(Product.id)).order_by(None)
+    
+    @staticmethod
+    def estimate_result(estimate: Optional[int]) -> Optional[Tuple[int, bool]]:
+        """Use the planner's row estimate for unfiltered listings on large tables"""
+        if estimate is not None and estimate >= settings.PRODUCT_COUNT_ESTIMATE_THRESHOLD:
+            return int(estimate), True
+        return None
+    
+    @staticmethod
+    def _count_products(db: Session, filtered: Select, search_params: ProductSearchParams) -> Tuple[int, bool]:
+        """Return (total, is_estimate) for the filtered listing"""
+        signature = ProductService.count_signature(search_params)
+        cached = product_count_cache.get(signature)
+        if cached is not None:
+            return cached
+        
+        result = None
+        if all(value is None for value in signature):
+            result = ProductService.estimate_result(db.execute(ESTIMATE_ROWS_SQL).scalar())
+        
+        if result is None:
+            result = (db.execute(ProductService.count_statement(filtered)).scalar(), False)
+        
+        product_count_cache.set(signature, result)
+        return result
+    
     @staticmethod
     def get_product_by_id(db: Session, product_id: str) -> Optional[Product]:
         """Get product by UUID"""
@@ -73,18 +394,13 @@ class ProductService:
     def create_product(
         db: Session, 
         product_data: ProductCreate, 
-        current_user: User
+        current_user: CurrentUser
     ) -> Product:
         """Create a new product"""
-        # Auto-generate product_id
-        max_product_id = db.query(func.max(Product.product_id)).scalar() or 0
-        new_product_id = max_product_id + 1
-        
-        # Create new product
+        # product_id is allocated from products_product_id_seq on insert
         product_dict = product_data.dict()
         db_product = Product(
             **product_dict,
-            product_id=new_product_id,  # Auto-generated
             created_by=current_user.id,
             is_active=True
         )
@@ -92,6 +408,7 @@ class ProductService:
         db.add(db_product)
         db.commit()
         db.refresh(db_product)
+        invalidate_product_reads()
         return db_product
     
     @staticmethod
@@ -99,7 +416,7 @@ class ProductService:
         db: Session, 
         product_id: str, 
         product_data: ProductUpdate,
-        current_user: User
+        current_user: CurrentUser
     ) -> Optional[Product]:
         """Update an existing product"""
         product = ProductService.get_product_by_id(db, product_id)
@@ -117,10 +434,11 @@ class ProductService:
         
         db.commit()
         db.refresh(product)
+        invalidate_product_reads()
         return product
     
     @staticmethod
-    def delete_product(db: Session, product_id: str, current_user: User) -> bool:
+    def delete_product(db: Session, product_id: str, current_user: CurrentUser) -> bool:
         """Soft delete a product"""
         product = ProductService.get_product_by_id(db, product_id)
         
@@ -133,6 +451,7 @@ class ProductService:
         # Soft delete
         product.is_active = False
         db.commit()
+        invalidate_product_reads()
         return True
     
     @staticmethod
@@ -144,34 +463,77 @@ class ProductService:
         return [category[0] for category in categories]
     
     @staticmethod
-    def bulk_update_prices(
-        db: Session, 
-        product_ids: List[str], 
-        price_updates: dict,
-        current_user: User
-    ) -> List[Product]:
-        """Bulk update product prices"""
-        products = db.query(Product).filter(
-            and_(
-                Product.id.in_(product_ids),
-                Product.is_active == True
-            )
-        ).all()
+    def bulk_create_params(
+        request: BulkProductCreateRequest,
+        product_ids: Sequence[int],
+        current_user: CurrentUser
+    ) -> Tuple[dict, List[CreatedProduct]]:
+        """Array parameters for BULK_CREATE_SQL and the (id, product_id) pairs it will create"""
+        products = request.products
+        created = [
+            CreatedProduct(id=uuid.uuid4(), product_id=product_id)
+            for product_id in product_ids
+        ]
+        params = {
+            "created_by": str(current_user.id),
+            "ids": [str(item.id) for item in created],
+            "product_ids": [item.product_id for item in created],
+            "names": [p.name for p in products],
+            "descriptions": [p.description for p in products],
+            "cost_prices": [p.cost_price for p in products],
+            "selling_prices": [p.selling_price for p in products],
+            "categories": [p.category for p in products],
+            "stock_available": [p.stock_available for p in products],
+            "units_sold": [p.units_sold for p in products],
+            "customer_ratings": [p.customer_rating for p in products],
+            "demand_forecasts": [p.demand_forecast for p in products],
+            "optimized_prices": [p.optimized_price for p in products],
+        }
+        return params, created
+    
+    @staticmethod
+    def build_bulk_create_response(created: List[CreatedProduct]) -> BulkProductCreateResponse:
+        return BulkProductCreateResponse(
+            message=f"Created {len(created)} products",
+            created=len(created),
+            products=created
+        )
+    
+    @staticmethod
+    def bulk_update_batches(request: BulkPriceUpdateRequest) -> Tuple[List[BulkPriceUpdateItem], List[dict]]:
+        """Deduplicated update items and the array parameters for each UPDATE batch"""
+        # Deduplicate by id (last update wins) so each row is updated once
+        updates = {item.id: item for item in request.updates}
+        items = list(updates.values())
         
-        if not products:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail="No products found for update"
+        batches = []
+        for start in range(0, len(items), BULK_UPDATE_BATCH_SIZE):
+            batch = items[start:start + BULK_UPDATE_BATCH_SIZE]
+            batches.append({
+                "ids": [str(item.id) for item in batch],
+                "selling_prices": [item.selling_price for item in batch],
+                "cost_prices": [item.cost_price for item in batch],
+                "optimized_prices": [item.optimized_price for item in batch],
+            })
+        return items, batches
+    
+    @staticmethod
+    def build_bulk_update_response(
+        items: List[BulkPriceUpdateItem],
+        updated_ids: set
+    ) -> BulkPriceUpdateResponse:
+        """Per-row results for a bulk price update"""
+        results = [
+            BulkPriceUpdateResult(
+                id=item.id,
+                status="updated" if item.id in updated_ids else "not_found"
             )
-        
-        updated_products = []
-        for product in products:
-            if str(product.id) in price_updates:
-                update_data = price_updates[str(product.id)]
-                for field, value in update_data.items():
-                    if hasattr(product, field):
-                        setattr(product, field, value)
-                updated_products.append(product)
-        
-        db.commit()
-        return updated_products
+            for item in items
+        ]
+        return BulkPriceUpdateResponse(
+            message=f"Updated {len(updated_ids)} products",
+            requested=len(items),
+            updated=len(updated_ids),
+            not_found=len(items) - len(updated_ids),
+            results=results
+        )
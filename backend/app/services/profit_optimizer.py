@@ -0,0 +1,276 @@
+"""
+Constrained profit optimizer.
+
+Demand follows a constant-elasticity curve around the current price,
+q(p) = q0 * (p / p0) ** e, with q0 the engine's demand forecast and e the
+fitted (or category) elasticity. Profit (p - c) * q(p) is unimodal in p, so
+for each product the optimum under box constraints is the unconstrained
+optimum clipped into the box:
+
+* elastic products (e < -1): p* = c * e / (1 + e)   (Lerner markup)
+* inelastic products (e >= -1): profit grows with price, p* = upper bound
+
+Per-product constraints become bounds on p: minimum margin, maximum change
+per step, and inventory cover (demand must clear stock within
+``max_inventory_cover`` periods and not exceed it in fewer than
+``min_inventory_cover``).
+
+The portfolio-level revenue floor couples all products. It is handled with a
+Lagrange multiplier: maximizing profit + lam * revenue again has a closed
+form per product, p* = c * e / ((1 + lam) * (1 + e)), and lam is found by a
+bounded bisection over whole-catalog vector evaluations. A floor that even
+the largest multiplier cannot reach is reported as not met; the prices are
+then the most revenue the bounds allow.
+
+Category price ladders (allowed price points) are applied last by snapping
+each price to the better of its two neighbouring ladder points inside the
+product's bounds.
+"""
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Sequence
+import numpy as np
+
+PROFIT_ALGORITHM = "constrained-profit-v1"
+
+# Bisection on the revenue multiplier
+MAX_BISECTION_STEPS = 60
+MAX_MULTIPLIER = 1e6
+REVENUE_TOLERANCE = 1e-6
+
+# Which constraint ended up determining each price
+BINDING_NONE = 0
+BINDING_MIN_MARGIN = 1
+BINDING_MAX_DECREASE = 2
+BINDING_MAX_INCREASE = 3
+BINDING_INVENTORY_LOWER = 4
+BINDING_INVENTORY_UPPER = 5
+BINDING_LADDER = 6
+BINDING_NAMES = {
+    BINDING_NONE: "unconstrained",
+    BINDING_MIN_MARGIN: "min_margin",
+    BINDING_MAX_DECREASE: "max_decrease",
+    BINDING_MAX_INCREASE: "max_increase",
+    BINDING_INVENTORY_LOWER: "inventory_min_cover",
+    BINDING_INVENTORY_UPPER: "inventory_max_cover",
+    BINDING_LADDER: "price_ladder",
+}
+
+
+@dataclass
+class ProfitConstraints:
+    min_margin: float = 0.2                   # (p - c) / p floor
+    max_change: float = 0.1                   # |p / p0 - 1| per step
+    min_revenue_ratio: Optional[float] = None  # Portfolio revenue floor vs current revenue
+    max_inventory_cover: Optional[float] = None  # Periods of demand the stock may last at most
+    min_inventory_cover: Optional[float] = None  # ... and at least
+    price_ladders: Dict[str, List[float]] = field(default_factory=dict)
+
+
+@dataclass
+class ProfitSolution:
+    price: np.ndarray
+    demand: np.ndarray
+    lower: np.ndarray
+    upper: np.ndarray
+    binding: np.ndarray        # int8 BINDING_* per product
+    multiplier: float          # Revenue floor multiplier (0 when not binding)
+    revenue_floor_met: Optional[bool]  # None without a revenue floor
+    iterations: int            # Bisection steps used
+    conflicts: int             # Products whose bounds contradicted (min margin wins)
+    ladder_misses: int         # Products with no ladder point inside their bounds
+
+    def binding_counts(self) -> Dict[str, int]:
+        counts = np.bincount(self.binding, minlength=len(BINDING_NAMES))
+        return {BINDING_NAMES[code]: int(counts[code]) for code in BINDING_NAMES if counts[code]}
+
+
+def demand_at(price: np.ndarray, base_price: np.ndarray, base_demand: np.ndarray, elasticity: np.ndarray) -> np.ndarray:
+    return base_demand * np.power(price / base_price, elasticity)
+
+
+def price_bounds(
+    cost: np.ndarray,
+    price: np.ndarray,
+    demand: np.ndarray,
+    stock: np.ndarray,
+    elasticity: np.ndarray,
+    constraints: ProfitConstraints
+):
+    """Per-product [lower, upper] price bounds with the constraint that set each side"""
+    n = price.shape[0]
+    lower = cost / (1.0 - constraints.min_margin)
+    lower_reason = np.full(n, BINDING_MIN_MARGIN, dtype=np.int8)
+    upper = np.full(n, np.inf)
+    upper_reason = np.full(n, BINDING_NONE, dtype=np.int8)
+
+    def tighten_lower(bound, reason):
+        nonlocal lower, lower_reason
+        tighter = bound > lower
+        lower = np.where(tighter, bound, lower)
+        lower_reason = np.where(tighter, reason, lower_reason)
+
+    def tighten_upper(bound, reason):
+        nonlocal upper, upper_reason
+        tighter = bound < upper
+        upper = np.where(tighter, bound, upper)
+        upper_reason = np.where(tighter, reason, upper_reason)
+
+    tighten_lower(price * (1.0 - constraints.max_change), BINDING_MAX_DECREASE)
+    tighten_upper(price * (1.0 + constraints.max_change), BINDING_MAX_INCREASE)
+
+    # Demand is decreasing in price, so a demand floor caps the price and a
+    # demand ceiling floors it: q(p) = q0 (p/p0)^e  <=>  p = p0 (q/q0)^(1/e)
+    has_stock = (stock > 0) & (demand > 0) & (elasticity < 0)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        if constraints.max_inventory_cover:
+            required = stock / constraints.max_inventory_cover
+            bound = price * np.power(required / demand, 1.0 / elasticity)
+            tighten_upper(np.where(has_stock, bound, np.inf), BINDING_INVENTORY_UPPER)
+        if constraints.min_inventory_cover:
+            allowed = stock / constraints.min_inventory_cover
+            bound = price * np.power(allowed / demand, 1.0 / elasticity)
+            tighten_lower(np.where(has_stock, bound, 0.0), BINDING_INVENTORY_LOWER)
+
+    # Contradictory bounds: never price below the margin floor
+    conflicts = lower > upper
+    upper = np.where(conflicts, lower, upper)
+    return lower, upper, lower_reason, upper_reason, int(conflicts.sum())
+
+
+def _best_prices(cost: np.ndarray, elasticity: np.ndarray, multiplier: float, lower: np.ndarray, upper: np.ndarray) -> np.ndarray:
+    """argmax of (p - c) q(p) + multiplier * p q(p) within [lower, upper]"""
+    with np.errstate(divide="ignore", invalid="ignore"):
+        unconstrained = np.where(
+            elasticity < -1.0,
+            cost * elasticity / ((1.0 + multiplier) * (1.0 + elasticity)),
+            np.inf
+        )
+    return np.clip(unconstrained, lower, upper)
+
+
+def _snap_to_ladders(
+    price: np.ndarray,
+    lower: np.ndarray,
+    upper: np.ndarray,
+    cost: np.ndarray,
+    base_price: np.ndarray,
+    base_demand: np.ndarray,
+    elasticity: np.ndarray,
+    category_codes: np.ndarray,
+    categories: Sequence[str],
+    ladders: Dict[str, List[float]]
+):
+    snapped = price.copy()
+    on_ladder = np.zeros(price.shape[0], dtype=bool)
+    misses = 0
+    for code, name in enumerate(categories):
+        points = ladders.get(name)
+        if not points:
+            continue
+        ladder = np.unique(np.asarray(points, dtype=np.float64))
+        rows = np.nonzero(category_codes == code)[0]
+        if rows.size == 0:
+            continue
+
+        # Neighbouring ladder points of every price in the category
+        position = np.searchsorted(ladder, price[rows])
+        below = ladder[np.clip(position - 1, 0, ladder.size - 1)]
+        above = ladder[np.clip(position, 0, ladder.size - 1)]
+
+        best = np.full(rows.size, np.nan)
+        best_profit = np.full(rows.size, -np.inf)
+        for candidate in (below, above):
+            feasible = (candidate >= lower[rows] - 1e-9) & (candidate <= upper[rows] + 1e-9)
+            profit = (candidate - cost[rows]) * demand_at(
+                candidate, base_price[rows], base_demand[rows], elasticity[rows]
+            )
+            better = feasible & (profit > best_profit)
+            best = np.where(better, candidate, best)
+            best_profit = np.where(better, profit, best_profit)
+
+        found = ~np.isnan(best)
+        snapped[rows[found]] = best[found]
+        on_ladder[rows[found]] = True
+        misses += int((~found).sum())
+    return snapped, on_ladder, misses
+
+
+def solve(
+    cost: np.ndarray,
+    price: np.ndarray,
+    demand: np.ndarray,
+    stock: np.ndarray,
+    elasticity: np.ndarray,
+    category_codes: np.ndarray,
+    categories: Sequence[str],
+    constraints: ProfitConstraints
+) -> ProfitSolution:
+    """Maximize total profit over the catalog subject to ``constraints``"""
+    lower, upper, lower_reason, upper_reason, conflicts = price_bounds(
+        cost, price, demand, stock, elasticity, constraints
+    )
+
+    multiplier = 0.0
+    revenue_floor_met = None
+    iterations = 0
+    optimized = _best_prices(cost, elasticity, 0.0, lower, upper)
+
+    if constraints.min_revenue_ratio is not None and price.size:
+        target = constraints.min_revenue_ratio * float(np.sum(price * demand))
+
+        def revenue(candidate: np.ndarray) -> float:
+            return float(np.sum(candidate * demand_at(candidate, price, demand, elasticity)))
+
+        revenue_floor_met = True
+        if revenue(optimized) < target * (1 - REVENUE_TOLERANCE):
+            # Revenue is non-decreasing in the multiplier; bracket, then bisect
+            low, high = 0.0, 1.0
+            while revenue(_best_prices(cost, elasticity, high, lower, upper)) < target and high < MAX_MULTIPLIER:
+                high *= 4.0
+                iterations += 1
+            if revenue(_best_prices(cost, elasticity, high, lower, upper)) < target * (1 - REVENUE_TOLERANCE):
+                # Unreachable within the price bounds: keep the top bracket, no bisection
+                revenue_floor_met = False
+            else:
+                for _ in range(MAX_BISECTION_STEPS):
+                    iterations += 1
+                    middle = 0.5 * (low + high)
+                    if revenue(_best_prices(cost, elasticity, middle, lower, upper)) >= target:
+                        high = middle
+                    else:
+                        low = middle
+                    if high - low <= REVENUE_TOLERANCE * max(high, 1.0):
+                        break
+            multiplier = high
+            optimized = _best_prices(cost, elasticity, multiplier, lower, upper)
+
+    binding = np.where(
+        optimized <= lower + 1e-9, lower_reason,
+        np.where(optimized >= upper - 1e-9, upper_reason, BINDING_NONE)
+    ).astype(np.int8)
+
+    ladder_misses = 0
+    if constraints.price_ladders:
+        optimized, on_ladder, ladder_misses = _snap_to_ladders(
+            optimized, lower, upper, cost, price, demand, elasticity,
+            category_codes, categories, constraints.price_ladders
+        )
+        binding = np.where(on_ladder, BINDING_LADDER, binding).astype(np.int8)
+
+    # Whole cents inside the bounds: rounding to the nearest cent could cross
+    # the margin floor; bounds within one cent keep the margin floor
+    lower_cents = np.ceil(np.round(lower * 100, 6)) / 100
+    upper_cents = np.maximum(np.floor(np.round(upper * 100, 6)) / 100, lower_cents)
+    optimized = np.clip(np.round(optimized, 2), lower_cents, upper_cents)
+    return ProfitSolution(
+        price=optimized,
+        demand=demand_at(optimized, price, demand, elasticity),
+        lower=lower,
+        upper=upper,
+        binding=binding,
+        multiplier=multiplier,
+        revenue_floor_met=revenue_floor_met,
+        iterations=iterations,
+        conflicts=conflicts,
+        ladder_misses=ladder_misses,
+    )
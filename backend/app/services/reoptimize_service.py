@@ -0,0 +1,88 @@
+from sqlalchemy.orm import Session
+from sqlalchemy import text, func
+import time
+from app.models.pricing_dirty import PricingDirtyProduct
+from app.schemas.pricing import ReoptimizeRequest, ReoptimizeResponse
+from app.services.pricing_engine import optimize_prices
+from app.services.forecast_engine import project_demand, DEFAULT_FORECAST_YEARS
+from app.services.pricing_service import PricingService
+from app.services.forecast_service import ForecastService
+from app.services.factor_service import factor_registry
+from app.services.summary_service import SummaryService
+
+# Claim the oldest marks. SKIP LOCKED lets several workers drain the queue
+# side by side; a product changed while its batch runs is marked again once
+# the batch commits (its INSERT waits on the deleted row's lock).
+CLAIM_DIRTY_SQL = text("""
+DELETE FROM pricing_dirty_products
+WHERE product_id IN (
+    SELECT product_id FROM pricing_dirty_products
+    ORDER BY marked_at
+    LIMIT :batch_size
+    FOR UPDATE SKIP LOCKED
+)
+RETURNING product_id
+""")
+
+class ReoptimizeService:
+    """Incremental re-optimization of products whose pricing inputs changed"""
+
+    @staticmethod
+    def pending(db: Session) -> int:
+        return db.query(func.count(PricingDirtyProduct.product_id)).scalar() or 0
+
+    @staticmethod
+    def process_batch(db: Session, batch_size: int):
+        """Re-forecast and re-price one batch of dirty products; returns (claimed, catalog)"""
+        product_ids = db.execute(CLAIM_DIRTY_SQL, {"batch_size": batch_size}).scalars().all()
+        if not product_ids:
+            db.rollback()
+            return 0, None
+
+        # Inactive (or meanwhile deactivated) products just drop out of the queue
+        catalog = PricingService.load_catalog(db, product_ids=product_ids)
+        if not len(catalog):
+            db.commit()
+            return len(product_ids), catalog
+
+        factors = factor_registry.current()
+        ForecastService.replace_product_forecasts(
+            db, catalog, project_demand(catalog, DEFAULT_FORECAST_YEARS, factors)
+        )
+        # Commits the claim, forecasts and prices together
+        PricingService.write_results(db, catalog, optimize_prices(catalog, factors))
+        return len(product_ids), catalog
+
+    @staticmethod
+    def process(db: Session, request: ReoptimizeRequest) -> ReoptimizeResponse:
+        """Drain up to ``max_batches`` batches of the dirty queue"""
+        started = time.perf_counter()
+        claimed = 0
+        optimized = 0
+        batches = 0
+        categories = set()
+
+        while batches < request.max_batches:
+            count, catalog = ReoptimizeService.process_batch(db, request.batch_size)
+            if not count:
+                break
+            batches += 1
+            claimed += count
+            if catalog is not None and len(catalog):
+                optimized += len(catalog)
+                categories.update(catalog.categories)
+            if count < request.batch_size:
+                break
+
+        if claimed:
+            # Once per run rather than per batch: a refresh aggregates the whole catalog
+            SummaryService.refresh(db)
+
+        return ReoptimizeResponse(
+            products_claimed=claimed,
+            products_optimized=optimized,
+            batches=batches,
+            categories=sorted(categories),
+            pending=ReoptimizeService.pending(db),
+            duration_ms=round((time.perf_counter() - started) * 1000, 2)
+        )
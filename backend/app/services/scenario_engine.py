@@ -0,0 +1,140 @@
+"""
+What-if price scenarios.
+
+A scenario is an ordered list of price-change rules, each a percentage change
+for a category, a set of products, or (with neither) the whole catalog. A
+later rule overrides earlier ones for the products it matches. Demand moves
+along the profit optimizer's constant-elasticity curve, q = q0 * (p / p0) ** e,
+anchored at the engine's demand forecast. Evaluating a scenario is a handful
+of vector operations over a cached catalog snapshot; nothing is written.
+"""
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Dict, List, Optional, Sequence
+import numpy as np
+from app.services.factor_tables import FactorTables
+from app.services.pricing_engine import CatalogArrays, calculate_demand_forecast, catalog_elasticity
+
+MIN_PRICE = 0.01  # Deep cuts never reach zero (demand would diverge)
+
+
+@dataclass
+class PriceRule:
+    price_change: float                     # Percentage, e.g. 5 or -3
+    category: Optional[str] = None
+    product_ids: Optional[Sequence] = None
+
+
+@dataclass
+class CatalogSnapshot:
+    """Catalog arrays plus the baseline demand and elasticity scenarios are evaluated against"""
+    catalog: CatalogArrays
+    demand: np.ndarray                      # Baseline demand forecast (float64)
+    elasticity: np.ndarray
+    factor_version: int
+    loaded_at: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
+    _rows: Optional[Dict] = field(default=None, repr=False)
+    _codes: Optional[Dict[str, int]] = field(default=None, repr=False)
+    _baseline: Optional[Dict[str, np.ndarray]] = field(default=None, repr=False)
+
+    @classmethod
+    def build(cls, catalog: CatalogArrays, factors: FactorTables) -> "CatalogSnapshot":
+        return cls(
+            catalog=catalog,
+            demand=calculate_demand_forecast(catalog, factors).astype(np.float64),
+            elasticity=catalog_elasticity(catalog, factors),
+            factor_version=factors.version,
+        )
+
+    def __len__(self) -> int:
+        return len(self.catalog)
+
+    def baseline_totals(self) -> Dict[str, np.ndarray]:
+        """Units, revenue and profit at current prices per category code (computed once)"""
+        if self._baseline is None:
+            codes = self.catalog.category_codes
+            price = self.catalog.selling_price
+            size = len(self.catalog.categories)
+            self._baseline = {
+                "units": np.bincount(codes, weights=self.demand, minlength=size),
+                "revenue": np.bincount(codes, weights=price * self.demand, minlength=size),
+                "profit": np.bincount(codes, weights=(price - self.catalog.cost_price) * self.demand, minlength=size),
+            }
+        return self._baseline
+
+    def category_code(self, category: str) -> Optional[int]:
+        if self._codes is None:
+            self._codes = {name: code for code, name in enumerate(self.catalog.categories)}
+        return self._codes.get(category)
+
+    def product_rows(self, product_ids: Sequence) -> np.ndarray:
+        """Row positions of ``product_ids`` (ids outside the snapshot are skipped)"""
+        if self._rows is None:
+            # Built on first use only; most scenarios select by category
+            self._rows = {pid: row for row, pid in enumerate(self.catalog.ids.tolist())}
+        rows = [self._rows.get(pid) for pid in product_ids]
+        return np.asarray([row for row in rows if row is not None], dtype=np.int64)
+
+    def rule_rows(self, rule: PriceRule):
+        """Rows a rule applies to, as an index array, boolean mask or slice"""
+        if rule.category is not None:
+            code = self.category_code(rule.category)
+            if code is None:
+                return np.empty(0, dtype=np.int64)
+        if rule.product_ids is not None:
+            rows = self.product_rows(rule.product_ids)
+            if rule.category is not None:
+                rows = rows[self.catalog.category_codes[rows] == code]
+            return rows
+        if rule.category is not None:
+            return self.catalog.category_codes == code
+        return slice(None)
+
+
+@dataclass
+class ScenarioResult:
+    """Prices and demand of the products a scenario changes (``rows`` into the snapshot)"""
+    rows: np.ndarray
+    price: np.ndarray
+    demand: np.ndarray
+
+    def category_totals(self, snapshot: CatalogSnapshot) -> Dict[str, np.ndarray]:
+        """Baseline and scenario units, revenue and profit summed per category code"""
+        baseline = snapshot.baseline_totals()
+        codes = snapshot.catalog.category_codes[self.rows]
+        cost = snapshot.catalog.cost_price[self.rows]
+        current = snapshot.catalog.selling_price[self.rows]
+        demand = snapshot.demand[self.rows]
+        size = len(snapshot.catalog.categories)
+
+        def per_category(weights: Optional[np.ndarray] = None) -> np.ndarray:
+            return np.bincount(codes, weights=weights, minlength=size)
+
+        # Unchanged products contribute their baseline, so only the changed rows are summed
+        totals = {"products_affected": per_category()}
+        for name, delta in (
+            ("units", self.demand - demand),
+            ("revenue", self.price * self.demand - current * demand),
+            ("profit", (self.price - cost) * self.demand - (current - cost) * demand),
+        ):
+            totals[f"baseline_{name}"] = baseline[name]
+            totals[f"scenario_{name}"] = baseline[name] + per_category(delta)
+        return totals
+
+
+def evaluate_scenario(snapshot: CatalogSnapshot, rules: List[PriceRule]) -> ScenarioResult:
+    """Apply ``rules`` in order and project demand at the resulting prices"""
+    multiplier = np.ones(len(snapshot), dtype=np.float64)
+    affected = np.zeros(len(snapshot), dtype=bool)
+
+    for rule in rules:
+        rows = snapshot.rule_rows(rule)
+        multiplier[rows] = 1 + rule.price_change / 100
+        affected[rows] = True
+
+    rows = np.flatnonzero(affected)
+    current = snapshot.catalog.selling_price[rows]
+    price = np.maximum(np.round(current * multiplier[rows], 2), MIN_PRICE)
+    # The snapshot holds priced products only, so the ratio is always defined
+    demand = snapshot.demand[rows] * np.power(price / current, snapshot.elasticity[rows])
+    return ScenarioResult(rows=rows, price=price, demand=demand)
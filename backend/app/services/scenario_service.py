@@ -0,0 +1,154 @@
+import threading
+import time
+from datetime import datetime, timezone
+from typing import Optional
+import numpy as np
+from sqlalchemy.orm import Session
+from app.config import settings
+from app.schemas.pricing import (
+    ScenarioRequest, ScenarioResponse, ScenarioResultItem, ScenarioImpact, ScenarioProductItem
+)
+from app.services.factor_service import factor_registry
+from app.services.pricing_service import PricingService
+from app.services.scenario_engine import CatalogSnapshot, PriceRule, ScenarioResult, evaluate_scenario
+
+class CatalogSnapshotCache:
+    """
+    One in-memory catalog snapshot per process for what-if scenarios. It is
+    reloaded after ``ttl_seconds``, when the active factor version changes, or
+    on request; concurrent requests wait for a single reload.
+    """
+
+    def __init__(self, ttl_seconds: float):
+        self.ttl_seconds = ttl_seconds
+        self._snapshot: Optional[CatalogSnapshot] = None
+        self._expires_at = 0.0
+        self._lock = threading.Lock()
+
+    def get(self, db: Session, refresh: bool = False) -> CatalogSnapshot:
+        factors = factor_registry.current()
+        snapshot = self._snapshot
+        if not refresh and self._is_fresh(snapshot, factors.version):
+            return snapshot
+
+        requested_at = datetime.now(timezone.utc)
+        with self._lock:
+            # Another request may have reloaded while this one waited
+            snapshot = self._snapshot
+            if refresh and snapshot is not None and snapshot.loaded_at >= requested_at:
+                return snapshot
+            if refresh or not self._is_fresh(snapshot, factors.version):
+                # The demand curve is anchored at the current price, so it must be positive
+                catalog = PricingService.load_catalog(db, priced_only=True)
+                snapshot = CatalogSnapshot.build(catalog, factors)
+                self._snapshot = snapshot
+                self._expires_at = time.monotonic() + self.ttl_seconds
+            return snapshot
+
+    def _is_fresh(self, snapshot: Optional[CatalogSnapshot], factor_version: int) -> bool:
+        return (
+            snapshot is not None
+            and snapshot.factor_version == factor_version
+            and time.monotonic() < self._expires_at
+        )
+
+    def invalidate(self) -> None:
+        self._expires_at = 0.0
+
+catalog_snapshot_cache = CatalogSnapshotCache(ttl_seconds=settings.SCENARIO_SNAPSHOT_TTL_SECONDS)
+
+def _impact(category: Optional[str], products_affected: int, totals: dict, index=None) -> ScenarioImpact:
+    """Impact figures from ``category_totals`` arrays (one category, or summed when ``index`` is None)"""
+    def value(name: str) -> float:
+        values = totals[name]
+        return float(values.sum() if index is None else values[index])
+
+    baseline_revenue, scenario_revenue = value("baseline_revenue"), value("scenario_revenue")
+    baseline_profit, scenario_profit = value("baseline_profit"), value("scenario_profit")
+    return ScenarioImpact(
+        category=category,
+        products_affected=products_affected,
+        baseline_units=round(value("baseline_units"), 2),
+        scenario_units=round(value("scenario_units"), 2),
+        baseline_revenue=round(baseline_revenue, 2),
+        scenario_revenue=round(scenario_revenue, 2),
+        revenue_change=round(scenario_revenue - baseline_revenue, 2),
+        revenue_change_percentage=round((scenario_revenue / baseline_revenue - 1) * 100, 2) if baseline_revenue else 0.0,
+        baseline_profit=round(baseline_profit, 2),
+        scenario_profit=round(scenario_profit, 2),
+        profit_change=round(scenario_profit - baseline_profit, 2),
+        baseline_margin=round(baseline_profit / baseline_revenue * 100, 2) if baseline_revenue else 0.0,
+        scenario_margin=round(scenario_profit / scenario_revenue * 100, 2) if scenario_revenue else 0.0
+    )
+
+class ScenarioService:
+    """What-if price scenarios evaluated against the cached catalog snapshot (read-only)"""
+
+    @staticmethod
+    def run(db: Session, request: ScenarioRequest) -> ScenarioResponse:
+        started = time.perf_counter()
+        snapshot = catalog_snapshot_cache.get(db, request.refresh_snapshot)
+
+        results = []
+        for scenario in request.scenarios:
+            rules = [
+                PriceRule(price_change=rule.price_change, category=rule.category, product_ids=rule.product_ids)
+                for rule in scenario.rules
+            ]
+            result = evaluate_scenario(snapshot, rules)
+            results.append(ScenarioService._result_item(
+                snapshot, scenario.name, result, request.include_products, request.product_limit
+            ))
+
+        return ScenarioResponse(
+            snapshot_at=snapshot.loaded_at,
+            snapshot_products=len(snapshot),
+            factor_version=snapshot.factor_version,
+            duration_ms=round((time.perf_counter() - started) * 1000, 2),
+            scenarios=results
+        )
+
+    @staticmethod
+    def _result_item(
+        snapshot: CatalogSnapshot,
+        name: str,
+        result: ScenarioResult,
+        include_products: bool,
+        product_limit: int
+    ) -> ScenarioResultItem:
+        categories = snapshot.catalog.categories
+        totals = result.category_totals(snapshot)
+        affected = totals["products_affected"]
+
+        products = None
+        truncated = False
+        if include_products:
+            truncated = len(result.rows) > product_limit
+            catalog = snapshot.catalog
+            products = []
+            for position, i in enumerate(result.rows[:product_limit].tolist()):
+                current_price = float(catalog.selling_price[i])
+                baseline_demand = float(snapshot.demand[i])
+                price = float(result.price[position])
+                demand = float(result.demand[position])
+                products.append(ScenarioProductItem(
+                    id=catalog.ids[i],
+                    category=categories[catalog.category_codes[i]],
+                    current_price=current_price,
+                    scenario_price=price,
+                    baseline_demand=round(baseline_demand, 2),
+                    scenario_demand=round(demand, 2),
+                    elasticity=float(snapshot.elasticity[i]),
+                    revenue_change=round(price * demand - current_price * baseline_demand, 2)
+                ))
+
+        return ScenarioResultItem(
+            name=name,
+            totals=_impact(None, int(affected.sum()), totals),
+            categories=[
+                _impact(categories[code], int(affected[code]), totals, code)
+                for code in np.flatnonzero(affected).tolist()
+            ],
+            products=products,
+            products_truncated=truncated
+        )
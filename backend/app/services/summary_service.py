@@ -0,0 +1,70 @@
+from typing import List, Optional
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+from app.models.category_stats import MARGIN_BUCKET_EDGES, REFRESH_CATEGORY_STATS_SQL
+from app.schemas.pricing import CategoryStatsItem, MarginBucket, PricingSummaryResponse
+
+CATEGORY_STATS_SQL = text("""
+SELECT category, products, products_priced, stock_available, units_sold, sales_revenue,
+       current_revenue, optimized_revenue, price_change_sum, margin_products, margin_sum,
+       min_margin, max_margin, margin_histogram, refreshed_at
+FROM category_stats
+WHERE CAST(:category AS varchar) IS NULL OR category = :category
+ORDER BY category
+""")
+
+# (min, max) of each margin bucket, matching the histogram columns of the view
+MARGIN_BUCKETS = list(zip([None, *MARGIN_BUCKET_EDGES], [*MARGIN_BUCKET_EDGES, None]))
+
+def _percentage(part: float, whole: float) -> float:
+    return round(part / whole * 100, 2) if whole else 0.0
+
+def _stats_item(category: Optional[str], rows: List) -> CategoryStatsItem:
+    """Combine ``category_stats`` rows (one for a category, all of them for the totals)"""
+    current_revenue = float(sum(row.current_revenue for row in rows))
+    optimized_revenue = float(sum(row.optimized_revenue for row in rows))
+    products_priced = sum(row.products_priced for row in rows)
+    margin_products = sum(row.margin_products for row in rows)
+    min_margins = [row.min_margin for row in rows if row.min_margin is not None]
+    max_margins = [row.max_margin for row in rows if row.max_margin is not None]
+    histogram = [sum(counts) for counts in zip(*(row.margin_histogram for row in rows))] or [0] * len(MARGIN_BUCKETS)
+
+    return CategoryStatsItem(
+        category=category,
+        products=sum(row.products for row in rows),
+        products_priced=products_priced,
+        stock_available=sum(row.stock_available for row in rows),
+        units_sold=sum(row.units_sold for row in rows),
+        sales_revenue=round(float(sum(row.sales_revenue for row in rows)), 2),
+        total_current_revenue=round(current_revenue, 2),
+        total_optimized_revenue=round(optimized_revenue, 2),
+        total_revenue_increase=round(optimized_revenue - current_revenue, 2),
+        revenue_increase_percentage=_percentage(optimized_revenue - current_revenue, current_revenue),
+        average_price_change=round(float(sum(row.price_change_sum for row in rows)) / products_priced, 2) if products_priced else 0.0,
+        average_margin=round(float(sum(row.margin_sum for row in rows)) / margin_products, 2) if margin_products else 0.0,
+        min_margin=round(float(min(min_margins)), 2) if min_margins else None,
+        max_margin=round(float(max(max_margins)), 2) if max_margins else None,
+        margin_distribution=[
+            MarginBucket(min_margin=lower, max_margin=upper, products=count)
+            for (lower, upper), count in zip(MARGIN_BUCKETS, histogram)
+        ]
+    )
+
+class SummaryService:
+    """Dashboard summary read from the ``category_stats`` materialized view"""
+
+    @staticmethod
+    def get_summary(db: Session, category: Optional[str] = None) -> PricingSummaryResponse:
+        """Per-category figures and catalog totals (a few rows, not the catalog)"""
+        rows = db.execute(CATEGORY_STATS_SQL, {"category": category}).all()
+        return PricingSummaryResponse(
+            refreshed_at=min((row.refreshed_at for row in rows), default=None),
+            totals=_stats_item(None, rows),
+            categories=[_stats_item(row.category, [row]) for row in rows]
+        )
+
+    @staticmethod
+    def refresh(db: Session) -> None:
+        """Recompute ``category_stats``; readers keep the previous contents meanwhile"""
+        db.execute(text(REFRESH_CATEGORY_STATS_SQL))
+        db.commit()
@@ -1,10 +1,14 @@
-from .security import verify_password, get_password_hash, create_access_token, verify_token
+from .security import verify_password, get_password_hash, create_access_token, verify_token, decode_token
 from .helpers import get_current_timestamp
+from .pagination import encode_cursor, decode_cursor
 
 __all__ = [
     "verify_password", 
     "get_password_hash", 
     "create_access_token", 
     "verify_token",
-    "get_current_timestamp"
+    "decode_token",
+    "get_current_timestamp",
+    "encode_cursor",
+    "decode_cursor"
 ]
@@ -1,3 +1,4 @@
+import re
 from datetime import datetime
 from typing import Optional
 
@@ -18,3 +19,13 @@ def calculate_profit_margin(selling_price: float, cost_price: float) -> float:
 def calculate_profit_per_unit(selling_price: float, cost_price: float) -> float:
     """Calculate profit per unit"""
     return selling_price - cost_price
+
+def build_prefix_tsquery(search: str) -> Optional[str]:
+    """
+    Turn free text into a tsquery string that prefix-matches every word,
+    e.g. "wire head" -> "wire:* & head:*". Returns None if there are no words.
+    """
+    words = re.findall(r"\w+", search.lower())
+    if not words:
+        return None
+    return " & ".join(f"{word}:*" for word in words)
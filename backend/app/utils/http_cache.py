@@ -0,0 +1,47 @@
+import hashlib
+from typing import Optional
+from fastapi import Request, Response, status
+from app.config import settings
+
+def body_etag(body: str) -> str:
+    """Strong validator for an exact response body"""
+    return '"' + hashlib.sha1(body.encode("utf-8")).hexdigest() + '"'
+
+def version_etag(*parts) -> str:
+    """Weak validator derived from row versions (e.g. id and updated_at)"""
+    return 'W/"' + hashlib.sha1("|".join(str(part) for part in parts).encode("utf-8")).hexdigest() + '"'
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """If-None-Match uses weak comparison: W/ prefixes are ignored"""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    opaque = etag[2:] if etag.startswith("W/") else etag
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate.startswith("W/"):
+            candidate = candidate[2:]
+        if candidate == opaque:
+            return True
+    return False
+
+def cache_headers(etag: str) -> dict:
+    # Clients may keep the body but must revalidate it (cheaply, via 304) once max-age passes
+    return {
+        "ETag": etag,
+        "Cache-Control": f"public, max-age={settings.HTTP_CACHE_MAX_AGE}, must-revalidate",
+    }
+
+def not_modified(request: Request, etag: str) -> Optional[Response]:
+    """304 response when the client already holds this version, otherwise None"""
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=cache_headers(etag))
+    return None
+
+def conditional_json_response(request: Request, body: str, etag: Optional[str] = None) -> Response:
+    """Serve a serialized JSON body with validators, or 304 if the client's copy is current"""
+    etag = etag or body_etag(body)
+    return not_modified(request, etag) or Response(
+        content=body, media_type="application/json", headers=cache_headers(etag)
+    )
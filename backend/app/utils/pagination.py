@@ -0,0 +1,29 @@
+import base64
+import json
+import uuid
+from datetime import datetime
+from typing import Optional, Tuple
+
+def encode_cursor(created_at: datetime, product_id: uuid.UUID, rank: Optional[float] = None) -> str:
+    """Encode a (created_at, id) keyset position, led by the relevance rank on ranked searches, as an opaque cursor"""
+    position = [created_at.isoformat(), str(product_id)]
+    if rank is not None:
+        position.append(rank)
+    payload = json.dumps(position, separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+def decode_cursor(cursor: str) -> Optional[Tuple[datetime, uuid.UUID, Optional[float]]]:
+    """Decode a cursor produced by encode_cursor into (created_at, id, rank or None), or None if it is malformed"""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        position = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        created_at, product_id, *rest = position
+        rank = None
+        if rest:
+            (rank,) = rest
+            if isinstance(rank, bool) or not isinstance(rank, (int, float)):
+                return None
+            rank = float(rank)
+        return datetime.fromisoformat(created_at), uuid.UUID(product_id), rank
+    except (ValueError, TypeError):
+        return None
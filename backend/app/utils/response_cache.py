@@ -0,0 +1,105 @@
+import hashlib
+import json
+from abc import ABC, abstractmethod
+from typing import Optional
+from app.config import settings
+from app.utils.cache import TTLCache
+
+class ResponseCache(ABC):
+    """Serialized response cache; backends store JSON strings under a namespace"""
+
+    def __init__(self, namespace: str):
+        self.namespace = namespace
+
+    @staticmethod
+    def make_key(*parts) -> str:
+        """Stable key for JSON-serializable parts (e.g. normalized query parameters)"""
+        raw = json.dumps(parts, sort_keys=True, default=str, separators=(",", ":"))
+        return hashlib.sha1(raw.encode("utf-8")).hexdigest()
+
+    @abstractmethod
+    async def get(self, key: str) -> Optional[str]:
+        """Cached value for ``key``, or None"""
+
+    @abstractmethod
+    async def set(self, key: str, value: str) -> None:
+        """Store ``value`` under ``key``"""
+
+    async def clear(self) -> None:
+        self.clear_sync()
+
+    @abstractmethod
+    def clear_sync(self) -> None:
+        """Invalidate from sync code (threadpool handlers, batch jobs)"""
+
+class NullResponseCache(ResponseCache):
+    """Caching disabled"""
+
+    async def get(self, key: str) -> Optional[str]:
+        return None
+
+    async def set(self, key: str, value: str) -> None:
+        return None
+
+    def clear_sync(self) -> None:
+        return None
+
+class MemoryResponseCache(ResponseCache):
+    """Per-process LRU with TTL"""
+
+    def __init__(self, namespace: str, maxsize: int, ttl: float):
+        super().__init__(namespace)
+        self._cache = TTLCache(maxsize=maxsize, ttl=ttl)
+
+    async def get(self, key: str) -> Optional[str]:
+        return self._cache.get(key)
+
+    async def set(self, key: str, value: str) -> None:
+        self._cache.set(key, value)
+
+    def clear_sync(self) -> None:
+        self._cache.clear()
+
+class RedisResponseCache(ResponseCache):
+    """Shared cache on a Redis-compatible server (requires the optional ``redis`` package)"""
+
+    def __init__(self, namespace: str, url: str, ttl: int):
+        super().__init__(namespace)
+        try:
+            import redis
+            import redis.asyncio as redis_asyncio
+        except ImportError:
+            raise RuntimeError("RESPONSE_CACHE_BACKEND=redis requires the 'redis' package (pip install redis)")
+        self.ttl = ttl
+        self.prefix = f"response-cache:{namespace}:"
+        self._client = redis_asyncio.from_url(url)
+        self._sync_client = redis.from_url(url)
+
+    async def get(self, key: str) -> Optional[str]:
+        value = await self._client.get(self.prefix + key)
+        return value.decode("utf-8") if value is not None else None
+
+    async def set(self, key: str, value: str) -> None:
+        if self.ttl > 0:
+            await self._client.set(self.prefix + key, value, ex=self.ttl)
+
+    async def clear(self) -> None:
+        keys = [key async for key in self._client.scan_iter(match=self.prefix + "*", count=1000)]
+        if keys:
+            await self._client.unlink(*keys)
+
+    def clear_sync(self) -> None:
+        keys = list(self._sync_client.scan_iter(match=self.prefix + "*", count=1000))
+        if keys:
+            self._sync_client.unlink(*keys)
+
+def build_response_cache(namespace: str) -> ResponseCache:
+    """Create the cache configured by RESPONSE_CACHE_BACKEND (memory, redis or none)"""
+    backend = settings.RESPONSE_CACHE_BACKEND.lower()
+    if backend == "none" or settings.RESPONSE_CACHE_TTL <= 0:
+        return NullResponseCache(namespace)
+    if backend == "redis":
+        return RedisResponseCache(namespace, settings.REDIS_URL, settings.RESPONSE_CACHE_TTL)
+    if backend == "memory":
+        return MemoryResponseCache(namespace, settings.RESPONSE_CACHE_SIZE, settings.RESPONSE_CACHE_TTL)
+    raise ValueError(f"Unknown RESPONSE_CACHE_BACKEND: {settings.RESPONSE_CACHE_BACKEND}")
@@ -0,0 +1,61 @@
+from multiprocessing import shared_memory
+from typing import Dict, List, Tuple
+import numpy as np
+
+# (name, dtype, shape) of each array in a block
+ArrayLayout = List[Tuple[str, str, Tuple[int, ...]]]
+
+# Offsets are aligned so every view is suitably aligned for its dtype
+_ALIGNMENT = 64
+
+def _offsets(layout: ArrayLayout) -> Tuple[Dict[str, int], int]:
+    offsets = {}
+    size = 0
+    for name, dtype, shape in layout:
+        size = -(-size // _ALIGNMENT) * _ALIGNMENT
+        offsets[name] = size
+        size += int(np.prod(shape, dtype=np.int64)) * np.dtype(dtype).itemsize
+    return offsets, max(size, 1)
+
+class SharedArrays:
+    """
+    Named NumPy arrays packed into one shared memory block. The creating
+    process owns (and unlinks) the block; other processes attach to it with
+    the picklable ``spec`` and read or write the arrays in place.
+    """
+
+    def __init__(self, shm: shared_memory.SharedMemory, layout: ArrayLayout, owner: bool):
+        self._shm = shm
+        self.layout = layout
+        self.owner = owner
+        offsets, _ = _offsets(layout)
+        self._arrays = {
+            name: np.ndarray(shape, dtype=dtype, buffer=shm.buf, offset=offsets[name])
+            for name, dtype, shape in layout
+        }
+
+    @classmethod
+    def create(cls, layout: ArrayLayout) -> "SharedArrays":
+        _, size = _offsets(layout)
+        return cls(shared_memory.SharedMemory(create=True, size=size), layout, owner=True)
+
+    @classmethod
+    def attach(cls, spec: Tuple[str, ArrayLayout]) -> "SharedArrays":
+        # Pool workers share the owner's resource tracker (see EnginePool), so
+        # the block is tracked, and unlinked, exactly once
+        name, layout = spec
+        return cls(shared_memory.SharedMemory(name=name), layout, owner=False)
+
+    @property
+    def spec(self) -> Tuple[str, ArrayLayout]:
+        return self._shm.name, self.layout
+
+    def __getitem__(self, name: str) -> np.ndarray:
+        return self._arrays[name]
+
+    def close(self) -> None:
+        # Views must be dropped before the mapping can be closed
+        self._arrays = {}
+        self._shm.close()
+        if self.owner:
+            self._shm.unlink()
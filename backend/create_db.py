@@ -53,7 +53,7 @@ def create_tables():
         sys.path.append(os.path.dirname(os.path.abspath(__file__)))
         
         from app.database import engine, Base
-        from app.models import User, Product, DemandForecast, PricingOptimization
+        from app.models import User, Product, DemandForecast, PricingOptimization, PriceHistory, CategoryElasticity, PricingDirtyProduct, Job, PricingFactorVersion
         
         # Test connection to our database
         with engine.connect() as connection:
@@ -63,6 +63,9 @@ def create_tables():
         Base.metadata.create_all(bind=engine)
         print("✅ Database tables created successfully!")
         
+        # Tables already match the models, so mark all migrations as applied
+        stamp_migrations()
+        
         print("\n🎉 Database setup complete!")
         print("📊 Tables created:")
         print("   - users")
@@ -76,6 +79,15 @@ def create_tables():
         print(f"❌ Error creating tables: {e}")
         return False
 
+def stamp_migrations():
+    """Stamp the Alembic version table at head for a freshly created schema"""
+    from alembic.config import Config
+    from alembic import command
+    
+    alembic_cfg = Config(os.path.join(os.path.dirname(os.path.abspath(__file__)), "alembic.ini"))
+    command.stamp(alembic_cfg, "head")
+    print("✅ Migrations stamped at head!")
+
 if __name__ == "__main__":
     print("🚀 Setting up Price Optimization Database...")
     
@@ -4,72 +4,48 @@ Script to import product data from CSV into the database
 """
 import sys
 import os
-import csv
-from decimal import Decimal
+import argparse
 
 # Add the current directory to Python path
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
 from app.database import SessionLocal
 from app.models import Product
+from app.services.import_service import ImportService, DEFAULT_CHUNK_SIZE
 
-def import_products_from_csv(csv_file_path):
+def print_progress(summary):
+    """Print a progress line after each committed chunk"""
+    print(f"   ... {summary.rows_read:,} rows read, {summary.rows_loaded:,} loaded "
+          f"({summary.rows_per_second:,.0f} rows/sec)")
+
+def import_products_from_csv(csv_file_path, chunk_size=DEFAULT_CHUNK_SIZE, incremental=False):
     """Import products from CSV file"""
-    db = SessionLocal()
-    
     try:
-        # Clear existing products (for fresh import)
-        db.query(Product).delete()
-        db.commit()
-        print("🗑️  Cleared existing products")
-        
-        # Read and import CSV data
-        with open(csv_file_path, 'r', encoding='utf-8') as file:
-            csv_reader = csv.DictReader(file)
-            products_added = 0
-            
-            for row in csv_reader:
-                # Skip empty rows
-                if not row.get('product_id'):
-                    continue
-                    
-                # Create product object
-                product = Product(
-                    product_id=int(row['product_id']),
-                    name=row['name'],
-                    description=row['description'],
-                    cost_price=Decimal(row['cost_price']),
-                    selling_price=Decimal(row['selling_price']),
-                    category=row['category'],
-                    stock_available=int(row['stock_available']),
-                    units_sold=int(row['units_sold']),
-                    customer_rating=Decimal(row['customer_rating']) if row['customer_rating'] else None,
-                    demand_forecast=int(row['demand_forecast']) if row['demand_forecast'] else None,
-                    optimized_price=Decimal(row['optimized_price']) if row['optimized_price'] else None,
-                    is_active=True
-                )
-                
-                db.add(product)
-                products_added += 1
-                print(f"➕ Added: {product.name} (ID: {product.product_id})")
-            
-            # Commit all changes
-            db.commit()
-            print(f"\n✅ Successfully imported {products_added} products!")
-            
-            # Display summary
-            print("\n📊 Import Summary:")
-            categories = db.query(Product.category).distinct().all()
-            for (category,) in categories:
-                count = db.query(Product).filter(Product.category == category).count()
-                print(f"   - {category}: {count} products")
-                
+        summary = ImportService.import_csv(
+            csv_file_path, chunk_size, progress=print_progress, incremental=incremental
+        )
     except Exception as e:
-        db.rollback()
         print(f"❌ Error importing data: {e}")
         return False
-    finally:
-        db.close()
+    
+    print(f"\n✅ Successfully imported {summary.rows_loaded:,} products "
+          f"({summary.inserted:,} new, {summary.updated:,} updated) "
+          f"in {summary.duration_seconds:.2f}s - {summary.rows_per_second:,.0f} rows/sec")
+    if summary.incremental:
+        print(f"   Unchanged (skipped): {summary.unchanged:,}")
+        print(f"   Soft-deleted (missing from feed): {summary.deactivated:,}")
+    
+    if summary.rows_rejected:
+        print(f"\n⚠️  Rejected {summary.rows_rejected:,} invalid rows:")
+        for error in summary.errors:
+            print(f"   - line {error.line}: {error.error}")
+    
+    # Display summary
+    print("\n📊 Import Summary:")
+    if not summary.summary_refreshed:
+        print("   ⚠️  category_stats could not be refreshed; counts may be stale")
+    for category, count in summary.categories.items():
+        print(f"   - {category}: {count} products")
     
     return True
 
@@ -96,8 +72,13 @@ def verify_import():
 if __name__ == "__main__":
     print("📥 Importing Product Data from CSV...")
     
-    # Path to CSV file (adjust if needed)
-    csv_path = "../product_data.csv"
+    parser = argparse.ArgumentParser(description="Import product data from CSV")
+    parser.add_argument("csv_path", nargs="?", default="../product_data.csv", help="Path to the CSV file")
+    parser.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE, help="Rows per transaction")
+    parser.add_argument("--incremental", action="store_true",
+                        help="Only write changed rows and soft-delete products missing from the feed")
+    args = parser.parse_args()
+    csv_path = args.csv_path
     
     if not os.path.exists(csv_path):
         print(f"❌ CSV file not found: {csv_path}")
@@ -105,7 +86,7 @@ if __name__ == "__main__":
         sys.exit(1)
     
     # Import data
-    if import_products_from_csv(csv_path):
+    if import_products_from_csv(csv_path, args.chunk_size, args.incremental):
         verify_import()
         print("\n🎉 Data import completed successfully!")
     else:
@@ -0,0 +1,54 @@
+#!/usr/bin/env python3
+"""
+Script to run the nightly price elasticity fit (e.g. from cron)
+"""
+import sys
+import os
+import argparse
+
+# Add the current directory to Python path
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from app.database import SessionLocal
+from app.schemas.pricing import ElasticityFitRequest
+from app.services.elasticity_service import ElasticityService
+
+def positive_float(value):
+    number = float(value)
+    if not 0 < number < float("inf"):
+        raise argparse.ArgumentTypeError("must be a finite number greater than 0")
+    return number
+
+def run_elasticity(lookback_days, shrinkage, category=None):
+    """Fit and store per-product and per-category price elasticities"""
+    db = SessionLocal()
+
+    try:
+        result = ElasticityService.fit(db, ElasticityFitRequest(
+            category=category, lookback_days=lookback_days, shrinkage=shrinkage
+        ))
+        print(f"✅ Fitted elasticities for {result.products_updated} products "
+              f"({result.products_fitted} with their own price variation) "
+              f"in {result.duration_ms / 1000:.2f}s")
+        for item in result.categories:
+            print(f"   {item.category}: {item.elasticity:+.3f} (prior {item.prior_elasticity:+.3f}, "
+                  f"{item.products_fitted} products, {item.observations} observations)")
+        return True
+    except Exception as e:
+        db.rollback()
+        print(f"❌ Error fitting elasticities: {e}")
+        return False
+    finally:
+        db.close()
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Fit price elasticities from price history")
+    parser.add_argument("--lookback-days", type=int, default=365, help="Price history window")
+    parser.add_argument("--shrinkage", type=positive_float, default=0.1, help="Prior strength toward the category")
+    parser.add_argument("--category", default=None, help="Only fit this category")
+    args = parser.parse_args()
+
+    print("📉 Fitting price elasticities...")
+
+    if not run_elasticity(args.lookback_days, args.shrinkage, args.category):
+        sys.exit(1)
@@ -0,0 +1,43 @@
+#!/usr/bin/env python3
+"""
+Script to run the batch demand forecast job (e.g. from cron)
+"""
+import sys
+import os
+import argparse
+
+# Add the current directory to Python path
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from app.database import SessionLocal
+from app.schemas.forecast import ForecastRunRequest
+from app.services.forecast_service import ForecastService
+
+def run_forecasts(years, category=None):
+    """Compute and store yearly demand forecasts"""
+    db = SessionLocal()
+
+    try:
+        result = ForecastService.run_batch_forecast(
+            db, ForecastRunRequest(years=years, category=category)
+        )
+        print(f"✅ Forecasted {result.products_forecasted} products "
+              f"({result.forecasts_written} rows, {result.shards} shards) in {result.duration_ms / 1000:.2f}s")
+        return True
+    except Exception as e:
+        db.rollback()
+        print(f"❌ Error running forecasts: {e}")
+        return False
+    finally:
+        db.close()
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Run the batch demand forecast job")
+    parser.add_argument("--years", type=int, default=5, help="Number of yearly projections")
+    parser.add_argument("--category", default=None, help="Only forecast this category")
+    args = parser.parse_args()
+
+    print("📈 Running batch demand forecast...")
+
+    if not run_forecasts(args.years, args.category):
+        sys.exit(1)
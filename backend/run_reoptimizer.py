@@ -0,0 +1,53 @@
+#!/usr/bin/env python3
+"""
+Script to run the incremental re-optimization worker (products whose pricing inputs changed)
+"""
+import sys
+import os
+import time
+import argparse
+
+# Add the current directory to Python path
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from app.config import settings
+from app.database import SessionLocal
+from app.services.reoptimize_service import ReoptimizeService
+from app.services.summary_service import SummaryService
+
+def drain(batch_size):
+    """Process dirty batches until the queue is empty; returns products claimed"""
+    db = SessionLocal()
+    claimed = 0
+
+    try:
+        while True:
+            count, catalog = ReoptimizeService.process_batch(db, batch_size)
+            if not count:
+                if claimed:
+                    SummaryService.refresh(db)
+                return claimed
+            claimed += count
+            optimized = len(catalog) if catalog is not None else 0
+            print(f"✅ Re-optimized {optimized} of {count} changed products")
+    except Exception as e:
+        db.rollback()
+        print(f"❌ Error re-optimizing products: {e}")
+        return claimed
+    finally:
+        db.close()
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Re-optimize products whose pricing inputs changed")
+    parser.add_argument("--batch-size", type=int, default=settings.REOPTIMIZE_BATCH_SIZE, help="Dirty products per transaction")
+    parser.add_argument("--interval", type=int, default=settings.REOPTIMIZE_INTERVAL_SECONDS, help="Seconds to sleep when the queue is empty")
+    parser.add_argument("--once", action="store_true", help="Drain the queue once and exit")
+    args = parser.parse_args()
+
+    print("🔁 Running incremental re-optimization worker...")
+
+    while True:
+        drain(args.batch_size)
+        if args.once:
+            break
+        time.sleep(args.interval)
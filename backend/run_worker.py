@@ -0,0 +1,32 @@
+#!/usr/bin/env python3
+"""
+Script to run the background job worker (start one or more next to the API)
+"""
+import sys
+import os
+import signal
+import logging
+import argparse
+
+# Add the current directory to Python path
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from app.config import settings
+from app.services.job_worker import JobWorker
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Run queued pricing, forecast, import and export jobs")
+    parser.add_argument("--poll-interval", type=float, default=settings.JOB_POLL_INTERVAL_SECONDS, help="Seconds to sleep when no job is queued")
+    parser.add_argument("--once", action="store_true", help="Run the queued jobs and exit")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(message)s")
+    worker = JobWorker()
+
+    # SIGTERM / Ctrl+C: finish the current job, then exit
+    signal.signal(signal.SIGTERM, lambda *_: worker.stop())
+    signal.signal(signal.SIGINT, lambda *_: worker.stop())
+
+    print(f"⚙️  Job worker {worker.worker_id} started...")
+    processed = worker.run(args.poll_interval, once=args.once)
+    print(f"✅ Worker stopped after {processed} jobs")
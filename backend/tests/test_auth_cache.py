@@ -0,0 +1,63 @@
+import asyncio
+import uuid
+
+import pytest
+from pydantic import ValidationError
+
+from app.dependencies import _user_from_claims
+from app.models.user import User
+from app.services.async_auth_service import AsyncAuthService
+from app.services.auth_service import AuthService, user_cache
+from app.utils.security import decode_token
+
+
+@pytest.fixture
+def db_user():
+    user_cache.clear()
+    yield User(
+        id=uuid.uuid4(), email="ana@example.com", password_hash="x",
+        first_name="Ana", last_name="Lee", is_active=True, is_verified=False
+    )
+    user_cache.clear()
+
+
+def test_cache_holds_immutable_snapshots(db_user, monkeypatch):
+    lookups = []
+
+    async def get_user_by_email(db, email):
+        lookups.append(email)
+        return db_user
+
+    monkeypatch.setattr(AsyncAuthService, "get_user_by_email", get_user_by_email)
+    first = asyncio.run(AsyncAuthService.get_cached_user(None, db_user.email, str(db_user.id)))
+    second = asyncio.run(AsyncAuthService.get_cached_user(None, db_user.email, str(db_user.id)))
+
+    assert lookups == [db_user.email]
+    assert second is first
+    assert not isinstance(first, User)
+    assert (first.id, first.email, first.first_name, first.is_active) == (
+        db_user.id, db_user.email, "Ana", True
+    )
+    with pytest.raises(ValidationError):
+        first.is_active = False
+
+
+def test_cached_user_with_other_id_is_reloaded(db_user, monkeypatch):
+    async def get_user_by_email(db, email):
+        return db_user
+
+    monkeypatch.setattr(AsyncAuthService, "get_user_by_email", get_user_by_email)
+    asyncio.run(AsyncAuthService.get_cached_user(None, db_user.email))
+    db_user.id = uuid.uuid4()  # Account re-created under the same email
+    user = asyncio.run(AsyncAuthService.get_cached_user(None, db_user.email, str(db_user.id)))
+    assert user.id == db_user.id
+
+
+def test_token_claims_carry_identity_only(db_user):
+    payload = decode_token(AuthService.issue_token(db_user).access_token)
+    assert payload["sub"] == db_user.email
+    assert payload["uid"] == str(db_user.id)
+    assert "act" not in payload
+
+    user = _user_from_claims(payload)
+    assert (user.id, user.email, user.is_active) == (db_user.id, db_user.email, True)
@@ -0,0 +1,51 @@
+import uuid
+from decimal import Decimal
+
+from app.schemas.product import BulkPriceUpdateRequest, BulkProductCreateRequest
+from app.schemas.user import CurrentUser
+from app.services.product_service import BULK_UPDATE_BATCH_SIZE, ProductService
+
+USER = CurrentUser(id=uuid.uuid4(), email="ana@example.com")
+
+
+def _product(name):
+    return {"name": name, "cost_price": "5.00", "selling_price": "9.99", "category": "Books", "stock_available": 3}
+
+
+def test_bulk_create_params_align_allocated_ids_with_products():
+    request = BulkProductCreateRequest(products=[_product("A"), _product("B")])
+    params, created = ProductService.bulk_create_params(request, [41, 42], USER)
+
+    assert [item.product_id for item in created] == [41, 42]
+    assert params["ids"] == [str(item.id) for item in created]
+    assert params["names"] == ["A", "B"]
+    assert params["selling_prices"] == [Decimal("9.99")] * 2
+    assert params["created_by"] == str(USER.id)
+    assert ProductService.build_bulk_create_response(created).created == 2
+
+
+def test_bulk_update_deduplicates_and_batches():
+    first, second = uuid.uuid4(), uuid.uuid4()
+    updates = [
+        {"id": str(first), "selling_price": "10"},
+        {"id": str(second), "cost_price": "4"},
+        {"id": str(first), "selling_price": "12"},
+    ]
+    items, batches = ProductService.bulk_update_batches(BulkPriceUpdateRequest(updates=updates))
+
+    assert [item.id for item in items] == [first, second]
+    assert batches == [{
+        "ids": [str(first), str(second)],
+        "selling_prices": [Decimal("12"), None],
+        "cost_prices": [None, Decimal("4")],
+        "optimized_prices": [None, None],
+    }]
+
+    response = ProductService.build_bulk_update_response(items, {first})
+    assert (response.requested, response.updated, response.not_found) == (2, 1, 1)
+
+
+def test_bulk_update_splits_large_requests():
+    updates = [{"id": str(uuid.uuid4()), "selling_price": "1"} for _ in range(BULK_UPDATE_BATCH_SIZE + 1)]
+    _, batches = ProductService.bulk_update_batches(BulkPriceUpdateRequest(updates=updates))
+    assert [len(batch["ids"]) for batch in batches] == [BULK_UPDATE_BATCH_SIZE, 1]
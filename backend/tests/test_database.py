@@ -0,0 +1,20 @@
+from app import database
+from app.config import settings
+
+
+def test_batch_and_request_engines_get_their_own_timeouts(monkeypatch):
+    monkeypatch.setattr(settings, "DB_PGBOUNCER", False)
+    monkeypatch.setattr(settings, "DB_STATEMENT_TIMEOUT_MS", 30000)
+    monkeypatch.setattr(settings, "JOB_STATEMENT_TIMEOUT_MS", 0)
+    assert database._sync_connect_args() == {}
+    assert database._async_connect_args() == {"server_settings": {"statement_timeout": "30000"}}
+
+    monkeypatch.setattr(settings, "JOB_STATEMENT_TIMEOUT_MS", 600000)
+    assert database._sync_connect_args() == {"options": "-c statement_timeout=600000"}
+
+
+def test_pgbouncer_sends_no_startup_options(monkeypatch):
+    monkeypatch.setattr(settings, "DB_PGBOUNCER", True)
+    monkeypatch.setattr(settings, "JOB_STATEMENT_TIMEOUT_MS", 600000)
+    assert database._sync_connect_args() == {}
+    assert "server_settings" not in database._async_connect_args()
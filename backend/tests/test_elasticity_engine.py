@@ -0,0 +1,71 @@
+import numpy as np
+import pytest
+from pydantic import ValidationError
+
+from app.schemas.pricing import ElasticityFitRequest
+from app.services.elasticity_engine import (
+    MAX_ELASTICITY, MIN_ELASTICITY, ElasticityStats, fit_elasticities,
+)
+from app.services.factor_tables import builtin_factor_tables
+
+
+def _stats(rows):
+    return ElasticityStats.from_rows(rows)
+
+
+def _regression_sums(prices, rates):
+    x = np.log(prices)
+    y = np.log(rates)
+    return len(x), float(((x - x.mean()) ** 2).sum()), float(((x - x.mean()) * (y - y.mean())).sum())
+
+
+def test_recovers_slope_with_weak_shrinkage():
+    prices = np.array([8.0, 9.0, 10.0, 11.0, 12.0])
+    rows = [("a", "Electronics", *_regression_sums(prices, 500 * prices ** -2.0))]
+    result = fit_elasticities(_stats(rows), shrinkage=1e-6)
+    assert result.product_elasticity[0] == pytest.approx(-2.0, abs=1e-3)
+    assert result.products_fitted == 1
+
+
+def test_products_without_history_get_their_category():
+    prices = np.array([8.0, 10.0, 12.0])
+    rows = [
+        ("a", "Electronics", *_regression_sums(prices, 500 * prices ** -2.0)),
+        ("b", "Electronics", None, None, None),
+    ]
+    result = fit_elasticities(_stats(rows))
+    assert result.product_elasticity[1] == result.category_elasticity[0]
+    assert result.category_products_fitted.tolist() == [1]
+
+
+def test_category_without_history_keeps_prior_at_zero_shrinkage():
+    rows = [("a", "Electronics", None, None, None), ("b", "Books", 1, 0.0, 0.0)]
+    stats = _stats(rows)
+    result = fit_elasticities(stats, shrinkage=0.0)
+    prior = builtin_factor_tables().compile(stats.categories).demand_elasticity
+
+    assert np.isfinite(result.product_elasticity).all()
+    assert np.isfinite(result.category_elasticity).all()
+    np.testing.assert_allclose(result.category_elasticity, np.clip(np.round(prior, 3), MIN_ELASTICITY, MAX_ELASTICITY))
+
+
+def test_slopes_are_clamped():
+    prices = np.array([9.0, 10.0, 11.0])
+    rows = [
+        ("a", "Electronics", *_regression_sums(prices, 500 * prices ** -40.0)),
+        ("b", "Electronics", *_regression_sums(prices, 500 * prices ** 3.0)),
+    ]
+    result = fit_elasticities(_stats(rows), shrinkage=1e-6)
+    assert result.product_elasticity.tolist() == [MIN_ELASTICITY, MAX_ELASTICITY]
+
+
+def test_empty_catalog():
+    result = fit_elasticities(_stats([]))
+    assert result.product_elasticity.shape == (0,)
+    assert result.products_fitted == 0
+
+
+@pytest.mark.parametrize("shrinkage", [0, -1, float("nan"), float("inf")])
+def test_request_rejects_non_positive_shrinkage(shrinkage):
+    with pytest.raises(ValidationError):
+        ElasticityFitRequest(shrinkage=shrinkage)
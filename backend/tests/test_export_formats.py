@@ -0,0 +1,52 @@
+import asyncio
+import csv
+import datetime
+import io
+import uuid
+from decimal import Decimal
+
+import orjson
+import pytest
+
+from app.services.export_service import EXPORT_FIELDS, ExportService
+
+ROW = (
+    uuid.UUID("00000000-0000-0000-0000-000000000001"), 1001, "Espresso Machine", "Appliances",
+    Decimal("120.00"), Decimal("199.99"), Decimal("189.99"), 40, 310, Decimal("4.50"), 280,
+    Decimal("275.00"), Decimal("189.99"), datetime.date(2025, 1, 1), "yearly",
+    datetime.datetime(2025, 1, 2, 3, 4, 5, tzinfo=datetime.timezone.utc),
+)
+
+
+def _export(export_format, batches):
+    async def source():
+        for rows in batches:
+            yield rows
+
+    async def collect():
+        return b"".join([chunk async for chunk in ExportService._format(export_format, source())])
+
+    return asyncio.run(collect())
+
+
+def test_csv_has_header_and_rows():
+    lines = list(csv.reader(io.StringIO(_export("csv", [[ROW], [ROW]]).decode("utf-8"))))
+    assert lines[0] == EXPORT_FIELDS
+    assert len(lines) == 3
+    assert lines[1][2] == "Espresso Machine"
+
+
+def test_ndjson_has_one_object_per_row():
+    lines = _export("ndjson", [[ROW, ROW]]).splitlines()
+    assert len(lines) == 2
+    record = orjson.loads(lines[0])
+    assert record["product_id"] == 1001
+    assert record["updated_at"] == "2025-01-02T03:04:05Z"
+
+
+def test_parquet_round_trip():
+    pq = pytest.importorskip("pyarrow.parquet")
+    table = pq.read_table(io.BytesIO(_export("parquet", [[ROW], [ROW]])))
+    assert table.num_rows == 2
+    assert table.column_names == EXPORT_FIELDS
+    assert table.column("selling_price").to_pylist() == [Decimal("199.99")] * 2
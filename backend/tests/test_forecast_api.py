@@ -0,0 +1,11 @@
+from fastapi.testclient import TestClient
+
+from app.main import app
+
+client = TestClient(app)
+
+
+def test_malformed_product_ids_are_rejected_before_the_database():
+    assert client.get("/api/v1/forecasts/not-a-uuid").status_code == 422
+    response = client.get("/api/v1/forecasts/", params={"product_ids": ["5f0c1a52-8d3e-4c1b-9a57-0b2f5a1d9e11", "x"]})
+    assert response.status_code == 422
@@ -0,0 +1,47 @@
+import uuid
+
+import numpy as np
+
+from app.services.forecast_engine import (
+    ANNUAL_MARKET_TREND, DEFAULT_GROWTH_RATES, GROWTH_RATES, INFLATION_RATE, MIN_YEARLY_DEMAND, project_demand,
+)
+from app.services.pricing_engine import CatalogArrays, calculate_demand_forecast
+
+
+def _catalog():
+    return CatalogArrays.from_rows([
+        (uuid.uuid4(), 50.0, 120.0, 2000, 15000, "Electronics"),
+        (uuid.uuid4(), 10.0, 12.5, 0, 0, "Books"),
+        (uuid.uuid4(), 20.0, 45.0, 300, 600, "Unlisted"),
+    ])
+
+
+def test_yearly_projection_matches_frontend_expectation():
+    catalog = _catalog()
+    result = project_demand(catalog, years=5)
+    base = calculate_demand_forecast(catalog)
+
+    assert result.demand.shape == (3, 5)
+    for row, category in enumerate(["Electronics", "Books", "Unlisted"]):
+        rates = GROWTH_RATES.get(category, DEFAULT_GROWTH_RATES)
+        expected = [
+            max(MIN_YEARLY_DEMAND, np.floor(base[row] * rates[year] * (1 + year * ANNUAL_MARKET_TREND) + 0.5))
+            for year in range(5)
+        ]
+        assert result.demand[row].tolist() == expected
+        assert result.price[row].tolist() == [
+            round(catalog.selling_price[row] * (1 + INFLATION_RATE) ** year, 2) for year in range(5)
+        ]
+    assert result.base_demand.tolist() == base.tolist()
+
+
+def test_horizon_past_curve_repeats_last_rate():
+    result = project_demand(_catalog(), years=8)
+    electronics = GROWTH_RATES["Electronics"]
+    assert result.growth_rate[0].tolist() == electronics + [electronics[-1]] * 3
+    assert result.years == 8
+
+
+def test_projection_is_deterministic():
+    catalog = _catalog()
+    assert np.array_equal(project_demand(catalog).demand, project_demand(catalog).demand)
@@ -0,0 +1,97 @@
+from decimal import Decimal
+
+import pytest
+
+from app.schemas.imports import ImportSummary
+from app.services.import_service import ImportService, validate_row
+
+VALID_ROW = {
+    "product_id": "1001",
+    "name": "Espresso Machine",
+    "description": "15 bar pump",
+    "cost_price": "120.00",
+    "selling_price": "199.99",
+    "category": "Appliances",
+    "stock_available": "40",
+    "units_sold": "310",
+    "customer_rating": "4.5",
+    "demand_forecast": "280",
+    "optimized_price": "",
+}
+
+
+def _row(**overrides):
+    return {**VALID_ROW, **overrides}
+
+
+def test_valid_row_in_staging_order():
+    values = validate_row(2, VALID_ROW)
+    assert values[:3] == (2, 1001, "Espresso Machine")
+    assert values[4:6] == (Decimal("120.00"), Decimal("199.99"))
+    assert values[11] is None
+    assert len(values[12]) == 32
+
+
+def test_content_hash_ignores_line_number():
+    assert validate_row(2, VALID_ROW)[-1] == validate_row(9, VALID_ROW)[-1]
+    assert validate_row(2, VALID_ROW)[-1] != validate_row(2, _row(units_sold="311"))[-1]
+
+
+@pytest.mark.parametrize("value", ["NaN", "sNaN", "-NaN", "Infinity", "-inf", "abc"])
+def test_rejects_non_finite_prices(value):
+    with pytest.raises(ValueError, match="not a number"):
+        validate_row(2, _row(selling_price=value))
+
+
+@pytest.mark.parametrize("value", ["1e12", "100000000", "99999999.995"])
+def test_rejects_prices_outside_numeric_10_2(value):
+    with pytest.raises(ValueError, match="must be <"):
+        validate_row(2, _row(cost_price=value))
+
+
+def test_rounds_prices_to_cents():
+    values = validate_row(2, _row(selling_price="99999999.994", optimized_price="10.125"))
+    assert values[5] == Decimal("99999999.99")
+    assert values[11] == Decimal("10.13")
+
+
+def test_rejects_price_that_rounds_to_zero():
+    with pytest.raises(ValueError, match="positive"):
+        validate_row(2, _row(cost_price="0.001"))
+
+
+@pytest.mark.parametrize("value", ["NaN", "5.01", "10"])
+def test_rejects_invalid_ratings(value):
+    with pytest.raises(ValueError):
+        validate_row(2, _row(customer_rating=value))
+
+
+@pytest.mark.parametrize("field", ["product_id", "stock_available", "units_sold", "demand_forecast"])
+def test_rejects_ints_above_int4(field):
+    with pytest.raises(ValueError, match="2147483647"):
+        validate_row(2, _row(**{field: "2147483648"}))
+
+
+def test_rejects_negative_and_malformed_ints():
+    with pytest.raises(ValueError):
+        validate_row(2, _row(stock_available="-1"))
+    with pytest.raises(ValueError):
+        validate_row(2, _row(units_sold="1.5"))
+
+
+def test_validate_chunk_reports_bad_rows_instead_of_raising():
+    chunk = [
+        (2, VALID_ROW),
+        (3, _row(product_id="1002", selling_price="NaN")),
+        (4, _row(product_id="1003", cost_price="Infinity")),
+        (5, _row(product_id="9999999999", name="")),
+    ]
+    summary = ImportSummary()
+    valid_rows, rejected_ids = ImportService._validate_chunk(chunk, summary)
+
+    assert [row[0] for row in valid_rows] == [2]
+    assert summary.rows_read == 4
+    assert summary.rows_rejected == 3
+    assert [error.line for error in summary.errors] == [3, 4, 5]
+    # Out-of-range ids cannot be marked as seen in the integer seen table
+    assert rejected_ids == [1002, 1003]
@@ -0,0 +1,52 @@
+import os
+import time
+
+from app.config import settings
+from app.services.job_service import JobService
+
+
+class _ActiveJobs:
+    """Stands in for the session: returns the (id, file_name) rows of queued/running jobs"""
+
+    def __init__(self, rows):
+        self.rows = rows
+
+    def execute(self, statement):
+        return iter(self.rows)
+
+    def commit(self):
+        pass
+
+
+def _touch(directory, name, age_seconds):
+    path = directory / name
+    path.write_text("x")
+    mtime = time.time() - age_seconds
+    os.utime(path, (mtime, mtime))
+    return path
+
+
+def test_purge_files_keeps_recent_and_active_files(tmp_path, monkeypatch):
+    monkeypatch.setattr(settings, "JOB_FILES_DIR", str(tmp_path))
+    expired_export = _touch(tmp_path, "1b4e28ba-0000-0000-0000-000000000001.csv", 7200)
+    orphaned_upload = _touch(tmp_path, "orphan.csv", 7200)
+    recent_export = _touch(tmp_path, "1b4e28ba-0000-0000-0000-000000000002.parquet", 60)
+    queued_upload = _touch(tmp_path, "queued.csv", 7200)
+    running_export = _touch(tmp_path, "1b4e28ba-0000-0000-0000-000000000003.ndjson", 7200)
+
+    db = _ActiveJobs([
+        ("9a000000-0000-0000-0000-000000000001", "queued.csv"),
+        ("1b4e28ba-0000-0000-0000-000000000003", None),
+    ])
+    assert JobService.purge_files(db, retention_seconds=3600) == 2
+
+    assert not expired_export.exists()
+    assert not orphaned_upload.exists()
+    assert recent_export.exists()
+    assert queued_upload.exists()
+    assert running_export.exists()
+
+
+def test_purge_files_without_directory(tmp_path, monkeypatch):
+    monkeypatch.setattr(settings, "JOB_FILES_DIR", str(tmp_path / "missing"))
+    assert JobService.purge_files(_ActiveJobs([]), retention_seconds=0) == 0
@@ -0,0 +1,76 @@
+import uuid
+
+import numpy as np
+import pytest
+
+from app.services.forecast_engine import project_demand
+from app.services.parallel_engine import (
+    PRICING_OUTPUTS, SHARD_BY_CATEGORY, SHARD_BY_RANGE, EnginePool, category_shards, range_shards,
+)
+from app.services.pricing_engine import CatalogArrays, optimize_prices
+
+CATEGORIES = ["Electronics", "Books", "Apparel", "Furniture", "Unlisted"]
+
+
+def _catalog(size=3000, seed=11):
+    rng = np.random.default_rng(seed)
+    return CatalogArrays.from_rows([
+        (
+            uuid.uuid4(),
+            float(cost),
+            float(round(cost * rng.uniform(0.9, 3.5), 2)),
+            int(rng.integers(0, 3000)),
+            int(rng.integers(0, 20000)),
+            CATEGORIES[int(rng.integers(0, len(CATEGORIES)))],
+            None if rng.random() < 0.5 else float(rng.uniform(-3, -0.2)),
+        )
+        for cost in np.round(rng.uniform(1, 500, size), 2)
+    ])
+
+
+def test_category_shards_keep_categories_whole_and_cover_every_row():
+    codes = np.array([0, 2, 1, 0, 0, 2, 3, 0, 1, 3], dtype=np.int32)
+    order, bounds = category_shards(codes, 4, 3)
+
+    assert sorted(order.tolist()) == list(range(codes.size))
+    assert bounds[0] == 0 and bounds[-1] == codes.size
+    shard_categories = [set(codes[order[start:end]].tolist()) for start, end in zip(bounds[:-1], bounds[1:])]
+    for code in range(4):
+        assert sum(code in shard for shard in shard_categories) == 1
+
+
+def test_range_shards_drop_empty_ranges():
+    order, bounds = range_shards(2, 4)
+    assert order.tolist() == [0, 1]
+    assert bounds == [0, 1, 2]
+
+
+@pytest.mark.parametrize("shard_by", [SHARD_BY_CATEGORY, SHARD_BY_RANGE])
+def test_parallel_run_equals_serial(shard_by):
+    catalog = _catalog()
+    pool = EnginePool(workers=2, min_rows=1, shard_by=shard_by)
+    try:
+        pricing, shards = pool.optimize_prices(catalog)
+        forecast, _ = pool.project_demand(catalog, years=6)
+    finally:
+        pool.shutdown()
+
+    assert shards == 2
+    serial = optimize_prices(catalog)
+    for name, _ in PRICING_OUTPUTS:
+        assert np.array_equal(getattr(pricing, name), getattr(serial, name)), name
+    serial_forecast = project_demand(catalog, 6)
+    for name in ("base_demand", "demand", "price", "growth_rate"):
+        assert np.array_equal(getattr(forecast, name), getattr(serial_forecast, name)), name
+
+
+def test_small_catalogs_run_in_process():
+    pool = EnginePool(workers=4, min_rows=10_000, shard_by=SHARD_BY_RANGE)
+    _, shards = pool.optimize_prices(_catalog(size=50))
+    assert shards == 1
+    assert pool._executor is None
+
+
+def test_unknown_shard_strategy_is_rejected():
+    with pytest.raises(ValueError):
+        EnginePool(workers=2, min_rows=1, shard_by="hash")
@@ -0,0 +1,101 @@
+import math
+import uuid
+
+import numpy as np
+
+from app.services.pricing_engine import (
+    CATEGORY_DEMAND_MULTIPLIER, COMPETITIVE_ADJUSTMENT, DEMAND_ELASTICITY, MARKET_CONDITION,
+    CatalogArrays, calculate_demand_forecast, optimize_prices,
+)
+
+CATEGORIES = list(COMPETITIVE_ADJUSTMENT) + ["Unlisted"]
+
+
+def _catalog(size=500, seed=7, elasticity=None):
+    rng = np.random.default_rng(seed)
+    cost = np.round(rng.uniform(1, 200, size), 2)
+    rows = [
+        (
+            uuid.uuid4(),
+            float(cost[i]),
+            float(np.round(cost[i] * rng.uniform(0.8, 4.0), 2)),
+            int(rng.choice([0, 10, 60, 300, 800, 5000])),
+            int(rng.choice([0, 5, 150, 700, 3000, 20000])),
+            CATEGORIES[i % len(CATEGORIES)],
+        ) + (() if elasticity is None else (elasticity[i],))
+        for i in range(size)
+    ]
+    return rows, CatalogArrays.from_rows(rows)
+
+
+# Row-at-a-time transcription of frontend/src/services/{demandForecast,pricingOptimization}Service.js
+
+def _js_demand_forecast(cost, price, stock, sold, category):
+    margin = (price - cost) / cost
+    price_impact = 1.3 if margin < 0.5 else 1.1 if margin < 1.0 else 0.9 if margin < 2.0 else 0.7
+    stock_influence = 1.2 if stock > 1000 else 1.1 if stock > 500 else 1.0 if stock > 100 else 0.9 if stock > 50 else 0.7
+    momentum = 1.4 if sold > 10000 else 1.2 if sold > 1000 else 1.1 if sold > 500 else 1.0 if sold > 100 else 0.8
+    demand = math.floor(1000 * CATEGORY_DEMAND_MULTIPLIER.get(category, 1.0) * price_impact * stock_influence * momentum + 0.5)
+    return max(100, demand)
+
+
+def _js_optimized_price(cost, price, stock, sold, category, elasticity=None):
+    demand = _js_demand_forecast(cost, price, stock, sold, category)
+    if elasticity is None:
+        elasticity = DEMAND_ELASTICITY.get(category, -1.0)
+    if sold == 0:
+        inventory = 0.9
+    else:
+        turnover = stock / sold
+        inventory = 0.9 if turnover > 10 else 0.95 if turnover > 5 else 1.0 if turnover > 2 else 1.05 if turnover > 1 else 1.1
+    margin = (price - cost) / cost
+    profitability = 1.15 if margin < 0.3 else 1.08 if margin < 0.5 else 1.02 if margin < 1.0 else 1.0 if margin < 2.0 else 0.95
+    demand_factor = min(demand / 1000, 2.0)
+    sensitivity = abs(elasticity)
+    if sensitivity > 1.4:
+        adjustment = 0.98 + demand_factor * 0.02
+    elif sensitivity > 1.0:
+        adjustment = 0.97 + demand_factor * 0.05
+    else:
+        adjustment = 0.95 + demand_factor * 0.08
+    optimized = (
+        price * COMPETITIVE_ADJUSTMENT.get(category, 1.0) * MARKET_CONDITION.get(category, 1.0)
+        * inventory * profitability * adjustment
+    )
+    return round(max(optimized, cost * 1.2), 2)
+
+
+def test_demand_forecast_matches_frontend():
+    rows, catalog = _catalog()
+    expected = [_js_demand_forecast(*row[1:6]) for row in rows]
+    assert calculate_demand_forecast(catalog).tolist() == expected
+
+
+def test_optimized_prices_match_frontend():
+    rows, catalog = _catalog()
+    result = optimize_prices(catalog)
+    expected = [_js_optimized_price(*row[1:6]) for row in rows]
+    assert result.optimized_price.tolist() == expected
+    assert np.all(result.optimized_price >= np.round(catalog.cost_price * 1.2, 2))
+
+
+def test_fitted_elasticity_overrides_category():
+    fitted = [-0.5 if i % 2 else None for i in range(200)]
+    rows, catalog = _catalog(size=200, elasticity=fitted)
+    result = optimize_prices(catalog)
+
+    expected_elasticity = [e if e is not None else DEMAND_ELASTICITY.get(row[5], -1.0) for row, e in zip(rows, fitted)]
+    assert result.demand_elasticity.tolist() == expected_elasticity
+    expected = [_js_optimized_price(*row[1:6], elasticity=e) for row, e in zip(rows, expected_elasticity)]
+    assert result.optimized_price.tolist() == expected
+
+
+def test_empty_catalog():
+    result = optimize_prices(CatalogArrays.from_rows([]))
+    assert result.optimized_price.shape == (0,)
+
+
+def test_zero_cost_does_not_divide():
+    catalog = CatalogArrays.from_rows([(uuid.uuid4(), 0.0, 10.0, 5, 5, "Books")])
+    result = optimize_prices(catalog)
+    assert np.isfinite(result.optimized_price).all()
@@ -0,0 +1,55 @@
+import uuid
+from decimal import Decimal
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy.exc import OperationalError
+
+from app.database import SessionLocal, engine
+from app.main import app
+from app.models.pricing import PricingOptimization
+from app.models.product import Product
+from app.schemas.pricing import ProfitOptimizeRequest
+from app.services.pricing_service import PricingService
+
+
+@pytest.fixture
+def db():
+    try:
+        with engine.connect():
+            pass
+    except OperationalError:
+        pytest.skip("PostgreSQL is not reachable (set DATABASE_URL)")
+    session = SessionLocal()
+    try:
+        yield session
+    finally:
+        session.close()
+
+
+def test_applied_profit_run_changes_product_etag(db):
+    category = f"etag-{uuid.uuid4().hex[:8]}"
+    product = Product(
+        name="ETag probe", cost_price=Decimal("5.00"), selling_price=Decimal("10.00"),
+        category=category, stock_available=100, units_sold=500, is_active=True
+    )
+    db.add(product)
+    db.commit()
+    try:
+        with TestClient(app) as client:
+            url = f"/api/v1/products/{product.id}"
+            first = client.get(url)
+            etag = first.headers["ETag"]
+            assert client.get(url, headers={"If-None-Match": etag}).status_code == 304
+
+            PricingService.optimize_profit(db, ProfitOptimizeRequest(category=category, apply=True))
+
+            second = client.get(url, headers={"If-None-Match": etag})
+            assert second.status_code == 200
+            assert second.headers["ETag"] != etag
+            assert second.json()["optimized_price"] != first.json()["optimized_price"]
+    finally:
+        db.rollback()
+        db.query(PricingOptimization).filter(PricingOptimization.product_id == product.id).delete()
+        db.query(Product).filter(Product.category == category).delete()
+        db.commit()
@@ -0,0 +1,72 @@
+import uuid
+from datetime import datetime, timezone
+
+import pytest
+from fastapi import HTTPException
+from sqlalchemy.dialects import postgresql
+
+from app.schemas.product import ProductSearchParams
+from app.services.product_service import ProductService
+from app.utils.helpers import build_prefix_tsquery
+from app.utils.pagination import decode_cursor, encode_cursor
+
+CREATED_AT = datetime(2024, 3, 1, 12, 30, tzinfo=timezone.utc)
+PRODUCT_ID = uuid.UUID("5f0c1a52-8d3e-4c1b-9a57-0b2f5a1d9e11")
+
+
+def _sql(statement):
+    return str(statement.compile(dialect=postgresql.dialect()))
+
+
+def test_prefix_tsquery_prefix_matches_every_word():
+    assert build_prefix_tsquery("Wire  Head-phones") == "wire:* & head:* & phones:*"
+    assert build_prefix_tsquery("it's") == "it:* & s:*"
+
+
+def test_prefix_tsquery_without_words_is_none():
+    assert build_prefix_tsquery("  -- !! ") is None
+    assert build_prefix_tsquery("") is None
+
+
+def test_cursor_round_trip():
+    assert decode_cursor(encode_cursor(CREATED_AT, PRODUCT_ID)) == (CREATED_AT, PRODUCT_ID, None)
+    assert decode_cursor(encode_cursor(CREATED_AT, PRODUCT_ID, 0.10000000149011612)) == (
+        CREATED_AT, PRODUCT_ID, 0.10000000149011612
+    )
+
+
+@pytest.mark.parametrize("cursor", ["", "not-a-cursor", encode_cursor(CREATED_AT, PRODUCT_ID)[:-4], "WzEsMiwzLDRd"])
+def test_malformed_cursor_decodes_to_none(cursor):
+    assert decode_cursor(cursor) is None
+
+
+def test_ranked_search_is_keyset_paged_by_rank():
+    params = ProductSearchParams(search="wire", cursor=encode_cursor(CREATED_AT, PRODUCT_ID, 0.5))
+    _, query, ranked = ProductService.build_listing_query(params)
+
+    sql = _sql(query)
+    assert ranked
+    assert "(ts_rank_cd(products.search_vector, to_tsquery('english'::regconfig" in sql
+    assert "products.created_at, products.id) < (" in sql
+    assert "OFFSET" not in sql
+
+
+def test_cursor_must_match_ranking():
+    ranked_cursor = encode_cursor(CREATED_AT, PRODUCT_ID, 0.5)
+    plain_cursor = encode_cursor(CREATED_AT, PRODUCT_ID)
+    for params in (
+        ProductSearchParams(cursor=ranked_cursor),
+        ProductSearchParams(search="wire", cursor=plain_cursor),
+    ):
+        with pytest.raises(HTTPException) as error:
+            ProductService.build_listing_query(params)
+        assert error.value.status_code == 400
+
+
+def test_stopword_only_search_lists_unfiltered():
+    params = ProductSearchParams(search="the", cursor=encode_cursor(CREATED_AT, PRODUCT_ID))
+    filtered, query, ranked = ProductService.build_listing_query(params, searchable=False)
+
+    assert not ranked
+    assert "to_tsquery" not in _sql(query)
+    assert "ILIKE" not in _sql(filtered)
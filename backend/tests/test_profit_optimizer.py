@@ -0,0 +1,77 @@
+import numpy as np
+import pytest
+
+from app.services.profit_optimizer import (
+    BINDING_LADDER, ProfitConstraints, demand_at, solve,
+)
+
+
+def _catalog(n=200, seed=7):
+    rng = np.random.default_rng(seed)
+    cost = np.round(rng.uniform(5, 200, n), 2)
+    price = np.round(cost * rng.uniform(1.05, 2.0, n), 2)
+    demand = rng.uniform(10, 500, n)
+    stock = rng.uniform(0, 2000, n)
+    elasticity = rng.uniform(-3.5, -0.5, n)
+    codes = rng.integers(0, 3, n).astype(np.int32)
+    return cost, price, demand, stock, elasticity, codes, ["Books", "Electronics", "Toys"]
+
+
+def _solve(constraints, catalog=None):
+    cost, price, demand, stock, elasticity, codes, categories = catalog or _catalog()
+    return solve(cost, price, demand, stock, elasticity, codes, categories, constraints)
+
+
+def test_prices_respect_margin_floor_and_step_after_rounding():
+    cost, price, *_ = catalog = _catalog()
+    constraints = ProfitConstraints(min_margin=0.2, max_change=0.1)
+    solution = _solve(constraints, catalog)
+
+    assert np.array_equal(solution.price, np.round(solution.price, 2))
+    conflicts = solution.lower > price * (1 + constraints.max_change)
+    margin = (solution.price - cost) / solution.price
+    assert margin.min() >= 0.2 - 1e-12
+    assert (solution.price[~conflicts] <= price[~conflicts] * 1.1 + 1e-9).all()
+    assert (solution.price >= price * 0.9 - 1e-9).all()
+
+
+def test_elastic_unconstrained_product_gets_lerner_price():
+    catalog = (
+        np.array([10.0]), np.array([15.0]), np.array([100.0]), np.array([0.0]),
+        np.array([-3.0]), np.zeros(1, dtype=np.int32), ["Books"]
+    )
+    solution = _solve(ProfitConstraints(min_margin=0.0, max_change=1.0), catalog)
+    assert solution.price[0] == pytest.approx(15.0)  # c * e / (1 + e)
+    assert solution.revenue_floor_met is None
+
+
+def test_reachable_revenue_floor_is_met():
+    cost, price, demand, _, elasticity, *_ = catalog = _catalog()
+
+    def revenue(prices):
+        return np.sum(prices * demand_at(prices, price, demand, elasticity))
+
+    # A floor just above what the profit optimum earns makes the multiplier bind
+    ratio = 1.02 * revenue(_solve(ProfitConstraints(), catalog).price) / np.sum(price * demand)
+    solution = _solve(ProfitConstraints(min_revenue_ratio=ratio), catalog)
+
+    assert solution.revenue_floor_met is True
+    assert solution.multiplier > 0
+    assert revenue(solution.price) >= ratio * np.sum(price * demand) * (1 - 1e-3)
+
+
+def test_unreachable_revenue_floor_is_reported():
+    solution = _solve(ProfitConstraints(min_revenue_ratio=5.0))
+    assert solution.revenue_floor_met is False
+
+
+def test_prices_snap_to_ladder_points():
+    cost, price, *_ = catalog = _catalog()
+    ladder = [round(x + 0.99, 2) for x in range(0, 500)]
+    solution = _solve(ProfitConstraints(price_ladders={"Books": ladder}), catalog)
+
+    books = catalog[5] == 0
+    snapped = solution.binding == BINDING_LADDER
+    assert snapped[books].sum() + solution.ladder_misses == books.sum()
+    assert np.isin(solution.price[snapped], ladder).all()
+    assert not snapped[~books].any()
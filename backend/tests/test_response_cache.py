@@ -0,0 +1,41 @@
+import asyncio
+
+import pytest
+
+from app.utils.response_cache import MemoryResponseCache, NullResponseCache, ResponseCache
+
+
+def test_incomplete_backend_fails_at_instantiation():
+    class GetOnlyCache(ResponseCache):
+        async def get(self, key):
+            return None
+
+    with pytest.raises(TypeError):
+        GetOnlyCache("products")
+
+
+def test_memory_cache_round_trip_and_clear():
+    cache = MemoryResponseCache("products", maxsize=8, ttl=60)
+    key = ResponseCache.make_key("list", {"page": 1, "size": 10})
+
+    async def scenario():
+        await cache.set(key, '{"items": []}')
+        hit = await cache.get(key)
+        await cache.clear()
+        return hit, await cache.get(key)
+
+    assert asyncio.run(scenario()) == ('{"items": []}', None)
+
+
+def test_make_key_ignores_dict_order():
+    assert ResponseCache.make_key({"a": 1, "b": 2}) == ResponseCache.make_key({"b": 2, "a": 1})
+
+
+def test_null_cache_never_hits():
+    cache = NullResponseCache("products")
+
+    async def scenario():
+        await cache.set("k", "v")
+        return await cache.get("k")
+
+    assert asyncio.run(scenario()) is None
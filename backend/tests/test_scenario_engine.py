@@ -0,0 +1,67 @@
+import uuid
+
+import numpy as np
+import pytest
+
+from app.services.factor_tables import builtin_factor_tables
+from app.services.pricing_engine import CatalogArrays
+from app.services.scenario_engine import MIN_PRICE, CatalogSnapshot, PriceRule, evaluate_scenario
+
+IDS = [uuid.uuid4() for _ in range(4)]
+
+
+def _snapshot():
+    catalog = CatalogArrays.from_rows([
+        (IDS[0], 5.0, 10.0, 100, 500, "Books", None),
+        (IDS[1], 20.0, 40.0, 100, 500, "Electronics", None),
+        (IDS[2], 30.0, 60.0, 100, 500, "Electronics", None),
+        (IDS[3], 2.0, 4.0, 100, 500, "Apparel", -2.0),
+    ])
+    return CatalogSnapshot.build(catalog, builtin_factor_tables())
+
+
+def test_later_rules_override_earlier_ones():
+    snapshot = _snapshot()
+    result = evaluate_scenario(snapshot, [
+        PriceRule(price_change=10),
+        PriceRule(price_change=-20, category="Electronics"),
+        PriceRule(price_change=5, product_ids=[IDS[2]]),
+    ])
+
+    assert result.rows.tolist() == [0, 1, 2, 3]
+    assert result.price.tolist() == [11.0, 32.0, 63.0, 4.4]
+
+
+def test_demand_follows_constant_elasticity_curve():
+    snapshot = _snapshot()
+    result = evaluate_scenario(snapshot, [PriceRule(price_change=10, product_ids=[IDS[3]])])
+
+    assert result.rows.tolist() == [3]
+    assert snapshot.elasticity[3] == -2.0
+    assert result.demand[0] == pytest.approx(snapshot.demand[3] * 1.1 ** -2.0)
+
+
+def test_rules_matching_nothing_change_nothing():
+    snapshot = _snapshot()
+    result = evaluate_scenario(snapshot, [
+        PriceRule(price_change=10, category="Unlisted"),
+        PriceRule(price_change=10, product_ids=[uuid.uuid4()]),
+        PriceRule(price_change=10, category="Books", product_ids=[IDS[1]]),
+    ])
+    assert result.rows.size == 0
+
+    totals = result.category_totals(snapshot)
+    for name in ("units", "revenue", "profit"):
+        assert np.array_equal(totals[f"scenario_{name}"], totals[f"baseline_{name}"])
+
+
+def test_category_totals_only_move_affected_categories():
+    snapshot = _snapshot()
+    result = evaluate_scenario(snapshot, [PriceRule(price_change=-100, category="Books")])
+    totals = result.category_totals(snapshot)
+    books = snapshot.category_code("Books")
+
+    assert result.price.tolist() == [MIN_PRICE]
+    assert totals["products_affected"].tolist() == [1 if code == books else 0 for code in range(3)]
+    changed = totals["scenario_revenue"] != totals["baseline_revenue"]
+    assert changed.tolist() == [code == books for code in range(3)]
@@ -352,7 +352,7 @@ const ProductTable = ({ onAddProductFromNavbar, shouldOpenCreateModal, searchTer
                 )}
                 {showOptimizedPrice && (
                   <td className="optimized-price-column">
-                    $ {PricingOptimizationService.calculateOptimizedPrice(product)}
+                    $ {product.optimized_price ?? PricingOptimizationService.calculateOptimizedPrice(product)}
                   </td>
                 )}
                 {showActions && (
@@ -130,7 +130,7 @@ class ProductService {
   // Bulk update product prices
   static async bulkUpdatePrices(updates) {
     try {
-      const response = await fetch(`${API_BASE_URL}/products/bulk-update-prices`, {
+      const response = await fetch(`${API_BASE_URL}/products/bulk/update-prices`, {
         method: 'POST',
         headers: this.getAuthHeaders(),
         body: JSON.stringify({ updates }),